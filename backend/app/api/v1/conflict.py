@@ -15,6 +15,7 @@ from app.schemas.conflict import (
     ConflictStatus,
 )
 from app.services.conflict_service import conflict_service
+from app.schemas.common import ModelResponse
 
 router = APIRouter(prefix="/conflicts", tags=["策略冲突检测"])
 
@@ -60,10 +61,12 @@ async def get_pending_conflicts(
         strategy_id=strategy_id,
         status=ConflictStatus.PENDING,
     )
-    return ConflictListResponse(
-        total=len(conflicts),
-        pending_count=pending_count,
-        conflicts=conflicts,
+    return ModelResponse(
+        ConflictListResponse.model_construct(
+            total=len(conflicts),
+            pending_count=pending_count,
+            conflicts=conflicts,
+        )
     )
 
 
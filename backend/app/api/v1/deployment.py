@@ -18,6 +18,7 @@ from typing import Optional
 
 from fastapi import APIRouter, Query, HTTPException
 
+from app.schemas.common import ModelResponse
 from app.schemas.deployment import (
     Deployment, DeploymentCreate, DeploymentUpdate,
     DeploymentListResponse, DeploymentStatus, DeploymentEnvironment,
@@ -64,7 +65,10 @@ async def list_deployments(
     )
     # 分页
     paginated = deployments[skip:skip + limit]
-    return DeploymentListResponse(total=len(deployments), items=paginated)
+    # 列表项均由服务层构建, 直接组装信封并序列化, 不再逐项校验
+    return ModelResponse(
+        DeploymentListResponse.model_construct(total=len(deployments), items=paginated)
+    )
 
 
 @router.get("/{deployment_id}", response_model=Deployment, summary="获取部署详情")
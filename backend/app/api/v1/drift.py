@@ -7,6 +7,7 @@ from fastapi import APIRouter, HTTPException, Query, BackgroundTasks
 from typing import Optional
 
 from app.services.drift_service import drift_service
+from app.schemas.common import ModelResponse
 from app.schemas.drift import (
     StrategyDriftReport,
     DriftCheckRequest,
@@ -56,9 +57,11 @@ async def get_drift_reports(
     返回指定策略的历史漂移报告列表，按时间倒序排列
     """
     reports = await drift_service.get_drift_history(strategy_id, limit)
-    return DriftReportListResponse(
-        total=len(reports),
-        reports=reports,
+    return ModelResponse(
+        DriftReportListResponse.model_construct(
+            total=len(reports),
+            reports=reports,
+        )
     )
 
 
@@ -4,25 +4,29 @@ PRD 4.3 因子有效性验证
 """
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import Response
 from typing import Optional
 from datetime import date
 
 from app.services.factor_validation_service import factor_validation_service
+from app.schemas.common import ListResponse, ModelResponse
 from app.schemas.factor_validation import (
     FactorValidationResult,
     FactorValidationRequest,
     FactorCompareRequest,
     FactorCompareResult,
     FactorSuggestion,
-    EFFECTIVENESS_LEVEL_CONFIG,
+    EFFECTIVENESS_LEVEL_TABLE,
+    EffectivenessLevel,
     FACTOR_CATEGORY_CONFIG,
+    FACTOR_SUGGESTION_LIST_ADAPTER,
 )
 
 router = APIRouter(prefix="/factors", tags=["因子验证"])
 
 
 @router.get("/{factor_id}/validation", response_model=FactorValidationResult)
-async def get_factor_validation(factor_id: str):
+async def get_factor_validation(factor_id: str) -> Response:
     """
     获取因子验证结果
 
@@ -34,7 +38,7 @@ async def get_factor_validation(factor_id: str):
     if not result:
         # 如果没有缓存，先执行验证
         result = await factor_validation_service.validate_factor(factor_id)
-    return result
+    return ModelResponse(result)
 
 
 @router.post("/{factor_id}/validate", response_model=FactorValidationResult)
@@ -43,7 +47,7 @@ async def validate_factor(
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
     universe: str = "全A",
-):
+) -> Response:
     """
     触发因子验证
 
@@ -60,7 +64,7 @@ async def validate_factor(
         end_date=end_date,
         universe=universe,
     )
-    return result
+    return ModelResponse(result)
 
 
 @router.post("/compare", response_model=FactorCompareResult)
@@ -88,7 +92,7 @@ async def get_factor_suggestions(factor_id: str):
     - **factor_id**: 因子ID
     """
     suggestions = await factor_validation_service.get_suggestions(factor_id)
-    return suggestions
+    return ListResponse(suggestions, FACTOR_SUGGESTION_LIST_ADAPTER)
 
 
 @router.get("/categories")
@@ -109,8 +113,8 @@ async def get_effectiveness_levels():
     返回有效性等级定义及其说明
     """
     return {
-        level.value: config
-        for level, config in EFFECTIVENESS_LEVEL_CONFIG.items()
+        level.value: info._asdict()
+        for level, info in zip(EffectivenessLevel, EFFECTIVENESS_LEVEL_TABLE, strict=True)
     }
 
 
@@ -20,11 +20,12 @@ from typing import Any
 import httpx
 import structlog
 from fastapi import APIRouter
+from fastapi.responses import Response
 from sqlalchemy import text
 
 from app.api.deps import DBSession, RedisConn
 from app.core.config import settings
-from app.schemas.common import HealthResponse
+from app.schemas.common import HealthResponse, ModelResponse
 
 router = APIRouter()
 logger = structlog.get_logger()
@@ -37,7 +38,7 @@ _start_time = datetime.now()
 async def health_check(
     db: DBSession,
     redis: RedisConn,
-) -> HealthResponse:
+) -> Response:
     """
     健康检查
 
@@ -68,11 +69,13 @@ async def health_check(
     all_healthy = all(v == "healthy" for v in components.values())
     status = "healthy" if all_healthy else "degraded"
 
-    return HealthResponse(
-        status=status,
-        version=settings.APP_VERSION,
-        timestamp=datetime.now(),
-        components=components,
+    return ModelResponse(
+        HealthResponse(
+            status=status,
+            version=settings.APP_VERSION,
+            timestamp=datetime.now(),
+            components=components,
+        )
     )
 
 
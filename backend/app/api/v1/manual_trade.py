@@ -5,8 +5,11 @@ PRD 4.16 实时交易监控界面
 from typing import Optional
 
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import Response
 
+from app.schemas.common import ListResponse, ModelResponse
 from app.schemas.manual_trade import (
+    QUOTE_LIST_ADAPTER,
     CancelOrderResponse,
     ManualTradeOrder,
     OrderListResponse,
@@ -75,7 +78,7 @@ async def get_orders(
     strategy_id: Optional[str] = Query(None, description="策略ID过滤"),
     limit: int = Query(50, ge=1, le=200, description="每页数量"),
     offset: int = Query(0, ge=0, description="偏移量"),
-) -> OrderListResponse:
+) -> Response:
     """
     获取订单列表
 
@@ -92,10 +95,12 @@ async def get_orders(
         offset=offset,
     )
 
-    return OrderListResponse(
-        orders=orders,
-        total=total,
-        has_more=offset + len(orders) < total,
+    return ModelResponse(
+        OrderListResponse(
+            orders=orders,
+            total=total,
+            has_more=offset + len(orders) < total,
+        )
     )
 
 
@@ -104,7 +109,7 @@ async def get_orders(
     response_model=ManualTradeOrder,
     summary="获取订单详情",
 )
-async def get_order(order_id: str) -> ManualTradeOrder:
+async def get_order(order_id: str) -> Response:
     """获取单个订单详情"""
     service = get_manual_trade_service()
 
@@ -116,11 +121,11 @@ async def get_order(order_id: str) -> ManualTradeOrder:
     if order.user_id != MOCK_USER_ID:
         raise HTTPException(status_code=403, detail="无权访问此订单")
 
-    return order
+    return ModelResponse(order)
 
 
 @router.get("/quote/{symbol}", response_model=QuoteData, summary="获取实时报价")
-async def get_quote(symbol: str) -> QuoteData:
+async def get_quote(symbol: str) -> Response:
     """
     获取股票实时报价
 
@@ -130,13 +135,13 @@ async def get_quote(symbol: str) -> QuoteData:
 
     quote = await service.get_quote(symbol)
 
-    return quote
+    return ModelResponse(quote)
 
 
 @router.get("/quotes", response_model=list[QuoteData], summary="批量获取报价")
 async def get_quotes(
     symbols: str = Query(..., description="股票代码，逗号分隔"),
-) -> list[QuoteData]:
+) -> Response:
     """
     批量获取多个股票的实时报价
     """
@@ -149,4 +154,4 @@ async def get_quotes(
         quote = await service.get_quote(symbol)
         quotes.append(quote)
 
-    return quotes
+    return ListResponse(quotes, QUOTE_LIST_ADAPTER)
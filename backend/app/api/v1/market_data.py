@@ -12,10 +12,13 @@ Phase 11: \u6570\u636e\u5c42\u5347\u7ea7 - \u5e02\u573a\u6570\u636e API
 from datetime import datetime
 from typing import Any
 
-from fastapi import APIRouter, HTTPException, Query, BackgroundTasks
+from fastapi import APIRouter, HTTPException, Query, BackgroundTasks, Request
+from fastapi.responses import Response
 import structlog
 
+from app.schemas.common import ListResponse, ModelResponse, negotiate_media_type
 from app.schemas.market_data import (
+    HISTORICAL_DATA_LIST_ADAPTER,
     DataSource,
     DataFrequency,
     HistoricalDataRequest,
@@ -25,8 +28,10 @@ from app.schemas.market_data import (
     IntradayFactorsResponse,
     DataQualityReport,
     MarketSnapshot,
+    SeverityLiteral,
     IntradayFactorSnapshot,
-    INTRADAY_FACTOR_DEFINITIONS,
+    load_intraday_factor_definitions,
+    FACTOR_ORDER,
 )
 
 logger = structlog.get_logger()
@@ -37,16 +42,16 @@ router = APIRouter(prefix="/market-data", tags=["\u5e02\u573a\u6570\u636e"])
 # === \u6570\u636e\u6e90\u7ba1\u7406 ===
 
 @router.get("/sources", response_model=DataSourceListResponse)
-async def list_data_sources() -> DataSourceListResponse:
+async def list_data_sources() -> Response:
     """\u83b7\u53d6\u53ef\u7528\u6570\u636e\u6e90\u5217\u8868"""
     from app.services.data_source import data_source_manager
 
     sources = data_source_manager.get_all_sources()
 
-    return DataSourceListResponse(
+    return ModelResponse(DataSourceListResponse.model_construct(
         sources=sources,
         primary_source=data_source_manager._primary_source,
-    )
+    ))
 
 
 @router.post("/sources/{source}/test")
@@ -78,11 +83,13 @@ async def test_data_source(source: DataSource) -> dict[str, Any]:
 @router.post("/historical", response_model=list[HistoricalDataResponse])
 async def get_historical_data(
     request: HistoricalDataRequest,
-) -> list[HistoricalDataResponse]:
+    http_request: Request,
+) -> Response:
     """
     \u83b7\u53d6\u5386\u53f2K\u7ebf\u6570\u636e
 
     \u652f\u6301\u9891\u7387: 1min, 5min, 15min, 30min, 1hour, 1day
+    \u670d\u52a1\u95f4\u8c03\u7528\u53ef\u901a\u8fc7 Accept: application/msgpack \u83b7\u53d6 msgpack \u683c\u5f0f
     """
     from app.services.data_source import data_source_manager
 
@@ -93,13 +100,13 @@ async def get_historical_data(
             bars = await data_source_manager.get_bars(
                 symbol=symbol,
                 frequency=request.frequency,
-                start_date=request.start_date,
-                end_date=request.end_date,
+                start_date=request.start_date.isoformat(),
+                end_date=request.end_date.isoformat(),
                 adjusted=request.adjusted_price,
                 source=request.data_source,
             )
 
-            results.append(HistoricalDataResponse(
+            results.append(HistoricalDataResponse.model_construct(
                 symbol=symbol,
                 frequency=request.frequency,
                 bars=bars,
@@ -111,7 +118,11 @@ async def get_historical_data(
             logger.error(f"\u83b7\u53d6 {symbol} \u5386\u53f2\u6570\u636e\u5931\u8d25", error=str(e))
             raise HTTPException(status_code=500, detail=str(e))
 
-    return results
+    return ListResponse(
+        results,
+        HISTORICAL_DATA_LIST_ADAPTER,
+        media_type=negotiate_media_type(http_request),
+    )
 
 
 @router.get("/snapshot/{symbol}", response_model=MarketSnapshot)
@@ -179,21 +190,22 @@ async def sync_historical_data(
 
 @router.get("/sync/status", response_model=SyncStatusResponse)
 async def get_sync_status(
+    http_request: Request,
     symbols: list[str] | None = Query(None),
     frequency: DataFrequency = DataFrequency.DAY_1,
-) -> SyncStatusResponse:
-    """\u83b7\u53d6\u6570\u636e\u540c\u6b65\u72b6\u6001"""
+) -> Response:
+    """\u83b7\u53d6\u6570\u636e\u540c\u6b65\u72b6\u6001 (\u652f\u6301 Accept: application/msgpack)"""
     from app.services.data_etl import data_etl_service
 
     statuses = await data_etl_service.get_sync_status(symbols, frequency)
 
-    return SyncStatusResponse(
+    return ModelResponse(SyncStatusResponse.model_construct(
         symbols=statuses,
         total_symbols=len(statuses),
         synced_count=sum(1 for s in statuses if s.status.value == "synced"),
         syncing_count=sum(1 for s in statuses if s.status.value == "syncing"),
         error_count=sum(1 for s in statuses if s.status.value == "error"),
-    )
+    ), media_type=negotiate_media_type(http_request))
 
 
 @router.post("/sync/fill-missing")
@@ -218,7 +230,26 @@ async def fill_missing_data(
 @router.get("/intraday-factors/definitions")
 async def get_intraday_factor_definitions() -> list[dict[str, Any]]:
     """\u83b7\u53d6\u65e5\u5185\u56e0\u5b50\u5b9a\u4e49"""
-    return [f.model_dump() for f in INTRADAY_FACTOR_DEFINITIONS]
+    return [f.model_dump() for f in load_intraday_factor_definitions()]
+
+
+# \u987b\u5728 /intraday-factors/{symbol} \u4e4b\u524d\u6ce8\u518c, \u5426\u5219 "latest" \u4f1a\u88ab\u5f53\u4f5c\u80a1\u7968\u4ee3\u7801
+@router.get("/intraday-factors/latest", response_model=IntradayFactorsResponse)
+async def get_latest_intraday_factors(
+    http_request: Request,
+    symbols: list[str] = Query(...),
+) -> Response:
+    """\u83b7\u53d6\u6700\u65b0\u7684\u65e5\u5185\u56e0\u5b50 (\u5168\u90e8\u80a1\u7968\u5408\u5e76\u4e3a\u4e00\u6761\u6d88\u606f, \u652f\u6301 Accept: application/msgpack)"""
+    from app.services.intraday_factor_engine import intraday_factor_engine
+
+    latest = await intraday_factor_engine.get_latest_factors(symbols)
+    snapshots = list(latest.values())
+
+    return ModelResponse(IntradayFactorsResponse.model_construct(
+        snapshots=snapshots,
+        timestamp=max((s.timestamp for s in snapshots), default=datetime.now()),
+        factors_calculated=list(FACTOR_ORDER),
+    ), media_type=negotiate_media_type(http_request))
 
 
 @router.get("/intraday-factors/{symbol}", response_model=IntradayFactorSnapshot)
@@ -236,29 +267,20 @@ async def get_intraday_factors(
 
 @router.post("/intraday-factors/batch", response_model=IntradayFactorsResponse)
 async def get_batch_intraday_factors(
+    http_request: Request,
     symbols: list[str],
     timestamp: datetime | None = None,
-) -> IntradayFactorsResponse:
-    """\u6279\u91cf\u83b7\u53d6\u65e5\u5185\u56e0\u5b50"""
+) -> Response:
+    """\u6279\u91cf\u83b7\u53d6\u65e5\u5185\u56e0\u5b50 (\u652f\u6301 Accept: application/msgpack)"""
     from app.services.intraday_factor_engine import intraday_factor_engine
 
     snapshots = await intraday_factor_engine.calculate_batch(symbols, timestamp)
 
-    return IntradayFactorsResponse(
+    return ModelResponse(IntradayFactorsResponse.model_construct(
         snapshots=snapshots,
         timestamp=timestamp or datetime.now(),
-        factors_calculated=[f.id.value for f in INTRADAY_FACTOR_DEFINITIONS],
-    )
-
-
-@router.get("/intraday-factors/latest")
-async def get_latest_intraday_factors(
-    symbols: list[str] = Query(...),
-) -> dict[str, IntradayFactorSnapshot]:
-    """\u83b7\u53d6\u6700\u65b0\u7684\u65e5\u5185\u56e0\u5b50"""
-    from app.services.intraday_factor_engine import intraday_factor_engine
-
-    return await intraday_factor_engine.get_latest_factors(symbols)
+        factors_calculated=list(FACTOR_ORDER),
+    ), media_type=negotiate_media_type(http_request))
 
 
 # === \u6570\u636e\u8d28\u91cf ===
@@ -301,7 +323,7 @@ async def get_quality_report(
 
         # \u6309\u7c7b\u578b\u7edf\u8ba1
         issues_by_type = {}
-        issues_by_severity = {"low": 0, "medium": 0, "high": 0}
+        issues_by_severity: dict[SeverityLiteral, int] = {"low": 0, "medium": 0, "high": 0}
 
         for issue in issues:
             issues_by_type[issue.issue_type] = issues_by_type.get(issue.issue_type, 0) + 1
@@ -5,8 +5,11 @@ PRD 4.18 分策略持仓管理
 from typing import Optional
 
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import Response
 
+from app.schemas.common import ListResponse, ModelResponse
 from app.schemas.position import (
+    STRATEGY_POSITION_LIST_ADAPTER,
     AccountPositionSummary,
     ConsolidatedPosition,
     SellPositionRequest,
@@ -28,7 +31,7 @@ MOCK_ACCOUNT_ID = "account_001"
     response_model=AccountPositionSummary,
     summary="获取持仓汇总",
 )
-async def get_position_summary() -> AccountPositionSummary:
+async def get_position_summary() -> Response:
     """
     获取账户持仓汇总
 
@@ -40,10 +43,11 @@ async def get_position_summary() -> AccountPositionSummary:
     """
     service = get_position_service()
 
-    return await service.get_account_positions(
+    summary = await service.get_account_positions(
         user_id=MOCK_USER_ID,
         account_id=MOCK_ACCOUNT_ID,
     )
+    return ModelResponse(summary)
 
 
 @router.get(
@@ -51,14 +55,15 @@ async def get_position_summary() -> AccountPositionSummary:
     response_model=list[StrategyPosition],
     summary="获取策略持仓",
 )
-async def get_strategy_positions(strategy_id: str) -> list[StrategyPosition]:
+async def get_strategy_positions(strategy_id: str) -> Response:
     """获取特定策略的持仓列表"""
     service = get_position_service()
 
-    return await service.get_positions_by_strategy(
+    positions = await service.get_positions_by_strategy(
         user_id=MOCK_USER_ID,
         strategy_id=strategy_id,
     )
+    return ListResponse(positions, STRATEGY_POSITION_LIST_ADAPTER)
 
 
 @router.get(
@@ -66,14 +71,15 @@ async def get_strategy_positions(strategy_id: str) -> list[StrategyPosition]:
     response_model=list[StrategyPosition],
     summary="获取手动交易持仓",
 )
-async def get_manual_positions() -> list[StrategyPosition]:
+async def get_manual_positions() -> Response:
     """获取手动交易的持仓列表"""
     service = get_position_service()
 
-    return await service.get_positions_by_strategy(
+    positions = await service.get_positions_by_strategy(
         user_id=MOCK_USER_ID,
         strategy_id=None,
     )
+    return ListResponse(positions, STRATEGY_POSITION_LIST_ADAPTER)
 
 
 @router.get(
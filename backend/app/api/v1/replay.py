@@ -6,8 +6,16 @@ PRD 4.17 策略回放功能
 from datetime import datetime
 from typing import Optional
 
+import msgpack
 from fastapi import APIRouter, HTTPException, Query, WebSocket, WebSocketDisconnect
+from fastapi.responses import Response
 
+from app.schemas.common import (
+    MSGPACK_MEDIA_TYPE,
+    ModelResponse,
+    dump_msgpack,
+    negotiate_media_type,
+)
 from app.schemas.replay import (
     ReplayConfig,
     ReplayExport,
@@ -32,7 +40,7 @@ MOCK_USER_ID = "user_001"
     response_model=ReplayInitResponse,
     summary="初始化回放会话",
 )
-async def init_replay(config: ReplayConfig) -> ReplayInitResponse:
+async def init_replay(config: ReplayConfig) -> Response:
     """
     初始化回放会话
 
@@ -44,7 +52,7 @@ async def init_replay(config: ReplayConfig) -> ReplayInitResponse:
 
     try:
         result = await service.init_replay(MOCK_USER_ID, config)
-        return ReplayInitResponse(**result)
+        return ModelResponse(ReplayInitResponse.model_construct(**result))
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -84,12 +92,12 @@ async def pause_replay(session_id: str) -> ReplayState:
     response_model=ReplayTickResponse,
     summary="前进一步",
 )
-async def step_forward(session_id: str) -> ReplayTickResponse:
+async def step_forward(session_id: str) -> Response:
     """前进一步"""
     service = get_replay_engine_service()
 
     try:
-        return await service.step_forward(session_id)
+        return ModelResponse(await service.step_forward(session_id))
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
@@ -99,12 +107,12 @@ async def step_forward(session_id: str) -> ReplayTickResponse:
     response_model=ReplayTickResponse,
     summary="后退一步",
 )
-async def step_backward(session_id: str) -> ReplayTickResponse:
+async def step_backward(session_id: str) -> Response:
     """后退一步"""
     service = get_replay_engine_service()
 
     try:
-        return await service.step_backward(session_id)
+        return ModelResponse(await service.step_backward(session_id))
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
@@ -114,12 +122,12 @@ async def step_backward(session_id: str) -> ReplayTickResponse:
     response_model=ReplayTickResponse,
     summary="跳转到指定时间",
 )
-async def seek_to_time(session_id: str, request: SeekRequest) -> ReplayTickResponse:
+async def seek_to_time(session_id: str, request: SeekRequest) -> Response:
     """跳转到指定时间"""
     service = get_replay_engine_service()
 
     try:
-        return await service.seek_to_time(session_id, request.target_time)
+        return ModelResponse(await service.seek_to_time(session_id, request.target_time))
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
@@ -129,12 +137,12 @@ async def seek_to_time(session_id: str, request: SeekRequest) -> ReplayTickRespo
     response_model=ReplayTickResponse,
     summary="跳转到下一个信号",
 )
-async def seek_to_next_signal(session_id: str) -> ReplayTickResponse:
+async def seek_to_next_signal(session_id: str) -> Response:
     """跳转到下一个信号"""
     service = get_replay_engine_service()
 
     try:
-        return await service.seek_to_next_signal(session_id)
+        return ModelResponse(await service.seek_to_next_signal(session_id))
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
@@ -194,10 +202,26 @@ async def replay_stream(websocket: WebSocket, session_id: str):
     - 当前K线数据
     - 因子快照
     - 信号事件
+
+    握手时声明 Accept: application/msgpack 的服务间客户端以 msgpack 二进制帧接收
     """
     await websocket.accept()
 
     service = get_replay_engine_service()
+    use_msgpack = negotiate_media_type(websocket) == MSGPACK_MEDIA_TYPE
+
+    async def send_tick(tick: ReplayTickResponse) -> None:
+        if use_msgpack:
+            await websocket.send_bytes(dump_msgpack(tick))
+        else:
+            await websocket.send_text(tick.model_dump_json())
+
+    async def send_state(state: ReplayState) -> None:
+        message = {"type": "state", "data": state.model_dump(mode="json")}
+        if use_msgpack:
+            await websocket.send_bytes(msgpack.packb(message))
+        else:
+            await websocket.send_json(message)
 
     try:
         # 验证会话存在
@@ -227,29 +251,29 @@ async def replay_stream(websocket: WebSocket, session_id: str):
                     and state.current_bar_index < state.total_bars - 1
                 ):
                     tick = await service.step_forward(session_id)
-                    await websocket.send_json(tick.model_dump(mode="json"))
+                    await send_tick(tick)
                     await asyncio.sleep(interval)
 
             elif command == "pause":
                 state = await service.pause(session_id)
-                await websocket.send_json({"type": "state", "data": state.model_dump(mode="json")})
+                await send_state(state)
 
             elif command == "step_forward":
                 tick = await service.step_forward(session_id)
-                await websocket.send_json(tick.model_dump(mode="json"))
+                await send_tick(tick)
 
             elif command == "step_backward":
                 tick = await service.step_backward(session_id)
-                await websocket.send_json(tick.model_dump(mode="json"))
+                await send_tick(tick)
 
             elif command == "next_signal":
                 tick = await service.seek_to_next_signal(session_id)
-                await websocket.send_json(tick.model_dump(mode="json"))
+                await send_tick(tick)
 
             elif command == "set_speed":
                 speed = ReplaySpeed(data.get("speed", "1x"))
                 state = await service.set_speed(session_id, speed)
-                await websocket.send_json({"type": "state", "data": state.model_dump(mode="json")})
+                await send_state(state)
 
     except WebSocketDisconnect:
         pass
@@ -8,6 +8,7 @@ Phase 10: \u98ce\u9669\u7cfb\u7edf\u5347\u7ea7 - \u9ad8\u7ea7\u98ce\u9669\u7ba1\
 - \u5b9e\u65f6\u98ce\u9669\u76d1\u63a7\u4eea\u8868\u76d8
 """
 
+from dataclasses import asdict
 from datetime import datetime
 from typing import Any
 
@@ -509,7 +510,7 @@ async def generate_risk_report(
         )
         report["risk_decomposition"] = {
             "total_risk": decomposition.total_risk,
-            "risk_contributions": decomposition.risk_contributions.model_dump(),
+            "risk_contributions": asdict(decomposition.risk_contributions),
             "factor_exposures": decomposition.factor_exposures.model_dump(),
             "r_squared": decomposition.r_squared,
         }
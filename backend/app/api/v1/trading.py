@@ -23,6 +23,7 @@ from app.schemas.trading import (
     BrokerType,
     BrokerConnectionStatus,
     BrokerAccount,
+    BrokerAccountSummary,
     BrokerPosition,
     BrokerStatusSummary,
     OrderSide,
@@ -133,7 +134,7 @@ async def get_trading_status() -> BrokerStatusSummary:
 
     # \u83b7\u53d6\u8d26\u6237\u4fe1\u606f
     account = await broker.get_account()
-    account_summary = None
+    account_summary: BrokerAccountSummary | None = None
     if account:
         account_summary = {
             "equity": account.equity,
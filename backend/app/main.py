@@ -8,6 +8,7 @@ Sprint 13: 增强日志与监控
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
+import pydantic_core
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -15,6 +16,7 @@ from app.core.config import settings
 from app.core.database import close_db, init_db
 from app.core.redis import RedisClient
 from app.core.logging import configure_logging, get_logger, RequestLoggingMiddleware
+from app.schemas.common import CoreJSONResponse
 
 # 配置结构化日志
 configure_logging()
@@ -35,7 +37,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     - 释放所有连接资源
     """
     # 启动
-    logger.info("应用启动中...", version=settings.APP_VERSION)
+    logger.info(
+        "应用启动中...",
+        version=settings.APP_VERSION,
+        pydantic_core=pydantic_core.__version__,
+    )
 
     db_connected = False
     redis_connected = False
@@ -89,6 +95,7 @@ def create_app() -> FastAPI:
         redoc_url="/redoc" if settings.DEBUG else None,
         openapi_url="/openapi.json" if settings.DEBUG else None,
         lifespan=lifespan,
+        default_response_class=CoreJSONResponse,
     )
 
     # CORS 中间件
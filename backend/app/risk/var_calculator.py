@@ -7,17 +7,24 @@ VaR (Value at Risk) 计算器
 3. 蒙特卡洛模拟 (Monte Carlo)
 """
 
+import math
 from dataclasses import dataclass, field
 from enum import Enum
+from statistics import NormalDist
 from typing import Any
 
 import numpy as np
 import pandas as pd
 import structlog
-from scipy import stats
 
 logger = structlog.get_logger()
 
+# 年化因子 (交易日)
+_SQRT_252 = math.sqrt(252.0)
+
+# 标准正态分布 (标准库实现, 避免为 ppf/pdf 导入 scipy.stats)
+_STD_NORMAL = NormalDist()
+
 
 class VaRMethod(str, Enum):
     """VaR 计算方法"""
@@ -57,12 +64,17 @@ class VaRCalculator:
     ```
     """
 
+    # 排序缓存容量 (滚动窗口场景下只需保留最近的少量窗口)
+    _SORTED_CACHE_SIZE = 8
+
     def __init__(
         self,
         confidence_level: float = 0.95,
         horizon_days: int = 1,
         n_simulations: int = 10000,
         ewma_lambda: float = 0.94,
+        seed: int | None = None,
+        mc_dtype: type[np.floating] = np.float32,
     ):
         """
         Args:
@@ -70,6 +82,8 @@ class VaRCalculator:
             horizon_days: 持有期天数
             n_simulations: 蒙特卡洛模拟次数
             ewma_lambda: EWMA 衰减因子
+            seed: 蒙特卡洛随机种子 (None 表示不固定)
+            mc_dtype: 蒙特卡洛抽样精度 (均值/波动率仍以 float64 估计)
         """
         if not 0 < confidence_level < 1:
             raise ValueError("置信水平必须在 0 到 1 之间")
@@ -79,6 +93,26 @@ class VaRCalculator:
         self.n_simulations = n_simulations
         self.ewma_lambda = ewma_lambda
 
+        # 持有期缩放因子 (时间平方根法则)
+        self._sqrt_h = math.sqrt(horizon_days) if horizon_days > 1 else 1.0
+
+        # 独立的 PCG64 随机数生成器, 不依赖也不污染全局随机状态
+        self._rng = np.random.default_rng(seed)
+        self._mc_dtype = mc_dtype
+
+        # 标准正态分位数 (置信水平固定后为常数)
+        self._z = _STD_NORMAL.inv_cdf(1 - confidence_level)
+        self._pdf_z = _STD_NORMAL.pdf(self._z)
+
+        # Cornish-Fisher 展开系数 (仅依赖 z, 预先折叠为常数)
+        z = self._z
+        self._cf_c1 = (z**2 - 1) / 6
+        self._cf_c2 = (z**3 - 3 * z) / 24
+        self._cf_c3 = -(2 * z**3 - 5 * z) / 36
+
+        # 历史模拟法排序缓存 (内容哈希 -> 升序收益数组)
+        self._sorted_cache: dict[tuple[int, int], np.ndarray] = {}
+
     def calculate(
         self,
         returns: pd.Series | pd.DataFrame,
@@ -98,35 +132,21 @@ class VaRCalculator:
         Returns:
             VaR 计算结果
         """
-        # 处理多资产情况
-        if isinstance(returns, pd.DataFrame):
-            if weights is None:
-                weights = np.ones(len(returns.columns)) / len(returns.columns)
-            portfolio_returns = returns.values @ weights
-            returns = pd.Series(portfolio_returns, index=returns.index)
+        returns = self._prepare_returns(returns, weights)
 
-        returns = returns.dropna()
         if len(returns) < 30:
             logger.warning("收益率样本过少，VaR 计算可能不可靠", n_samples=len(returns))
 
-        # 根据方法计算
-        if method == VaRMethod.HISTORICAL:
-            var, cvar, details = self._historical_var(returns)
-        elif method == VaRMethod.PARAMETRIC:
-            var, cvar, details = self._parametric_var(returns)
-        elif method == VaRMethod.MONTE_CARLO:
-            var, cvar, details = self._monte_carlo_var(returns)
-        elif method == VaRMethod.CORNISH_FISHER:
-            var, cvar, details = self._cornish_fisher_var(returns)
-        elif method == VaRMethod.EWMA:
-            var, cvar, details = self._ewma_var(returns)
-        else:
+        # 根据方法计算 (查表分派)
+        calc_fn = self._METHOD_TABLE.get(method)
+        if calc_fn is None:
             raise ValueError(f"不支持的 VaR 方法: {method}")
+        var, cvar, details = calc_fn(self, returns)
 
         # 调整持有期 (时间平方根法则)
-        if self.horizon_days > 1:
-            var *= np.sqrt(self.horizon_days)
-            cvar *= np.sqrt(self.horizon_days)
+        if self._sqrt_h != 1.0:
+            var *= self._sqrt_h
+            cvar *= self._sqrt_h
 
         # 转换为绝对金额
         var_amount = var * portfolio_value
@@ -142,26 +162,126 @@ class VaRCalculator:
             details=details,
         )
 
+    def calculate_many(
+        self,
+        returns: pd.Series | pd.DataFrame,
+        confidence_levels: list[float],
+        portfolio_value: float = 1.0,
+        weights: np.ndarray | None = None,
+    ) -> list[VaRResult]:
+        """
+        在多个置信水平下计算历史模拟 VaR
+
+        收益只排序一次, 之后每个置信水平的 VaR/CVaR 均直接在有序数组上取值,
+        适用于压力测试等需要扫描多个置信水平的场景.
+
+        Args:
+            returns: 收益率序列或矩阵 (多资产)
+            confidence_levels: 置信水平列表
+            portfolio_value: 组合价值
+            weights: 资产权重 (多资产时)
+
+        Returns:
+            与 confidence_levels 顺序一致的 VaR 计算结果
+        """
+        for level in confidence_levels:
+            if not 0 < level < 1:
+                raise ValueError("置信水平必须在 0 到 1 之间")
+
+        returns = self._prepare_returns(returns, weights)
+        sorted_returns = self._sorted_returns(returns)
+
+        results = []
+        for level in confidence_levels:
+            var, cvar, details = self._historical_from_sorted(sorted_returns, 1 - level)
+
+            if self._sqrt_h != 1.0:
+                var *= self._sqrt_h
+                cvar *= self._sqrt_h
+
+            results.append(
+                VaRResult(
+                    var=var * portfolio_value,
+                    cvar=cvar * portfolio_value,
+                    confidence_level=level,
+                    horizon_days=self.horizon_days,
+                    method=VaRMethod.HISTORICAL,
+                    portfolio_value=portfolio_value,
+                    details=details,
+                )
+            )
+
+        return results
+
+    def _prepare_returns(
+        self,
+        returns: pd.Series | pd.DataFrame,
+        weights: np.ndarray | None,
+    ) -> pd.Series:
+        """合成组合收益并剔除缺失值"""
+        # 处理多资产情况
+        if isinstance(returns, pd.DataFrame):
+            if weights is None:
+                weights = np.ones(len(returns.columns)) / len(returns.columns)
+            portfolio_returns = returns.values @ weights
+            nan_mask = np.isnan(portfolio_returns)
+            if nan_mask.any():
+                keep = ~nan_mask
+                returns = pd.Series(portfolio_returns[keep], index=returns.index[keep])
+            else:
+                returns = pd.Series(portfolio_returns, index=returns.index)
+        elif returns.hasnans:
+            # 仅在存在缺失值时才复制, 干净输入直接复用
+            returns = returns.dropna()
+
+        return returns
+
+    def _sorted_returns(self, returns: pd.Series) -> np.ndarray:
+        """返回升序排列的收益数组, 相同内容的输入复用已排序结果"""
+        arr = np.ascontiguousarray(returns.to_numpy(dtype=np.float64))
+        key = (len(arr), hash(arr.tobytes()))
+
+        sorted_arr = self._sorted_cache.get(key)
+        if sorted_arr is None:
+            if len(self._sorted_cache) >= self._SORTED_CACHE_SIZE:
+                self._sorted_cache.pop(next(iter(self._sorted_cache)))
+            sorted_arr = np.sort(arr)
+            self._sorted_cache[key] = sorted_arr
+
+        return sorted_arr
+
     def _historical_var(
         self, returns: pd.Series
     ) -> tuple[float, float, dict[str, Any]]:
         """历史模拟法"""
-        alpha = 1 - self.confidence_level
+        return self._historical_from_sorted(
+            self._sorted_returns(returns), 1 - self.confidence_level
+        )
 
-        # VaR: 分位数
-        var = -np.percentile(returns, alpha * 100)
+    @staticmethod
+    def _historical_from_sorted(
+        sorted_returns: np.ndarray, alpha: float
+    ) -> tuple[float, float, dict[str, Any]]:
+        """在升序收益数组上计算历史模拟 VaR/CVaR"""
+        n = len(sorted_returns)
+
+        # VaR: 分位数 (与 np.percentile 默认的线性插值一致)
+        h = (n - 1) * alpha
+        lo = int(h)
+        hi = min(lo + 1, n - 1)
+        threshold = sorted_returns[lo] + (h - lo) * (sorted_returns[hi] - sorted_returns[lo])
+        var = -threshold
 
         # CVaR: 尾部平均
-        threshold = np.percentile(returns, alpha * 100)
-        tail_returns = returns[returns <= threshold]
-        cvar = -tail_returns.mean() if len(tail_returns) > 0 else var
+        n_tail = int(np.searchsorted(sorted_returns, threshold, side="right"))
+        cvar = -sorted_returns[:n_tail].mean() if n_tail > 0 else var
 
         details = {
             "method": "历史模拟法",
-            "n_samples": len(returns),
+            "n_samples": n,
             "percentile": alpha * 100,
-            "min_return": float(returns.min()),
-            "max_return": float(returns.max()),
+            "min_return": float(sorted_returns[0]),
+            "max_return": float(sorted_returns[-1]),
         }
 
         return float(var), float(cvar), details
@@ -174,12 +294,12 @@ class VaRCalculator:
         sigma = returns.std()
 
         # 正态分布分位数
-        z = stats.norm.ppf(1 - self.confidence_level)
+        z = self._z
 
         var = -(mu + z * sigma)
 
         # CVaR (正态分布解析解)
-        pdf_z = stats.norm.pdf(z)
+        pdf_z = self._pdf_z
         cvar = -(mu - sigma * pdf_z / (1 - self.confidence_level))
 
         details = {
@@ -187,7 +307,7 @@ class VaRCalculator:
             "mean": float(mu),
             "std": float(sigma),
             "z_score": float(z),
-            "annualized_vol": float(sigma * np.sqrt(252)),
+            "annualized_vol": float(sigma * _SQRT_252),
         }
 
         return float(var), float(cvar), details
@@ -202,7 +322,10 @@ class VaRCalculator:
         kurt = returns.kurtosis()
 
         # 生成模拟收益
-        simulated = np.random.normal(mu, sigma, self.n_simulations)
+        # 尾部分位数不需要 float64 精度, float32 抽样可减半内存带宽
+        simulated = self._rng.standard_normal(self.n_simulations, dtype=self._mc_dtype)
+        np.multiply(simulated, float(sigma), out=simulated)
+        simulated += float(mu)
 
         # 可选: 使用 Johnson SU 分布匹配偏度和峰度
         # 这里简化使用正态分布
@@ -235,20 +358,15 @@ class VaRCalculator:
         excess_kurt = returns.kurtosis()  # pandas 返回超额峰度
 
         # 标准正态分位数
-        z = stats.norm.ppf(1 - self.confidence_level)
-
-        # Cornish-Fisher 调整
-        z_cf = (
-            z
-            + (z**2 - 1) * skew / 6
-            + (z**3 - 3 * z) * excess_kurt / 24
-            - (2 * z**3 - 5 * z) * skew**2 / 36
-        )
+        z = self._z
+
+        # Cornish-Fisher 调整 (系数已在 __init__ 中预计算)
+        z_cf = z + self._cf_c1 * skew + self._cf_c2 * excess_kurt + self._cf_c3 * skew * skew
 
         var = -(mu + z_cf * sigma)
 
         # CVaR 近似 (使用调整后的正态分布)
-        pdf_z = stats.norm.pdf(z_cf)
+        pdf_z = _STD_NORMAL.pdf(z_cf)
         cvar = -(mu - sigma * pdf_z / (1 - self.confidence_level))
 
         details = {
@@ -276,10 +394,10 @@ class VaRCalculator:
         ewma_var = np.sum(weights * (returns.values - mu) ** 2)
         ewma_std = np.sqrt(ewma_var)
 
-        z = stats.norm.ppf(1 - self.confidence_level)
+        z = self._z
         var = -(mu + z * ewma_std)
 
-        pdf_z = stats.norm.pdf(z)
+        pdf_z = self._pdf_z
         cvar = -(mu - ewma_std * pdf_z / (1 - self.confidence_level))
 
         details = {
@@ -292,6 +410,15 @@ class VaRCalculator:
 
         return float(var), float(cvar), details
 
+    # 方法分派表: 在类体末尾构建, 一次字典查找代替逐个枚举比较
+    _METHOD_TABLE = {
+        VaRMethod.HISTORICAL: _historical_var,
+        VaRMethod.PARAMETRIC: _parametric_var,
+        VaRMethod.MONTE_CARLO: _monte_carlo_var,
+        VaRMethod.CORNISH_FISHER: _cornish_fisher_var,
+        VaRMethod.EWMA: _ewma_var,
+    }
+
 
 def calculate_var(
     returns: pd.Series,
@@ -365,32 +492,33 @@ class PortfolioVaR:
         self.cov_matrix = returns.cov()
         self.mean_returns = returns.mean()
 
+        # 缓存 ndarray 视图及二次型中间量, 供各 VaR 分解复用
+        self._cov_np = self.cov_matrix.values
+        self._z = _STD_NORMAL.inv_cdf(1 - confidence_level)
+        self._sw = self._cov_np @ self.weights           # Σw
+        self._wsw = float(self.weights @ self._sw)       # wᵀΣw
+
     def calculate_portfolio_var(self) -> dict[str, Any]:
         """计算组合 VaR"""
         # 组合收益
         port_return = self.mean_returns.values @ self.weights
-        port_var = self.weights @ self.cov_matrix.values @ self.weights
-        port_std = np.sqrt(port_var)
+        port_std = math.sqrt(self._wsw)
 
-        z = stats.norm.ppf(1 - self.confidence_level)
-        var = -(port_return + z * port_std)
+        var = -(port_return + self._z * port_std)
 
         return {
             "portfolio_var": float(var),
             "portfolio_std": float(port_std),
             "portfolio_return": float(port_return),
-            "annualized_vol": float(port_std * np.sqrt(252)),
+            "annualized_vol": float(port_std * _SQRT_252),
         }
 
     def calculate_component_var(self) -> pd.Series:
         """计算成分 VaR (各资产对组合 VaR 的贡献)"""
-        port_var = self.weights @ self.cov_matrix.values @ self.weights
-        port_std = np.sqrt(port_var)
-
-        z = stats.norm.ppf(1 - self.confidence_level)
+        port_std = math.sqrt(self._wsw)
 
         # 边际 VaR
-        marginal_var = (self.cov_matrix.values @ self.weights) / port_std * (-z)
+        marginal_var = self._sw / port_std * (-self._z)
 
         # 成分 VaR
         component_var = marginal_var * self.weights
@@ -408,15 +536,30 @@ class PortfolioVaR:
         Returns:
             增量 VaR
         """
-        base_var = self.calculate_portfolio_var()["portfolio_var"]
+        return float(self.calculate_incremental_var_all(delta_weight)[asset_idx])
+
+    def calculate_incremental_var_all(self, delta_weight: float = 0.01) -> np.ndarray:
+        """
+        计算全部资产的增量 VaR
+
+        单一权重扰动并重新归一化后, w' = (w + δ·e_i) / (Σw + δ), 其二次型有解析解:
+        w'ᵀΣw' = (wᵀΣw + 2δ·(Σw)_i + δ²·Σ_ii) / (Σw + δ)²,
+        因此无需逐资产重算 O(N²) 的矩阵乘法.
 
-        new_weights = self.weights.copy()
-        new_weights[asset_idx] += delta_weight
-        new_weights /= new_weights.sum()  # 重新归一化
+        Args:
+            delta_weight: 权重变化
+
+        Returns:
+            各资产增量 VaR (与 weights 顺序一致)
+        """
+        base_var = self.calculate_portfolio_var()["portfolio_var"]
 
-        new_port_var = new_weights @ self.cov_matrix.values @ new_weights
-        new_port_std = np.sqrt(new_port_var)
-        z = stats.norm.ppf(1 - self.confidence_level)
-        new_var = -z * new_port_std
+        delta = delta_weight
+        norm = self.weights.sum() + delta
+        new_port_var = (
+            self._wsw + 2 * delta * self._sw + delta * delta * np.diag(self._cov_np)
+        ) / (norm * norm)
+        new_var = -self._z * np.sqrt(new_port_var)
+        incremental: np.ndarray = new_var - base_var
 
-        return float(new_var - base_var)
+        return incremental
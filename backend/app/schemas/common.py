@@ -6,15 +6,34 @@
 - 分页响应
 - 错误响应
 - 日期范围请求
+- 模型直出响应 / 列表直出响应
+- 默认 JSON 响应
+- 高频模型配置
+- msgpack 序列化 (服务间调用)
 """
 
 from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
 from typing import Any, Generic, TypeVar
 
-from pydantic import BaseModel, Field
+import msgpack
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, model_validator
+from pydantic_core import to_json
+from starlette.requests import HTTPConnection
+from starlette.responses import JSONResponse, Response
 
 T = TypeVar("T")
 
+# 高频模型 (快照/因子值/回放事件) 共用配置: 拒绝未知字段, 实例只读, 首次使用时再构建 schema.
+# 请求模型保持默认配置, 对客户端多余字段保持宽容
+HOT_CONFIG = ConfigDict(
+    extra="forbid",
+    frozen=True,
+    defer_build=True,
+)
+
 
 class ResponseBase(BaseModel, Generic[T]):
     """
@@ -77,14 +96,16 @@ class PaginatedResponse(BaseModel, Generic[T]):
     ) -> "PaginatedResponse":
         """创建分页响应"""
         pages = (total + page_size - 1) // page_size
-        return cls(
+        # data 为无嵌套模式的 dict, 直接构造, 跳过校验器对字典的逐项遍历
+        return cls.model_construct(
+            success=True,
             data={
                 "items": items,
                 "total": total,
                 "page": page,
                 "page_size": page_size,
                 "pages": pages,
-            }
+            },
         )
 
 
@@ -93,10 +114,12 @@ class DateRangeRequest(BaseModel):
     start_date: date = Field(..., description="开始日期")
     end_date: date = Field(..., description="结束日期")
 
-    def validate_range(self) -> None:
+    @model_validator(mode="after")
+    def validate_range(self) -> "DateRangeRequest":
         """验证日期范围"""
         if self.start_date > self.end_date:
             raise ValueError("开始日期不能大于结束日期")
+        return self
 
 
 class HealthResponse(BaseModel):
@@ -105,3 +128,116 @@ class HealthResponse(BaseModel):
     version: str
     timestamp: datetime = Field(default_factory=datetime.now)
     components: dict[str, str] = Field(default_factory=dict)
+
+
+class ModelResponse(Response):
+    """
+    模型直出 JSON 响应
+
+    直接调用模型自带的 pydantic-core 序列化器生成 JSON 字节,
+    跳过 FastAPI 对 response_model 的 "dump -> 再校验 -> 再序列化" 往返.
+    仅用于服务端自行构建、无需再次校验的响应模型; 路由上的 response_model
+    仍保留, 用于生成 OpenAPI 文档.
+
+    由已校验对象 (服务返回值、数据库行转换结果) 组装的响应外壳统一以
+    model_construct 构建, 跳过重复校验; 外部输入 (请求体等) 仍完整校验.
+
+    使用示例:
+    ```python
+    @router.get("/quote/{symbol}", response_model=QuoteData)
+    async def get_quote(symbol: str) -> Response:
+        return ModelResponse(await service.get_quote(symbol))
+    ```
+    """
+    media_type = "application/json"
+
+    def render(self, content: BaseModel) -> bytes:
+        if self.media_type == MSGPACK_MEDIA_TYPE:
+            return dump_msgpack(content)
+        return content.__pydantic_serializer__.to_json(content)
+
+
+class ListResponse(Response):
+    """
+    列表直出 JSON 响应
+
+    使用模块级预构建的 TypeAdapter 序列化 list[Model], 避免每次请求重新走
+    response_model 的逐项校验.
+
+    使用示例:
+    ```python
+    @router.get("/quotes", response_model=list[QuoteData])
+    async def get_quotes(...) -> Response:
+        return ListResponse(quotes, QUOTE_LIST_ADAPTER)
+    ```
+    """
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        content: list[Any],
+        adapter: TypeAdapter[Any],
+        status_code: int = 200,
+        media_type: str | None = None,
+    ) -> None:
+        self.adapter = adapter
+        super().__init__(content, status_code=status_code, media_type=media_type)
+
+    def render(self, content: list[Any]) -> bytes:
+        if self.media_type == MSGPACK_MEDIA_TYPE:
+            packed: bytes = msgpack.packb(self.adapter.dump_python(content), default=_msgpack_default)
+            return packed
+        return self.adapter.dump_json(content)
+
+
+def _json_fallback(value: Any) -> Any:
+    """to_json 无法识别的类型 (numpy 数组/标量) 转为原生 Python 值"""
+    if isinstance(value, (np.ndarray, np.generic)):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class CoreJSONResponse(JSONResponse):
+    """
+    默认 JSON 响应
+
+    以 pydantic-core 的 Rust 序列化器代替标准库 json.dumps 输出 JSON,
+    原生支持 datetime / Decimal / Enum / BaseModel / dataclass,
+    numpy 数组与标量经 _json_fallback 转换. 作为应用的 default_response_class.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content, fallback=_json_fallback)
+
+
+# ============ msgpack 序列化 ============
+# 浏览器端仍使用 JSON; 服务间调用在请求头声明 Accept: application/msgpack
+# 时改用 msgpack, 编码更快、体积更小.
+
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+
+def _msgpack_default(value: Any) -> Any:
+    """msgpack 无法识别的类型转为原生值 (与 JSON 输出保持一致)"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (np.ndarray, np.generic)):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not msgpack serializable")
+
+
+def dump_msgpack(model: BaseModel) -> bytes:
+    """将模型序列化为 msgpack 字节"""
+    packed: bytes = msgpack.packb(model.model_dump(mode="python"), default=_msgpack_default)
+    return packed
+
+
+def negotiate_media_type(connection: HTTPConnection) -> str:
+    """按 Accept 请求头选择响应格式 (msgpack / JSON), HTTP 与 WebSocket 通用"""
+    if MSGPACK_MEDIA_TYPE in connection.headers.get("accept", ""):
+        return MSGPACK_MEDIA_TYPE
+    return "application/json"
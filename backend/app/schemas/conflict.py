@@ -3,10 +3,13 @@
 PRD 4.6 策略冲突检测
 """
 
-from pydantic import BaseModel, Field
-from typing import Optional, Literal
+from pydantic import BaseModel, ConfigDict, Field, computed_field
+from pydantic.dataclasses import dataclass as pydantic_dataclass
+from typing import NamedTuple, Optional, Literal
+from collections import Counter
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 
 
 class ConflictType(str, Enum):
@@ -43,8 +46,15 @@ class ResolutionAction(str, Enum):
     IGNORE = "ignore"  # 忽略冲突
 
 
-class ConflictingSignal(BaseModel):
+@pydantic_dataclass(
+    slots=True,
+    kw_only=True,
+    config=ConfigDict(defer_build=True),
+)
+class ConflictingSignal:
     """冲突信号"""
+    # 逐条出现在列表响应中, slots 数据类省去每实例 __dict__
+
     strategy_id: str
     strategy_name: str
     signal_id: str
@@ -60,6 +70,8 @@ class ConflictingSignal(BaseModel):
 
 class ConflictDetail(BaseModel):
     """冲突详情"""
+    model_config = ConfigDict(defer_build=True)
+
     conflict_id: str
     conflict_type: ConflictType
     severity: ConflictSeverity
@@ -77,7 +89,7 @@ class ConflictDetail(BaseModel):
     # 建议解决方案
     suggested_resolution: ResolutionAction
     resolution_reason: str = Field(description="建议原因")
-    alternative_resolutions: list[ResolutionAction] = Field(default=[])
+    alternative_resolutions: tuple[ResolutionAction, ...] = ()
 
     # 时间信息
     detected_at: datetime
@@ -99,13 +111,36 @@ class ConflictCheckRequest(BaseModel):
 
 class ConflictCheckResult(BaseModel):
     """冲突检测结果"""
-    total_conflicts: int
-    critical_count: int
-    warning_count: int
-    info_count: int
+    model_config = ConfigDict(defer_build=True)
+
     conflicts: list[ConflictDetail]
     checked_at: datetime
 
+    @cached_property
+    def severity_counts(self) -> Counter[ConflictSeverity]:
+        """各严重程度冲突数 (单次遍历, 结果只读故缓存)"""
+        return Counter(c.severity for c in self.conflicts)
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def total_conflicts(self) -> int:
+        return len(self.conflicts)
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def critical_count(self) -> int:
+        return self.severity_counts[ConflictSeverity.CRITICAL]
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def warning_count(self) -> int:
+        return self.severity_counts[ConflictSeverity.WARNING]
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def info_count(self) -> int:
+        return self.severity_counts[ConflictSeverity.INFO]
+
 
 class ResolveConflictRequest(BaseModel):
     """解决冲突请求"""
@@ -116,91 +151,80 @@ class ResolveConflictRequest(BaseModel):
 
 class ConflictListResponse(BaseModel):
     """冲突列表响应"""
+    model_config = ConfigDict(defer_build=True)
+
     total: int
     pending_count: int
     conflicts: list[ConflictDetail]
 
 
-# 冲突类型配置
-CONFLICT_TYPE_CONFIG = {
-    ConflictType.LOGIC: {
-        "label": "逻辑冲突",
-        "description": "同一股票存在相反的交易信号",
-        "icon": "⚔️",
-        "default_severity": ConflictSeverity.CRITICAL,
-    },
-    ConflictType.EXECUTION: {
-        "label": "执行冲突",
-        "description": "资金或仓位限制导致无法执行",
-        "icon": "💰",
-        "default_severity": ConflictSeverity.WARNING,
-    },
-    ConflictType.TIMEOUT: {
-        "label": "超时冲突",
-        "description": "信号已超过有效期",
-        "icon": "⏰",
-        "default_severity": ConflictSeverity.WARNING,
-    },
-    ConflictType.DUPLICATE: {
-        "label": "重复冲突",
-        "description": "多个策略发出相同的买入信号",
-        "icon": "📋",
-        "default_severity": ConflictSeverity.INFO,
-    },
-}
-
-
-# 严重程度配置
-SEVERITY_CONFIG = {
-    ConflictSeverity.CRITICAL: {
-        "label": "严重",
-        "color": "#ef4444",
-        "bgColor": "bg-red-500/10",
-        "description": "必须处理后才能继续执行",
-    },
-    ConflictSeverity.WARNING: {
-        "label": "警告",
-        "color": "#f59e0b",
-        "bgColor": "bg-yellow-500/10",
-        "description": "建议处理，可选择忽略",
-    },
-    ConflictSeverity.INFO: {
-        "label": "提示",
-        "color": "#3b82f6",
-        "bgColor": "bg-blue-500/10",
-        "description": "仅供参考，无需处理",
-    },
-}
-
-
-# 解决方案配置
-RESOLUTION_CONFIG = {
-    ResolutionAction.EXECUTE_STRATEGY_A: {
-        "label": "执行策略A",
-        "description": "执行第一个策略的信号，取消第二个",
-    },
-    ResolutionAction.EXECUTE_STRATEGY_B: {
-        "label": "执行策略B",
-        "description": "执行第二个策略的信号，取消第一个",
-    },
-    ResolutionAction.EXECUTE_BOTH: {
-        "label": "同时执行",
-        "description": "同时执行两个策略的信号（可能导致对冲）",
-    },
-    ResolutionAction.CANCEL_BOTH: {
-        "label": "全部取消",
-        "description": "取消两个策略的信号，不执行任何交易",
-    },
-    ResolutionAction.REDUCE_POSITION: {
-        "label": "减仓执行",
-        "description": "减少执行数量以满足仓位限制",
-    },
-    ResolutionAction.DELAY_EXECUTION: {
-        "label": "延迟执行",
-        "description": "等待资金到位后再执行",
-    },
-    ResolutionAction.IGNORE: {
-        "label": "忽略",
-        "description": "忽略此冲突，按原计划执行",
-    },
-}
+# ============ 展示配置表 ============
+# 只读元数据以 NamedTuple 记录存放, 表的顺序与枚举成员定义顺序一致,
+# 通过预计算的 {枚举: 下标} 直接索引, 无需内层 dict.
+
+class ConflictTypeInfo(NamedTuple):
+    """冲突类型展示信息"""
+    label: str
+    description: str
+    icon: str
+    default_severity: ConflictSeverity
+
+
+class SeverityInfo(NamedTuple):
+    """严重程度展示信息"""
+    label: str
+    color: str
+    bg_color: str
+    description: str
+
+
+class ResolutionInfo(NamedTuple):
+    """解决方案展示信息"""
+    label: str
+    description: str
+
+
+# 冲突类型配置 (顺序同 ConflictType)
+CONFLICT_TYPE_TABLE: tuple[ConflictTypeInfo, ...] = (
+    ConflictTypeInfo("逻辑冲突", "同一股票存在相反的交易信号", "⚔️", ConflictSeverity.CRITICAL),
+    ConflictTypeInfo("执行冲突", "资金或仓位限制导致无法执行", "💰", ConflictSeverity.WARNING),
+    ConflictTypeInfo("超时冲突", "信号已超过有效期", "⏰", ConflictSeverity.WARNING),
+    ConflictTypeInfo("重复冲突", "多个策略发出相同的买入信号", "📋", ConflictSeverity.INFO),
+)
+
+# 严重程度配置 (顺序同 ConflictSeverity)
+SEVERITY_TABLE: tuple[SeverityInfo, ...] = (
+    SeverityInfo("严重", "#ef4444", "bg-red-500/10", "必须处理后才能继续执行"),
+    SeverityInfo("警告", "#f59e0b", "bg-yellow-500/10", "建议处理，可选择忽略"),
+    SeverityInfo("提示", "#3b82f6", "bg-blue-500/10", "仅供参考，无需处理"),
+)
+
+# 解决方案配置 (顺序同 ResolutionAction)
+RESOLUTION_TABLE: tuple[ResolutionInfo, ...] = (
+    ResolutionInfo("执行策略A", "执行第一个策略的信号，取消第二个"),
+    ResolutionInfo("执行策略B", "执行第二个策略的信号，取消第一个"),
+    ResolutionInfo("同时执行", "同时执行两个策略的信号（可能导致对冲）"),
+    ResolutionInfo("全部取消", "取消两个策略的信号，不执行任何交易"),
+    ResolutionInfo("减仓执行", "减少执行数量以满足仓位限制"),
+    ResolutionInfo("延迟执行", "等待资金到位后再执行"),
+    ResolutionInfo("忽略", "忽略此冲突，按原计划执行"),
+)
+
+_CONFLICT_TYPE_INDEX = {member: i for i, member in enumerate(ConflictType)}
+_SEVERITY_INDEX = {member: i for i, member in enumerate(ConflictSeverity)}
+_RESOLUTION_INDEX = {member: i for i, member in enumerate(ResolutionAction)}
+
+
+def conflict_type_info(conflict_type: ConflictType) -> ConflictTypeInfo:
+    """获取冲突类型展示信息"""
+    return CONFLICT_TYPE_TABLE[_CONFLICT_TYPE_INDEX[conflict_type]]
+
+
+def severity_info(severity: ConflictSeverity) -> SeverityInfo:
+    """获取严重程度展示信息"""
+    return SEVERITY_TABLE[_SEVERITY_INDEX[severity]]
+
+
+def resolution_info(action: ResolutionAction) -> ResolutionInfo:
+    """获取解决方案展示信息"""
+    return RESOLUTION_TABLE[_RESOLUTION_INDEX[action]]
@@ -7,12 +7,14 @@
 - 环境类型
 """
 
+import re
+from dataclasses import dataclass
 from datetime import datetime
-from decimal import Decimal
+from decimal import ROUND_HALF_UP, Decimal
 from enum import Enum
-from typing import Optional
+from typing import Annotated, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, computed_field
 
 
 class DeploymentEnvironment(str, Enum):
@@ -37,10 +39,41 @@ class StrategyType(str, Enum):
     LONG_TERM = "long_term"     # 长线 (>1月)
 
 
+# ============ 金额换算 ============
+
+def to_cents(amount: Decimal | float | int) -> int:
+    """金额 (美元) 转为整数美分, 四舍五入"""
+    return int((Decimal(str(amount)) * 100).to_integral_value(rounding=ROUND_HALF_UP))
+
+
+# ============ 调仓设置校验 ============
+# 模块级共享的预编译正则/取值集合, 所有部署配置复用同一校验器
+
+_REBALANCE_FREQUENCIES = frozenset(("daily", "weekly", "monthly"))
+_REBALANCE_TIME_RE = re.compile(r"^[0-2][0-9]:[0-5][0-9]$")
+
+
+def _check_rebalance_frequency(value: str) -> str:
+    if value not in _REBALANCE_FREQUENCIES:
+        raise ValueError("调仓频率必须为 daily/weekly/monthly")
+    return value
+
+
+def _check_rebalance_time(value: str) -> str:
+    if _REBALANCE_TIME_RE.match(value) is None:
+        raise ValueError("调仓时间格式必须为 HH:MM")
+    return value
+
+
+RebalanceFrequency = Annotated[str, AfterValidator(_check_rebalance_frequency)]
+RebalanceTime = Annotated[str, AfterValidator(_check_rebalance_time)]
+
+
 # ============ 参数范围定义 ============
 
-class ParamRange(BaseModel):
-    """参数范围"""
+@dataclass(slots=True, frozen=True)
+class ParamRange:
+    """参数范围 (只读常量记录, 无需 pydantic 校验)"""
     min_value: float
     max_value: float
     default_value: float
@@ -51,6 +84,8 @@ class ParamRange(BaseModel):
 
 class RiskParams(BaseModel):
     """风控参数"""
+    model_config = ConfigDict(defer_build=True)
+
     stop_loss: float = Field(-0.05, ge=-0.50, le=-0.01, description="止损比例")
     take_profit: float = Field(0.10, ge=0.02, le=1.0, description="止盈比例")
     max_position_pct: float = Field(0.10, ge=0.01, le=0.50, description="单只最大仓位")
@@ -59,6 +94,8 @@ class RiskParams(BaseModel):
 
 class CapitalConfig(BaseModel):
     """资金配置"""
+    model_config = ConfigDict(defer_build=True)
+
     total_capital: Decimal = Field(..., gt=0, description="总资金")
     initial_position_pct: float = Field(0.80, ge=0.10, le=1.0, description="初始仓位比例")
     reserve_cash_pct: float = Field(0.20, ge=0.0, le=0.50, description="预留现金比例")
@@ -68,6 +105,8 @@ class CapitalConfig(BaseModel):
 
 class DeploymentConfig(BaseModel):
     """部署配置"""
+    model_config = ConfigDict(defer_build=True)
+
     # 基础信息
     strategy_id: str
     deployment_name: str = Field(..., min_length=1, max_length=100)
@@ -84,8 +123,8 @@ class DeploymentConfig(BaseModel):
     capital_config: CapitalConfig
 
     # 调仓设置
-    rebalance_frequency: str = Field("daily", pattern="^(daily|weekly|monthly)$")
-    rebalance_time: str = Field("09:35", pattern="^[0-2][0-9]:[0-5][0-9]$")
+    rebalance_frequency: RebalanceFrequency = "daily"
+    rebalance_time: RebalanceTime = "09:35"
 
 
 class DeploymentCreate(BaseModel):
@@ -116,8 +155,8 @@ class Deployment(BaseModel):
     # 配置
     config: DeploymentConfig
 
-    # 运行时数据
-    current_pnl: Decimal = Decimal("0")
+    # 运行时数据 (盈亏以整数美分存储, 对外仍输出 Decimal 金额)
+    current_pnl_cents: int = Field(0, exclude=True)
     current_pnl_pct: float = 0
     total_trades: int = 0
     win_rate: float = 0
@@ -127,12 +166,19 @@ class Deployment(BaseModel):
     updated_at: datetime
     started_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def current_pnl(self) -> Decimal:
+        """当前盈亏"""
+        return Decimal(self.current_pnl_cents) / 100
+
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 class DeploymentListResponse(BaseModel):
     """部署列表响应"""
+    model_config = ConfigDict(defer_build=True)
+
     total: int
     items: list[Deployment]
 
@@ -149,11 +195,15 @@ class ParamLimits(BaseModel):
     max_position_pct_range: ParamRange
     max_drawdown_range: ParamRange
 
-    # 资金范围
-    min_capital: Decimal = Field(Decimal("1000"), description="最低资金要求")
+    # 资金范围 (整数美分)
+    min_capital_cents: int = Field(100_000, exclude=True)
 
     # 股票池
     available_symbols: list[str] = Field(default_factory=list)
 
-    class Config:
-        from_attributes = True
+    @computed_field(description="最低资金要求")  # type: ignore[prop-decorator]
+    @property
+    def min_capital(self) -> Decimal:
+        return Decimal(self.min_capital_cents) / 100
+
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
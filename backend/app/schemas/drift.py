@@ -3,8 +3,10 @@
 PRD 4.8 实盘vs回测差异监控
 """
 
-from pydantic import BaseModel, Field
-from typing import Optional, Literal
+from dataclasses import dataclass
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic.dataclasses import dataclass as pydantic_dataclass
+from typing import Annotated, NamedTuple, Optional, Literal
 from datetime import datetime, date
 from enum import Enum
 
@@ -26,8 +28,15 @@ class DriftSeverity(str, Enum):
     CRITICAL = "critical"   # 红色严重
 
 
-class DriftMetric(BaseModel):
+@pydantic_dataclass(
+    slots=True,
+    kw_only=True,
+    config=ConfigDict(defer_build=True),
+)
+class DriftMetric:
     """单个漂移指标"""
+    # 逐条出现在列表响应中, slots 数据类省去每实例 __dict__
+
     metric_type: DriftMetricType
     backtest_value: float           # 回测值
     live_value: float               # 实盘值
@@ -41,6 +50,8 @@ class DriftMetric(BaseModel):
 
 class StrategyDriftReport(BaseModel):
     """策略漂移报告"""
+    model_config = ConfigDict(defer_build=True)
+
     report_id: str
     strategy_id: str
     strategy_name: str
@@ -68,25 +79,28 @@ class StrategyDriftReport(BaseModel):
     is_acknowledged: bool = Field(default=False, description="用户是否已确认")
 
 
-class DriftThresholds(BaseModel):
+@dataclass(slots=True, frozen=True)
+class DriftThresholds:
     """
     漂移阈值配置 (PRD 附录C)
+
+    只读配置记录, 服务层共享同一实例
     """
     # 黄色预警阈值
-    return_warning: float = Field(default=0.10, description="收益差异 > 10%")
-    win_rate_warning: float = Field(default=0.05, description="胜率差异 > 5%")
-    turnover_warning: float = Field(default=0.20, description="换手率差异 > 20%")
-    slippage_warning: float = Field(default=0.30, description="滑点差异 > 30%")
-    max_drawdown_warning: float = Field(default=0.15, description="最大回撤差异 > 15%")
-    hold_period_warning: float = Field(default=0.25, description="持仓时间差异 > 25%")
+    return_warning: Annotated[float, Field(description="收益差异 > 10%")] = 0.10
+    win_rate_warning: Annotated[float, Field(description="胜率差异 > 5%")] = 0.05
+    turnover_warning: Annotated[float, Field(description="换手率差异 > 20%")] = 0.20
+    slippage_warning: Annotated[float, Field(description="滑点差异 > 30%")] = 0.30
+    max_drawdown_warning: Annotated[float, Field(description="最大回撤差异 > 15%")] = 0.15
+    hold_period_warning: Annotated[float, Field(description="持仓时间差异 > 25%")] = 0.25
 
     # 红色严重阈值
-    return_critical: float = Field(default=0.20, description="收益差异 > 20%")
-    win_rate_critical: float = Field(default=0.10, description="胜率差异 > 10%")
-    turnover_critical: float = Field(default=0.35, description="换手率差异 > 35%")
-    slippage_critical: float = Field(default=0.50, description="滑点差异 > 50%")
-    max_drawdown_critical: float = Field(default=0.25, description="最大回撤差异 > 25%")
-    hold_period_critical: float = Field(default=0.40, description="持仓时间差异 > 40%")
+    return_critical: Annotated[float, Field(description="收益差异 > 20%")] = 0.20
+    win_rate_critical: Annotated[float, Field(description="胜率差异 > 10%")] = 0.10
+    turnover_critical: Annotated[float, Field(description="换手率差异 > 35%")] = 0.35
+    slippage_critical: Annotated[float, Field(description="滑点差异 > 50%")] = 0.50
+    max_drawdown_critical: Annotated[float, Field(description="最大回撤差异 > 25%")] = 0.25
+    hold_period_critical: Annotated[float, Field(description="持仓时间差异 > 40%")] = 0.40
 
 
 class DriftCheckRequest(BaseModel):
@@ -98,6 +112,8 @@ class DriftCheckRequest(BaseModel):
 
 class DriftCheckResponse(BaseModel):
     """漂移检查响应"""
+    model_config = ConfigDict(defer_build=True)
+
     success: bool
     message: str
     report: Optional[StrategyDriftReport] = None
@@ -105,6 +121,8 @@ class DriftCheckResponse(BaseModel):
 
 class DriftReportListResponse(BaseModel):
     """漂移报告列表响应"""
+    model_config = ConfigDict(defer_build=True)
+
     total: int
     reports: list[StrategyDriftReport]
 
@@ -114,58 +132,50 @@ class DriftAcknowledgeRequest(BaseModel):
     notes: Optional[str] = Field(default=None, description="确认备注")
 
 
-# 指标显示配置
-DRIFT_METRIC_CONFIG = {
-    DriftMetricType.RETURN: {
-        "label": "收益率",
-        "icon": "📈",
-        "format": "percent",
-    },
-    DriftMetricType.WIN_RATE: {
-        "label": "胜率",
-        "icon": "🎯",
-        "format": "percent",
-    },
-    DriftMetricType.TURNOVER: {
-        "label": "换手率",
-        "icon": "🔄",
-        "format": "percent",
-    },
-    DriftMetricType.SLIPPAGE: {
-        "label": "滑点",
-        "icon": "💸",
-        "format": "percent",
-    },
-    DriftMetricType.MAX_DRAWDOWN: {
-        "label": "最大回撤",
-        "icon": "📉",
-        "format": "percent",
-    },
-    DriftMetricType.HOLD_PERIOD: {
-        "label": "持仓天数",
-        "icon": "📅",
-        "format": "days",
-    },
-}
-
-# 严重程度配置
-DRIFT_SEVERITY_CONFIG = {
-    DriftSeverity.NORMAL: {
-        "icon": "✅",
-        "color": "#22c55e",
-        "text": "正常",
-        "bg_color": "bg-green-500/10",
-    },
-    DriftSeverity.WARNING: {
-        "icon": "⚠️",
-        "color": "#eab308",
-        "text": "需关注",
-        "bg_color": "bg-yellow-500/10",
-    },
-    DriftSeverity.CRITICAL: {
-        "icon": "🔴",
-        "color": "#ef4444",
-        "text": "异常",
-        "bg_color": "bg-red-500/10",
-    },
-}
+# ============ 展示配置表 ============
+# 只读元数据以 NamedTuple 记录存放, 表的顺序与枚举成员定义顺序一致.
+
+class DriftMetricInfo(NamedTuple):
+    """漂移指标展示信息"""
+    label: str
+    icon: str
+    format: str
+
+
+class DriftSeverityInfo(NamedTuple):
+    """漂移严重程度展示信息"""
+    icon: str
+    color: str
+    text: str
+    bg_color: str
+
+
+# 指标显示配置 (顺序同 DriftMetricType)
+DRIFT_METRIC_TABLE: tuple[DriftMetricInfo, ...] = (
+    DriftMetricInfo("收益率", "📈", "percent"),
+    DriftMetricInfo("胜率", "🎯", "percent"),
+    DriftMetricInfo("换手率", "🔄", "percent"),
+    DriftMetricInfo("滑点", "💸", "percent"),
+    DriftMetricInfo("最大回撤", "📉", "percent"),
+    DriftMetricInfo("持仓天数", "📅", "days"),
+)
+
+# 严重程度配置 (顺序同 DriftSeverity)
+DRIFT_SEVERITY_TABLE: tuple[DriftSeverityInfo, ...] = (
+    DriftSeverityInfo("✅", "#22c55e", "正常", "bg-green-500/10"),
+    DriftSeverityInfo("⚠️", "#eab308", "需关注", "bg-yellow-500/10"),
+    DriftSeverityInfo("🔴", "#ef4444", "异常", "bg-red-500/10"),
+)
+
+_DRIFT_METRIC_INDEX = {member: i for i, member in enumerate(DriftMetricType)}
+_DRIFT_SEVERITY_INDEX = {member: i for i, member in enumerate(DriftSeverity)}
+
+
+def drift_metric_info(metric_type: DriftMetricType) -> DriftMetricInfo:
+    """获取漂移指标展示信息"""
+    return DRIFT_METRIC_TABLE[_DRIFT_METRIC_INDEX[metric_type]]
+
+
+def drift_severity_info(severity: DriftSeverity) -> DriftSeverityInfo:
+    """获取漂移严重程度展示信息"""
+    return DRIFT_SEVERITY_TABLE[_DRIFT_SEVERITY_INDEX[severity]]
@@ -3,11 +3,18 @@
 PRD 4.3 因子有效性验证
 """
 
-from pydantic import BaseModel, Field
-from typing import Optional
+from dataclasses import dataclass, field
+from pydantic import (
+    BaseModel, ConfigDict, Field, PlainSerializer, PlainValidator, TypeAdapter,
+    WithJsonSchema,
+)
+from pydantic.dataclasses import dataclass as pydantic_dataclass
+from typing import Annotated, NamedTuple, Optional
 from datetime import datetime, date
 from enum import Enum
 
+import numpy as np
+
 
 class EffectivenessLevel(str, Enum):
     """因子有效性等级"""
@@ -17,27 +24,59 @@ class EffectivenessLevel(str, Enum):
     INEFFECTIVE = "ineffective" # 无效
 
 
-class ICStatistics(BaseModel):
-    """IC/IR 统计"""
-    ic_mean: float = Field(description="IC均值")
-    ic_std: float = Field(description="IC标准差")
-    ic_ir: float = Field(description="IC_IR = IC均值/IC标准差")
-    ic_positive_ratio: float = Field(description="IC为正的比例")
-    ic_series: list[float] = Field(default=[], description="IC时序数据")
-    ic_dates: list[str] = Field(default=[], description="IC日期")
+# ============ 时序数组类型 ============
+# 时序以连续 ndarray 存放, 仅在序列化时转为 JSON 数组
+
+FloatSeries = Annotated[
+    np.ndarray,
+    PlainValidator(lambda v: np.asarray(v, dtype=np.float64)),
+    PlainSerializer(lambda v: v.tolist(), return_type=list[float]),
+    WithJsonSchema({"type": "array", "items": {"type": "number"}}),
+]
 
+# 月度日期 (datetime64[M]), 对外输出 "YYYY-MM"
+MonthSeries = Annotated[
+    np.ndarray,
+    PlainValidator(lambda v: np.asarray(v, dtype="datetime64[M]")),
+    PlainSerializer(
+        lambda v: np.datetime_as_string(v, unit="M").tolist(), return_type=list[str]
+    ),
+    WithJsonSchema({"type": "array", "items": {"type": "string"}}),
+]
 
-class ReturnStatistics(BaseModel):
+
+# ndarray 字段不支持 == 逐元素比较为单个布尔值, 不生成 __eq__
+@dataclass(slots=True, kw_only=True, eq=False)
+class ICStatistics:
+    """IC/IR 统计"""
+    ic_mean: Annotated[float, Field(description="IC均值")]
+    ic_std: Annotated[float, Field(description="IC标准差")]
+    ic_ir: Annotated[float, Field(description="IC_IR = IC均值/IC标准差")]
+    ic_positive_ratio: Annotated[float, Field(description="IC为正的比例")]
+    ic_series: Annotated[FloatSeries, Field(description="IC时序数据")] = field(
+        default_factory=lambda: np.empty(0, dtype=np.float64)
+    )
+    ic_dates: Annotated[MonthSeries, Field(description="IC日期")] = field(
+        default_factory=lambda: np.empty(0, dtype="datetime64[M]")
+    )
+
+
+@dataclass(slots=True, kw_only=True)
+class ReturnStatistics:
     """分组收益统计"""
-    group_returns: list[float] = Field(description="各分组年化收益率")
-    group_labels: list[str] = Field(default=["第1组", "第2组", "第3组", "第4组", "第5组"])
-    long_short_spread: float = Field(description="多空收益差 (第1组-第5组)")
-    top_group_sharpe: float = Field(description="头部组夏普比率")
-    bottom_group_sharpe: float = Field(description="尾部组夏普比率")
+    group_returns: Annotated[list[float], Field(description="各分组年化收益率")]
+    group_labels: list[str] = field(
+        default_factory=lambda: ["第1组", "第2组", "第3组", "第4组", "第5组"]
+    )
+    long_short_spread: Annotated[float, Field(description="多空收益差 (第1组-第5组)")]
+    top_group_sharpe: Annotated[float, Field(description="头部组夏普比率")]
+    bottom_group_sharpe: Annotated[float, Field(description="尾部组夏普比率")]
 
 
 class FactorValidationResult(BaseModel):
     """因子验证结果"""
+    model_config = ConfigDict(defer_build=True)
+
     factor_id: str
     factor_name: str
     factor_category: str = Field(description="因子类别 (价值/成长/质量/动量/波动)")
@@ -68,6 +107,8 @@ class FactorValidationResult(BaseModel):
 
 class FactorValidationRequest(BaseModel):
     """因子验证请求"""
+    model_config = ConfigDict(defer_build=True)
+
     factor_id: str
     start_date: Optional[date] = None
     end_date: Optional[date] = None
@@ -83,14 +124,23 @@ class FactorCompareRequest(BaseModel):
 
 class FactorCompareResult(BaseModel):
     """因子对比结果"""
+    model_config = ConfigDict(defer_build=True)
+
     factors: list[FactorValidationResult]
     correlation_matrix: list[list[float]] = Field(description="因子相关性矩阵")
     best_combination: list[str] = Field(description="最佳因子组合")
     combination_score: float = Field(description="组合有效性评分")
 
 
-class FactorSuggestion(BaseModel):
+@pydantic_dataclass(
+    slots=True,
+    kw_only=True,
+    config=ConfigDict(defer_build=True),
+)
+class FactorSuggestion:
     """因子组合建议"""
+    # 逐条出现在列表响应中, slots 数据类省去每实例 __dict__
+
     factor_id: str
     factor_name: str
     suggestion_reason: str
@@ -134,30 +184,32 @@ FACTOR_CATEGORY_CONFIG = {
     },
 }
 
-# 有效性等级配置
-EFFECTIVENESS_LEVEL_CONFIG = {
-    EffectivenessLevel.STRONG: {
-        "label": "强",
-        "stars": 5,
-        "color": "#22c55e",
-        "description": "该因子表现优异，可作为主要选股依据",
-    },
-    EffectivenessLevel.MEDIUM: {
-        "label": "中",
-        "stars": 3,
-        "color": "#3b82f6",
-        "description": "该因子表现中等，建议与其他因子组合使用",
-    },
-    EffectivenessLevel.WEAK: {
-        "label": "弱",
-        "stars": 1,
-        "color": "#eab308",
-        "description": "该因子表现较弱，仅作为辅助参考",
-    },
-    EffectivenessLevel.INEFFECTIVE: {
-        "label": "无效",
-        "stars": 0,
-        "color": "#ef4444",
-        "description": "该因子无明显选股能力，不建议使用",
-    },
-}
+# 有效性等级展示信息
+class EffectivenessLevelInfo(NamedTuple):
+    """有效性等级展示信息"""
+    label: str
+    stars: int
+    color: str
+    description: str
+
+
+# 有效性等级配置 (顺序同 EffectivenessLevel)
+EFFECTIVENESS_LEVEL_TABLE: tuple[EffectivenessLevelInfo, ...] = (
+    EffectivenessLevelInfo("强", 5, "#22c55e", "该因子表现优异，可作为主要选股依据"),
+    EffectivenessLevelInfo("中", 3, "#3b82f6", "该因子表现中等，建议与其他因子组合使用"),
+    EffectivenessLevelInfo("弱", 1, "#eab308", "该因子表现较弱，仅作为辅助参考"),
+    EffectivenessLevelInfo("无效", 0, "#ef4444", "该因子无明显选股能力，不建议使用"),
+)
+
+_EFFECTIVENESS_LEVEL_INDEX = {member: i for i, member in enumerate(EffectivenessLevel)}
+
+
+def effectiveness_level_info(level: EffectivenessLevel) -> EffectivenessLevelInfo:
+    """获取有效性等级展示信息"""
+    return EFFECTIVENESS_LEVEL_TABLE[_EFFECTIVENESS_LEVEL_INDEX[level]]
+
+
+# 因子组合建议列表序列化器
+FACTOR_SUGGESTION_LIST_ADAPTER = TypeAdapter(
+    list[FactorSuggestion], config=ConfigDict(defer_build=True)
+)
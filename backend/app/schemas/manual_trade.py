@@ -6,7 +6,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
 class OrderSide(str, Enum):
@@ -31,16 +31,24 @@ class OrderStatus(str, Enum):
     PARTIAL = "partial"
 
 
+# 订单字段取值 (上述枚举保留给服务层做常量引用)
+OrderSideLiteral = Literal["buy", "sell"]
+OrderTypeLiteral = Literal["market", "limit", "stop"]
+OrderStatusLiteral = Literal["pending", "filled", "cancelled", "rejected", "partial"]
+
+
 class ManualTradeOrder(BaseModel):
     """手动交易订单"""
+    model_config = ConfigDict(defer_build=True)
+
     order_id: str
     user_id: str
     account_id: str
     strategy_id: Optional[str] = None  # 可选归属策略
 
     symbol: str
-    side: OrderSide
-    order_type: OrderType
+    side: OrderSideLiteral
+    order_type: OrderTypeLiteral
     quantity: int
     limit_price: Optional[float] = None
     stop_price: Optional[float] = None
@@ -49,7 +57,7 @@ class ManualTradeOrder(BaseModel):
     take_profit: Optional[float] = None
     stop_loss: Optional[float] = None
 
-    status: OrderStatus = OrderStatus.PENDING
+    status: OrderStatusLiteral = "pending"
     filled_quantity: int = 0
     filled_price: Optional[float] = None
 
@@ -61,15 +69,12 @@ class ManualTradeOrder(BaseModel):
     filled_at: Optional[datetime] = None
     cancelled_at: Optional[datetime] = None
 
-    class Config:
-        use_enum_values = True
-
 
 class PlaceOrderRequest(BaseModel):
     """下单请求"""
     symbol: str = Field(..., description="股票代码")
-    side: Literal["buy", "sell"] = Field(..., description="买/卖方向")
-    order_type: Literal["market", "limit", "stop"] = Field(
+    side: OrderSideLiteral = Field(..., description="买/卖方向")
+    order_type: OrderTypeLiteral = Field(
         default="market", description="订单类型"
     )
     quantity: int = Field(..., ge=1, description="数量")
@@ -82,6 +87,8 @@ class PlaceOrderRequest(BaseModel):
 
 class PlaceOrderResponse(BaseModel):
     """下单响应"""
+    model_config = ConfigDict(defer_build=True)
+
     success: bool
     order: Optional[ManualTradeOrder] = None
     error: Optional[str] = None
@@ -90,12 +97,16 @@ class PlaceOrderResponse(BaseModel):
 
 class CancelOrderResponse(BaseModel):
     """取消订单响应"""
+    model_config = ConfigDict(defer_build=True)
+
     success: bool
     message: str
 
 
 class QuoteData(BaseModel):
     """报价数据"""
+    model_config = ConfigDict(defer_build=True)
+
     symbol: str
     bid: float
     ask: float
@@ -112,6 +123,8 @@ class QuoteData(BaseModel):
 
 class OrderListRequest(BaseModel):
     """订单列表请求"""
+    model_config = ConfigDict(defer_build=True)
+
     status: Optional[str] = None
     symbol: Optional[str] = None
     strategy_id: Optional[str] = None
@@ -121,6 +134,14 @@ class OrderListRequest(BaseModel):
 
 class OrderListResponse(BaseModel):
     """订单列表响应"""
+    model_config = ConfigDict(defer_build=True)
+
     orders: list[ManualTradeOrder]
     total: int
     has_more: bool
+
+
+# 批量报价列表序列化器
+QUOTE_LIST_ADAPTER = TypeAdapter(
+    list[QuoteData], config=ConfigDict(defer_build=True)
+)
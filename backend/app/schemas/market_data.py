@@ -8,11 +8,21 @@ Phase 11: \u6570\u636e\u5c42\u5347\u7ea7 - \u5e02\u573a\u6570\u636e Pydantic Sch
 - \u6570\u636e\u8d28\u91cf\u6a21\u578b
 """
 
+import sys
+import warnings
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Any
+from functools import lru_cache
+from typing import Annotated, Any, Literal
 
-from pydantic import BaseModel, Field
+import numpy as np
+from pydantic import (
+    AfterValidator, BaseModel, ConfigDict, Field, PlainSerializer, PlainValidator,
+    TypeAdapter, WithJsonSchema,
+)
+
+from app.schemas.common import HOT_CONFIG, DateRangeRequest
 
 
 # ============ \u679a\u4e3e\u7c7b\u578b ============
@@ -74,21 +84,45 @@ class IntradayFactorType(str, Enum):
     ORDER_IMBALANCE = "order_imbalance"
 
 
+# \u80a1\u7968\u4ee3\u7801\u5728\u6279\u91cf\u54cd\u5e94\u4e2d\u5927\u91cf\u91cd\u590d, \u6821\u9a8c\u65f6 intern \u4e3a\u540c\u4e00\u5b57\u7b26\u4e32\u5bf9\u8c61
+InternedStr = Annotated[str, AfterValidator(sys.intern)]
+
+# \u6570\u636e\u8d28\u91cf\u95ee\u9898\u4e25\u91cd\u7a0b\u5ea6
+SeverityLiteral = Literal["low", "medium", "high"]
+
+
 # ============ K\u7ebf\u6570\u636e\u6a21\u578b ============
+# K\u7ebf/\u62a5\u4ef7/\u6210\u4ea4\u5728\u5217\u8868\u4e2d\u5927\u91cf\u521b\u5efa, \u4ee5\u53ea\u8bfb slots \u6570\u636e\u7c7b\u5b58\u653e;
+# \u4e0d\u53d8\u91cf\u7531 validate() \u5728\u6570\u636e\u5165\u53e3\u96c6\u4e2d\u6821\u9a8c\u4e00\u6b21, symbol \u7531\u6570\u636e\u6e90\u5165\u53e3\u7edf\u4e00 intern
 
-class OHLCVBar(BaseModel):
-    """OHLCV K\u7ebf\u6570\u636e"""
-    symbol: str
-    timestamp: datetime
+@dataclass(slots=True, frozen=True, kw_only=True)
+class OHLCV:
+    """OHLCV \u4ef7\u683c/\u6210\u4ea4\u91cf\u5b57\u6bb5 (K\u7ebf\u7c7b\u5171\u7528)"""
     open: float
     high: float
     low: float
     close: float
     volume: float
+
+    def validate(self) -> None:
+        """\u6821\u9a8cK\u7ebf\u4e0d\u53d8\u91cf: low <= min(open, close) <= max(open, close) <= high, \u6210\u4ea4\u91cf\u975e\u8d1f"""
+        # \u9010\u9879\u6bd4\u8f83\u800c\u975e min/max: \u4efb\u4e00\u503c\u4e3a NaN \u65f6\u6bd4\u8f83\u4e0d\u6210\u7acb, \u574f\u503c\u4e0d\u4f1a\u88ab min/max \u541e\u6389
+        if not (self.low <= self.open <= self.high and self.low <= self.close <= self.high):
+            raise ValueError(f"{self!r}: OHLC \u4ef7\u683c\u5173\u7cfb\u4e0d\u4e00\u81f4")
+        if not self.volume >= 0:
+            raise ValueError(f"{self!r}: \u6210\u4ea4\u91cf\u4e3a\u8d1f")
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class OHLCVBar(OHLCV):
+    """OHLCV K\u7ebf\u6570\u636e"""
+    symbol: str
+    timestamp: datetime
     vwap: float | None = None
     trades: int | None = None
 
 
+@dataclass(slots=True, frozen=True, kw_only=True)
 class MinuteBar(OHLCVBar):
     """\u5206\u949f\u7ea7K\u7ebf"""
     frequency: DataFrequency = DataFrequency.MIN_1
@@ -100,6 +134,7 @@ class MinuteBar(OHLCVBar):
     day_volume: float | None = None
 
 
+@dataclass(slots=True, frozen=True, kw_only=True)
 class DailyBar(OHLCVBar):
     """\u65e5\u7ebfK\u7ebf"""
     adj_close: float | None = None
@@ -109,7 +144,8 @@ class DailyBar(OHLCVBar):
 
 # ============ \u5b9e\u65f6\u884c\u60c5\u6a21\u578b ============
 
-class Quote(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class Quote:
     """\u5b9e\u65f6\u62a5\u4ef7"""
     symbol: str
     timestamp: datetime
@@ -122,7 +158,8 @@ class Quote(BaseModel):
     volume: float
 
 
-class Trade(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class Trade:
     """\u5b9e\u65f6\u6210\u4ea4"""
     symbol: str
     timestamp: datetime
@@ -134,7 +171,9 @@ class Trade(BaseModel):
 
 class MarketSnapshot(BaseModel):
     """\u5e02\u573a\u5feb\u7167"""
-    symbol: str
+    model_config = HOT_CONFIG
+
+    symbol: InternedStr
     timestamp: datetime
 
     # \u4ef7\u683c
@@ -166,6 +205,8 @@ class MarketSnapshot(BaseModel):
 
 class IntradayFactorDefinition(BaseModel):
     """\u65e5\u5185\u56e0\u5b50\u5b9a\u4e49"""
+    model_config = ConfigDict(defer_build=True)
+
     id: IntradayFactorType
     name: str
     description: str
@@ -177,7 +218,9 @@ class IntradayFactorDefinition(BaseModel):
 
 class IntradayFactorValue(BaseModel):
     """\u65e5\u5185\u56e0\u5b50\u503c"""
-    symbol: str
+    model_config = HOT_CONFIG
+
+    symbol: InternedStr
     timestamp: datetime
     factor_id: IntradayFactorType
     value: float
@@ -187,15 +230,79 @@ class IntradayFactorValue(BaseModel):
 
 class IntradayFactorSnapshot(BaseModel):
     """\u65e5\u5185\u56e0\u5b50\u5feb\u7167"""
+    model_config = ConfigDict(defer_build=True)
+
     symbol: str
     timestamp: datetime
     factors: dict[str, float]
 
 
+# \u6a2a\u622a\u9762\u56e0\u5b50\u77e9\u9635: (\u80a1\u7968\u6570, \u56e0\u5b50\u6570) \u8fde\u7eed float64 \u6570\u7ec4, \u7f3a\u5931\u503c\u4e3a NaN,
+# \u5e8f\u5217\u5316\u65f6\u8f6c\u4e3a\u4e8c\u7ef4 JSON \u6570\u7ec4 (NaN \u8f93\u51fa\u4e3a null)
+FactorMatrix = Annotated[
+    np.ndarray,
+    PlainValidator(lambda v: np.asarray(v, dtype=np.float64)),
+    PlainSerializer(lambda v: v.tolist(), return_type=list[list[float]]),
+    WithJsonSchema({
+        "type": "array",
+        "items": {"type": "array", "items": {"type": ["number", "null"]}},
+    }),
+]
+
+
+class IntradayFactorMatrix(BaseModel):
+    """\u65e5\u5185\u56e0\u5b50\u77e9\u9635 (\u6309\u5217\u5b58\u653e, \u5217\u987a\u5e8f\u56fa\u5b9a\u4e3a FACTOR_ORDER)"""
+    model_config = ConfigDict(defer_build=True)
+
+    symbols: list[str]
+    timestamp: datetime
+    factor_names: tuple[str, ...] = Field(default_factory=lambda: FACTOR_ORDER)
+    values: FactorMatrix
+
+    @classmethod
+    def from_snapshots(
+        cls,
+        snapshots: list[IntradayFactorSnapshot],
+        timestamp: datetime,
+    ) -> "IntradayFactorMatrix":
+        """\u7531\u5355\u80a1\u5feb\u7167\u6c47\u603b\u4e3a\u77e9\u9635, \u672a\u8ba1\u7b97\u7684\u56e0\u5b50\u586b NaN"""
+        values = np.full((len(snapshots), len(FACTOR_ORDER)), np.nan)
+        for row, snapshot in zip(values, snapshots, strict=True):
+            for factor_id, value in snapshot.factors.items():
+                row[FACTOR_INDEX[factor_id]] = value
+
+        return cls.model_construct(
+            symbols=[s.symbol for s in snapshots],
+            timestamp=timestamp,
+            factor_names=FACTOR_ORDER,
+            values=values,
+        )
+
+    def zscores(self) -> np.ndarray:
+        """\u5404\u56e0\u5b50\u6a2a\u622a\u9762 z-score (\u5ffd\u7565 NaN, \u96f6\u6807\u51c6\u5dee\u7684\u5217\u4e3a NaN)"""
+        # \u6574\u5217\u7f3a\u5931\u65f6 nanmean/nanstd \u544a\u8b66\u5e76\u8fd4\u56de NaN, \u7ed3\u679c\u5373\u4e3a\u6240\u9700
+        with warnings.catch_warnings(action="ignore", category=RuntimeWarning):
+            mean = np.nanmean(self.values, axis=0)
+            std = np.nanstd(self.values, axis=0)
+            scores: np.ndarray = (self.values - mean) / np.where(std > 0, std, np.nan)
+            return scores
+
+    def percentiles(self) -> np.ndarray:
+        """\u5404\u56e0\u5b50\u6a2a\u622a\u9762\u767e\u5206\u4f4d (0-1, NaN \u4e0d\u53c2\u4e0e\u6392\u540d)"""
+        valid = ~np.isnan(self.values)
+        # NaN \u6392\u5728\u672b\u5c3e, \u524d count \u4e2a\u5373\u4e3a\u6709\u6548\u503c\u7684\u5347\u5e8f\u540d\u6b21
+        ranks = self.values.argsort(axis=0).argsort(axis=0) + 1.0
+        count = valid.sum(axis=0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(valid, ranks / count, np.nan)
+
+
 # ============ \u6570\u636e\u6e90\u6a21\u578b ============
 
 class DataSourceCapabilities(BaseModel):
     """\u6570\u636e\u6e90\u80fd\u529b"""
+    model_config = ConfigDict(defer_build=True)
+
     realtime: bool = False
     historical: bool = True
     intraday: bool = False
@@ -204,6 +311,8 @@ class DataSourceCapabilities(BaseModel):
 
 class DataSourceConfig(BaseModel):
     """\u6570\u636e\u6e90\u914d\u7f6e"""
+    model_config = ConfigDict(defer_build=True)
+
     source: DataSource
     api_key: str | None = None
     base_url: str | None = None
@@ -215,6 +324,8 @@ class DataSourceConfig(BaseModel):
 
 class DataSourceInfo(BaseModel):
     """\u6570\u636e\u6e90\u72b6\u6001\u4fe1\u606f"""
+    model_config = ConfigDict(defer_build=True)
+
     source: DataSource
     status: DataSourceStatus
     last_sync: datetime | None = None
@@ -226,12 +337,10 @@ class DataSourceInfo(BaseModel):
 
 # ============ \u6570\u636e\u8bf7\u6c42/\u54cd\u5e94\u6a21\u578b ============
 
-class HistoricalDataRequest(BaseModel):
-    """\u5386\u53f2\u6570\u636e\u8bf7\u6c42"""
-    symbols: list[str]
+class HistoricalDataRequest(DateRangeRequest):
+    """\u5386\u53f2\u6570\u636e\u8bf7\u6c42 (\u8d77\u6b62\u65e5\u671f\u6309 ISO \u65e5\u671f\u89e3\u6790\u5e76\u6821\u9a8c\u8303\u56f4)"""
+    symbols: tuple[str, ...]
     frequency: DataFrequency = DataFrequency.DAY_1
-    start_date: str
-    end_date: str
     adjusted_price: bool = True
     include_pre_post: bool = False
     data_source: DataSource | None = None
@@ -239,6 +348,8 @@ class HistoricalDataRequest(BaseModel):
 
 class HistoricalDataResponse(BaseModel):
     """\u5386\u53f2\u6570\u636e\u54cd\u5e94"""
+    model_config = ConfigDict(defer_build=True)
+
     symbol: str
     frequency: DataFrequency
     bars: list[OHLCVBar]
@@ -248,14 +359,18 @@ class HistoricalDataResponse(BaseModel):
 
 class StreamSubscription(BaseModel):
     """\u5b9e\u65f6\u8ba2\u9605\u8bf7\u6c42"""
-    symbols: list[str]
-    data_types: list[str] = Field(default_factory=lambda: ["quotes", "trades"])
+    model_config = ConfigDict(defer_build=True)
+
+    symbols: tuple[str, ...]
+    data_types: tuple[str, ...] = ("quotes", "trades")
     frequency: DataFrequency | None = None
 
 
 class SymbolSyncStatus(BaseModel):
     """\u5355\u4e2a\u80a1\u7968\u540c\u6b65\u72b6\u6001"""
-    symbol: str
+    model_config = ConfigDict(defer_build=True)
+
+    symbol: InternedStr
     last_sync_time: datetime | None
     oldest_data: datetime | None
     newest_data: datetime | None
@@ -269,11 +384,13 @@ class SymbolSyncStatus(BaseModel):
 
 class DataQualityIssue(BaseModel):
     """\u6570\u636e\u8d28\u91cf\u95ee\u9898"""
+    model_config = ConfigDict(defer_build=True)
+
     id: str
     symbol: str
     timestamp: datetime
     issue_type: DataQualityIssueType
-    severity: str = Field(..., pattern="^(low|medium|high)$")
+    severity: SeverityLiteral
     description: str
     affected_fields: list[str] = Field(default_factory=list)
     resolved: bool = False
@@ -282,12 +399,14 @@ class DataQualityIssue(BaseModel):
 
 class DataQualityReport(BaseModel):
     """\u6570\u636e\u8d28\u91cf\u62a5\u544a"""
+    model_config = ConfigDict(defer_build=True)
+
     report_date: datetime
     symbols_checked: int
     bars_checked: int
     issues_found: int
     issues_by_type: dict[str, int] = Field(default_factory=dict)
-    issues_by_severity: dict[str, int] = Field(default_factory=dict)
+    issues_by_severity: dict[SeverityLiteral, int] = Field(default_factory=dict)
     overall_score: float = Field(..., ge=0, le=100)
     issues: list[DataQualityIssue] = Field(default_factory=list)
 
@@ -296,12 +415,16 @@ class DataQualityReport(BaseModel):
 
 class DataSourceListResponse(BaseModel):
     """\u6570\u636e\u6e90\u5217\u8868\u54cd\u5e94"""
+    model_config = ConfigDict(defer_build=True)
+
     sources: list[DataSourceInfo]
     primary_source: DataSource
 
 
 class SyncStatusResponse(BaseModel):
     """\u540c\u6b65\u72b6\u6001\u54cd\u5e94"""
+    model_config = ConfigDict(defer_build=True)
+
     symbols: list[SymbolSyncStatus]
     total_symbols: int
     synced_count: int
@@ -311,84 +434,107 @@ class SyncStatusResponse(BaseModel):
 
 class IntradayFactorsResponse(BaseModel):
     """\u65e5\u5185\u56e0\u5b50\u54cd\u5e94"""
+    model_config = ConfigDict(defer_build=True)
+
     snapshots: list[IntradayFactorSnapshot]
     timestamp: datetime
     factors_calculated: list[str]
 
 
+# \u5386\u53f2\u6570\u636e\u54cd\u5e94\u5217\u8868\u5e8f\u5217\u5316\u5668
+HISTORICAL_DATA_LIST_ADAPTER = TypeAdapter(
+    list[HistoricalDataResponse], config=ConfigDict(defer_build=True)
+)
+
+
 # ============ \u9884\u7f6e\u65e5\u5185\u56e0\u5b50 ============
 
-INTRADAY_FACTOR_DEFINITIONS = [
-    IntradayFactorDefinition(
-        id=IntradayFactorType.RELATIVE_VOLUME,
-        name="\u76f8\u5bf9\u6210\u4ea4\u91cf",
-        description="\u5f53\u524d10\u5206\u949f\u6210\u4ea4\u91cf / \u8fc7\u53bb20\u5929\u540c\u65f6\u6bb5\u5e73\u5747",
-        expression="volume_10min / avg(volume_10min, 20)",
-        interpretation=">2.0 \u663e\u8457\u653e\u91cf, <0.5 \u663e\u8457\u7f29\u91cf",
-        lookback_period=10,
-        update_frequency=DataFrequency.MIN_1,
-    ),
-    IntradayFactorDefinition(
-        id=IntradayFactorType.VWAP_DEVIATION,
-        name="VWAP\u504f\u79bb",
-        description="\u5f53\u524d\u4ef7\u683c\u76f8\u5bf9VWAP\u7684\u504f\u79bb\u7a0b\u5ea6",
-        expression="(close - vwap) / vwap",
-        interpretation=">0 \u4e70\u538b\u5f3a, <0 \u5356\u538b\u5f3a",
-        lookback_period=0,
-        update_frequency=DataFrequency.MIN_1,
-    ),
-    IntradayFactorDefinition(
-        id=IntradayFactorType.BUY_PRESSURE,
-        name="\u4e70\u5356\u538b\u529b",
-        description="\u4e3b\u52a8\u4e70\u5165\u91cf\u5360\u6bd4",
-        expression="buy_volume / (buy_volume + sell_volume)",
-        interpretation=">0.6 \u4e70\u538b\u5f3a, <0.4 \u5356\u538b\u5f3a",
-        lookback_period=10,
-        update_frequency=DataFrequency.MIN_1,
-    ),
-    IntradayFactorDefinition(
-        id=IntradayFactorType.PRICE_MOMENTUM_5MIN,
-        name="5\u5206\u949f\u52a8\u91cf",
-        description="5\u5206\u949f\u4ef7\u683c\u53d8\u5316\u7387",
-        expression="close / delay(close, 5) - 1",
-        interpretation="\u6b63\u503c\u8868\u793a\u4e0a\u6da8\u52a8\u91cf",
-        lookback_period=5,
-        update_frequency=DataFrequency.MIN_1,
-    ),
-    IntradayFactorDefinition(
-        id=IntradayFactorType.PRICE_MOMENTUM_15MIN,
-        name="15\u5206\u949f\u52a8\u91cf",
-        description="15\u5206\u949f\u4ef7\u683c\u53d8\u5316\u7387",
-        expression="close / delay(close, 15) - 1",
-        interpretation="\u6b63\u503c\u8868\u793a\u4e0a\u6da8\u52a8\u91cf",
-        lookback_period=15,
-        update_frequency=DataFrequency.MIN_1,
-    ),
-    IntradayFactorDefinition(
-        id=IntradayFactorType.INTRADAY_VOLATILITY,
-        name="\u65e5\u5185\u6ce2\u52a8",
-        description="\u5f53\u65e5\u4ef7\u683c\u6ce2\u52a8\u7387",
-        expression="std(returns_1min, today) * sqrt(390)",
-        interpretation="\u5e74\u5316\u65e5\u5185\u6ce2\u52a8\u7387",
-        lookback_period=390,
-        update_frequency=DataFrequency.MIN_5,
-    ),
-    IntradayFactorDefinition(
-        id=IntradayFactorType.SPREAD_RATIO,
-        name="\u4e70\u5356\u4ef7\u5dee\u6bd4",
-        description="\u4e70\u5356\u4ef7\u5dee\u5360\u4e2d\u95f4\u4ef7\u6bd4\u4f8b",
-        expression="(ask - bid) / ((ask + bid) / 2)",
-        interpretation="\u8d8a\u5927\u8868\u793a\u6d41\u52a8\u6027\u8d8a\u5dee",
-        lookback_period=0,
-        update_frequency=DataFrequency.MIN_1,
-    ),
-    IntradayFactorDefinition(
-        id=IntradayFactorType.ORDER_IMBALANCE,
-        name="\u8ba2\u5355\u4e0d\u5e73\u8861",
-        description="\u4e70\u5356\u76d8\u53e3\u4e0d\u5e73\u8861\u5ea6",
-        expression="(bid_size - ask_size) / (bid_size + ask_size)",
-        interpretation=">0 \u4e70\u76d8\u5f3a, <0 \u5356\u76d8\u5f3a",
-        lookback_period=0,
-        update_frequency=DataFrequency.MIN_1,
-    ),
-]
+_FACTOR_DEFS_RAW: tuple[dict[str, Any], ...] = (
+    {
+        "id": IntradayFactorType.RELATIVE_VOLUME,
+        "name": "\u76f8\u5bf9\u6210\u4ea4\u91cf",
+        "description": "\u5f53\u524d10\u5206\u949f\u6210\u4ea4\u91cf / \u8fc7\u53bb20\u5929\u540c\u65f6\u6bb5\u5e73\u5747",
+        "expression": "volume_10min / avg(volume_10min, 20)",
+        "interpretation": ">2.0 \u663e\u8457\u653e\u91cf, <0.5 \u663e\u8457\u7f29\u91cf",
+        "lookback_period": 10,
+        "update_frequency": DataFrequency.MIN_1,
+    },
+    {
+        "id": IntradayFactorType.VWAP_DEVIATION,
+        "name": "VWAP\u504f\u79bb",
+        "description": "\u5f53\u524d\u4ef7\u683c\u76f8\u5bf9VWAP\u7684\u504f\u79bb\u7a0b\u5ea6",
+        "expression": "(close - vwap) / vwap",
+        "interpretation": ">0 \u4e70\u538b\u5f3a, <0 \u5356\u538b\u5f3a",
+        "lookback_period": 0,
+        "update_frequency": DataFrequency.MIN_1,
+    },
+    {
+        "id": IntradayFactorType.BUY_PRESSURE,
+        "name": "\u4e70\u5356\u538b\u529b",
+        "description": "\u4e3b\u52a8\u4e70\u5165\u91cf\u5360\u6bd4",
+        "expression": "buy_volume / (buy_volume + sell_volume)",
+        "interpretation": ">0.6 \u4e70\u538b\u5f3a, <0.4 \u5356\u538b\u5f3a",
+        "lookback_period": 10,
+        "update_frequency": DataFrequency.MIN_1,
+    },
+    {
+        "id": IntradayFactorType.PRICE_MOMENTUM_5MIN,
+        "name": "5\u5206\u949f\u52a8\u91cf",
+        "description": "5\u5206\u949f\u4ef7\u683c\u53d8\u5316\u7387",
+        "expression": "close / delay(close, 5) - 1",
+        "interpretation": "\u6b63\u503c\u8868\u793a\u4e0a\u6da8\u52a8\u91cf",
+        "lookback_period": 5,
+        "update_frequency": DataFrequency.MIN_1,
+    },
+    {
+        "id": IntradayFactorType.PRICE_MOMENTUM_15MIN,
+        "name": "15\u5206\u949f\u52a8\u91cf",
+        "description": "15\u5206\u949f\u4ef7\u683c\u53d8\u5316\u7387",
+        "expression": "close / delay(close, 15) - 1",
+        "interpretation": "\u6b63\u503c\u8868\u793a\u4e0a\u6da8\u52a8\u91cf",
+        "lookback_period": 15,
+        "update_frequency": DataFrequency.MIN_1,
+    },
+    {
+        "id": IntradayFactorType.INTRADAY_VOLATILITY,
+        "name": "\u65e5\u5185\u6ce2\u52a8",
+        "description": "\u5f53\u65e5\u4ef7\u683c\u6ce2\u52a8\u7387",
+        "expression": "std(returns_1min, today) * sqrt(390)",
+        "interpretation": "\u5e74\u5316\u65e5\u5185\u6ce2\u52a8\u7387",
+        "lookback_period": 390,
+        "update_frequency": DataFrequency.MIN_5,
+    },
+    {
+        "id": IntradayFactorType.SPREAD_RATIO,
+        "name": "\u4e70\u5356\u4ef7\u5dee\u6bd4",
+        "description": "\u4e70\u5356\u4ef7\u5dee\u5360\u4e2d\u95f4\u4ef7\u6bd4\u4f8b",
+        "expression": "(ask - bid) / ((ask + bid) / 2)",
+        "interpretation": "\u8d8a\u5927\u8868\u793a\u6d41\u52a8\u6027\u8d8a\u5dee",
+        "lookback_period": 0,
+        "update_frequency": DataFrequency.MIN_1,
+    },
+    {
+        "id": IntradayFactorType.ORDER_IMBALANCE,
+        "name": "\u8ba2\u5355\u4e0d\u5e73\u8861",
+        "description": "\u4e70\u5356\u76d8\u53e3\u4e0d\u5e73\u8861\u5ea6",
+        "expression": "(bid_size - ask_size) / (bid_size + ask_size)",
+        "interpretation": ">0 \u4e70\u76d8\u5f3a, <0 \u5356\u76d8\u5f3a",
+        "lookback_period": 0,
+        "update_frequency": DataFrequency.MIN_1,
+    },
+)
+
+
+@lru_cache(maxsize=1)
+def load_intraday_factor_definitions() -> tuple[IntradayFactorDefinition, ...]:
+    """
+    \u83b7\u53d6\u9884\u7f6e\u65e5\u5185\u56e0\u5b50\u5b9a\u4e49
+
+    \u5b9a\u4e49\u4e3a\u9759\u6001\u5b57\u9762\u91cf, \u9996\u6b21\u8bbf\u95ee\u65f6\u4ee5 model_construct \u6784\u5efa\u5e76\u7f13\u5b58, \u5bfc\u5165\u65f6\u4e0d\u89e6\u53d1\u6821\u9a8c
+    """
+    return tuple(IntradayFactorDefinition.model_construct(**d) for d in _FACTOR_DEFS_RAW)
+
+
+# \u56e0\u5b50\u77e9\u9635\u5217\u987a\u5e8f (\u4e0e\u9884\u7f6e\u5b9a\u4e49\u987a\u5e8f\u4e00\u81f4, \u5217\u4e0b\u6807\u7a33\u5b9a)
+FACTOR_ORDER: tuple[str, ...] = tuple(d["id"].value for d in _FACTOR_DEFS_RAW)
+FACTOR_INDEX: dict[str, int] = {name: i for i, name in enumerate(FACTOR_ORDER)}
@@ -2,19 +2,38 @@
 分策略持仓 Schema
 PRD 4.18 分策略持仓管理
 """
+import sys
+from collections.abc import Sequence
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from functools import cached_property
+from typing import Annotated, Any
 
-from pydantic import BaseModel, Field
+import numpy as np
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PlainSerializer,
+    PlainValidator,
+    TypeAdapter,
+    WithJsonSchema,
+)
 
+from app.schemas.manual_trade import OrderTypeLiteral
 
-class StrategyPosition(BaseModel):
+# 持仓记录在分组/汇总列表中大量创建, 以 slots 数据类存放;
+# 不变量由 validate() 在持仓入库时集中校验一次.
+# 价格刷新会原地更新市值与盈亏, 故 StrategyPosition 不冻结.
+
+@dataclass(slots=True, kw_only=True)
+class StrategyPosition:
     """策略持仓 (逻辑隔离)"""
     position_id: str
     user_id: str
     account_id: str
-    strategy_id: Optional[str] = None  # None = 手动交易
-    strategy_name: Optional[str] = None
+    strategy_id: str | None = None  # None = 手动交易
+    strategy_name: str | None = None
 
     symbol: str
     quantity: int
@@ -27,20 +46,32 @@ class StrategyPosition(BaseModel):
     realized_pnl: float = 0  # 已实现盈亏
 
     # 止盈止损
-    stop_loss: Optional[float] = None
-    take_profit: Optional[float] = None
+    stop_loss: float | None = None
+    take_profit: float | None = None
 
     # 风险指标
-    beta: Optional[float] = None
-    volatility: Optional[float] = None
+    beta: float | None = None
+    volatility: float | None = None
 
     created_at: datetime
     updated_at: datetime
 
+    def __post_init__(self) -> None:
+        # 同一股票常出现在多个策略的持仓中, 共享同一 symbol 对象
+        self.symbol = sys.intern(self.symbol)
+
+    def validate(self) -> None:
+        """校验持仓不变量"""
+        if self.quantity < 0:
+            raise ValueError(f"{self.symbol} 持仓数量为负: {self.quantity}")
+        if self.avg_cost < 0:
+            raise ValueError(f"{self.symbol} 持仓成本为负: {self.avg_cost}")
+
 
-class PositionSource(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class PositionSource:
     """持仓来源"""
-    strategy_id: Optional[str] = None
+    strategy_id: str | None = None
     strategy_name: str
     quantity: int
     avg_cost: float
@@ -50,6 +81,8 @@ class PositionSource(BaseModel):
 
 class ConsolidatedPosition(BaseModel):
     """同股票汇总持仓"""
+    model_config = ConfigDict(defer_build=True)
+
     symbol: str
     total_quantity: int
     weighted_avg_cost: float
@@ -67,7 +100,9 @@ class ConsolidatedPosition(BaseModel):
 
 class PositionGroup(BaseModel):
     """持仓分组 (按策略)"""
-    strategy_id: Optional[str] = None
+    model_config = ConfigDict(defer_build=True)
+
+    strategy_id: str | None = None
     strategy_name: str  # "手动交易" 或策略名
     positions: list[StrategyPosition]
     total_market_value: float
@@ -78,6 +113,8 @@ class PositionGroup(BaseModel):
 
 class AccountPositionSummary(BaseModel):
     """账户持仓汇总"""
+    model_config = ConfigDict(defer_build=True)
+
     account_id: str
     total_market_value: float
     total_cash: float
@@ -93,7 +130,7 @@ class AccountPositionSummary(BaseModel):
 
     # 风险指标
     concentration_warnings: list[str] = []  # 集中度警告
-    portfolio_beta: Optional[float] = None
+    portfolio_beta: float | None = None
 
     updated_at: datetime
 
@@ -102,28 +139,124 @@ class SellPositionRequest(BaseModel):
     """卖出持仓请求"""
     position_id: str
     quantity: int = Field(..., ge=1)
-    order_type: str = Field(default="market")
-    limit_price: Optional[float] = None
+    order_type: OrderTypeLiteral = Field(default="market")
+    limit_price: float | None = None
 
 
 class SellPositionResponse(BaseModel):
     """卖出持仓响应"""
+    model_config = ConfigDict(defer_build=True)
+
     success: bool
-    order_id: Optional[str] = None
+    order_id: str | None = None
     message: str
 
 
 class UpdateStopLossRequest(BaseModel):
     """更新止损请求"""
-    stop_loss: Optional[float] = Field(None, ge=0)
-    take_profit: Optional[float] = Field(None, ge=0)
+    stop_loss: float | None = Field(None, ge=0)
+    take_profit: float | None = Field(None, ge=0)
 
 
 class PositionRiskMetrics(BaseModel):
     """持仓风险指标"""
+    model_config = ConfigDict(defer_build=True)
+
     symbol: str
     beta: float
     volatility: float
     var_95: float  # 95% VaR
     max_loss: float
     correlation_to_spy: float
+
+
+# ============ 持仓列存表 ============
+# 账户汇总需对全部持仓做分组求和, 以连续 ndarray 按列存放后用向量化运算,
+# 替代逐个对象读取属性; StrategyPosition 仍作为对外接口的行记录.
+
+Int64Column = Annotated[
+    np.ndarray,
+    PlainValidator(lambda v: np.asarray(v, dtype=np.int64)),
+    PlainSerializer(lambda v: v.tolist(), return_type=list[int]),
+    WithJsonSchema({"type": "array", "items": {"type": "integer"}}),
+]
+
+Float64Column = Annotated[
+    np.ndarray,
+    PlainValidator(lambda v: np.asarray(v, dtype=np.float64)),
+    PlainSerializer(lambda v: v.tolist(), return_type=list[float]),
+    WithJsonSchema({"type": "array", "items": {"type": "number"}}),
+]
+
+
+class PositionsTable(BaseModel):
+    """持仓列存表 (各列按行对齐)"""
+    model_config = ConfigDict(defer_build=True)
+
+    symbols: list[str]
+    strategy_ids: list[str | None]
+    quantity: Int64Column
+    avg_cost: Float64Column
+    current_price: Float64Column
+
+    @classmethod
+    def from_positions(cls, positions: Sequence[StrategyPosition]) -> "PositionsTable":
+        """由持仓行记录构建列存表"""
+        n = len(positions)
+        return cls.model_construct(
+            symbols=[p.symbol for p in positions],
+            strategy_ids=[p.strategy_id for p in positions],
+            quantity=np.fromiter((p.quantity for p in positions), dtype=np.int64, count=n),
+            avg_cost=np.fromiter((p.avg_cost for p in positions), dtype=np.float64, count=n),
+            current_price=np.fromiter(
+                (p.current_price for p in positions), dtype=np.float64, count=n
+            ),
+        )
+
+    @cached_property
+    def market_value(self) -> np.ndarray:
+        """市值 = 数量 × 现价"""
+        value: np.ndarray = self.quantity * self.current_price
+        return value
+
+    @cached_property
+    def cost_basis(self) -> np.ndarray:
+        """成本 = 数量 × 均价"""
+        cost: np.ndarray = self.quantity * self.avg_cost
+        return cost
+
+    @cached_property
+    def unrealized_pnl(self) -> np.ndarray:
+        """浮动盈亏"""
+        pnl: np.ndarray = self.market_value - self.cost_basis
+        return pnl
+
+    def to_records(self) -> list[dict[str, Any]]:
+        """按需物化为行记录"""
+        return [
+            {
+                "symbol": symbol,
+                "strategy_id": strategy_id,
+                "quantity": quantity,
+                "avg_cost": avg_cost,
+                "current_price": current_price,
+                "market_value": market_value,
+                "unrealized_pnl": pnl,
+            }
+            for symbol, strategy_id, quantity, avg_cost, current_price, market_value, pnl in zip(
+                self.symbols,
+                self.strategy_ids,
+                self.quantity.tolist(),
+                self.avg_cost.tolist(),
+                self.current_price.tolist(),
+                self.market_value.tolist(),
+                self.unrealized_pnl.tolist(),
+                strict=True,
+            )
+        ]
+
+
+# 持仓列表序列化器
+STRATEGY_POSITION_LIST_ADAPTER = TypeAdapter(
+    list[StrategyPosition], config=ConfigDict(defer_build=True)
+)
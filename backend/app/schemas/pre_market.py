@@ -3,38 +3,61 @@
 PRD 4.18.0 盘前扫描器
 """
 from datetime import date, datetime
-from typing import Optional
+from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from typing_extensions import TypedDict
+
+# 盘前字段取值
+GapDirectionLiteral = Literal["up", "down"]
+StopTypeLiteral = Literal["atr", "fixed", "percentage", "technical"]
 
 
 class PreMarketScanFilter(BaseModel):
     """盘前扫描筛选条件"""
+    model_config = ConfigDict(defer_build=True)
+
     min_gap: float = Field(default=0.02, description="最小Gap (默认2%)")
     min_premarket_volume: float = Field(default=2.0, description="盘前成交量倍数 (默认2倍日均)")
     min_volatility: float = Field(default=0.03, description="最小昨日波动率 (默认3%)")
     min_liquidity: float = Field(default=5000000, description="最小流动性 (默认$5M/日)")
-    has_news: Optional[bool] = Field(None, description="是否有新闻")
-    is_earnings_day: Optional[bool] = Field(None, description="是否财报日")
+    has_news: bool | None = Field(None, description="是否有新闻")
+    is_earnings_day: bool | None = Field(None, description="是否财报日")
+
+
+class ScoreWeights(TypedDict):
+    """评分权重"""
+    gap: float
+    volume: float
+    volatility: float
+    news: float
+
+
+# 默认评分权重 (PRD 4.18.0)
+DEFAULT_SCORE_WEIGHTS: ScoreWeights = {"gap": 0.3, "volume": 0.3, "volatility": 0.2, "news": 1.0}
 
 
 class ScoreBreakdown(BaseModel):
     """评分明细"""
+    model_config = ConfigDict(defer_build=True)
+
     gap: float
     volume: float
     volatility: float
     news: float
-    weights: dict = {"gap": 0.3, "volume": 0.3, "volatility": 0.2, "news": 1.0}
+    weights: ScoreWeights = Field(default_factory=lambda: ScoreWeights(**DEFAULT_SCORE_WEIGHTS))
 
 
 class PreMarketStock(BaseModel):
     """盘前扫描股票"""
+    model_config = ConfigDict(defer_build=True)
+
     symbol: str
     name: str
 
     # 盘前数据
     gap: float  # 开盘跳空 (%)
-    gap_direction: str  # 'up' | 'down'
+    gap_direction: GapDirectionLiteral
     premarket_price: float  # 盘前价格
     premarket_volume: int  # 盘前成交量
     premarket_volume_ratio: float  # 相对日均量倍数
@@ -50,7 +73,7 @@ class PreMarketStock(BaseModel):
 
     # 新闻/事件
     has_news: bool
-    news_headline: Optional[str] = None
+    news_headline: str | None = None
     is_earnings_day: bool = False
 
     # 评分
@@ -60,6 +83,8 @@ class PreMarketStock(BaseModel):
 
 class PreMarketScanResult(BaseModel):
     """盘前扫描结果"""
+    model_config = ConfigDict(defer_build=True)
+
     scan_time: datetime
     strategy_id: str
     strategy_name: str
@@ -69,16 +94,18 @@ class PreMarketScanResult(BaseModel):
     stocks: list[PreMarketStock]
 
     # AI建议
-    ai_suggestion: Optional[str] = None
+    ai_suggestion: str | None = None
 
 
 class IntradayWatchlist(BaseModel):
     """日内交易监控列表"""
+    model_config = ConfigDict(defer_build=True)
+
     watchlist_id: str
     user_id: str
     strategy_id: str
     date: date
-    symbols: list[str]
+    symbols: tuple[str, ...]
     created_at: datetime
     is_confirmed: bool = False
 
@@ -86,23 +113,33 @@ class IntradayWatchlist(BaseModel):
 class CreateWatchlistRequest(BaseModel):
     """创建监控列表请求"""
     strategy_id: str
-    symbols: list[str] = Field(..., max_length=20)
+    symbols: tuple[str, ...] = Field(..., max_length=20)
+
+    @field_validator("symbols")
+    @classmethod
+    def dedupe_symbols(cls, v: tuple[str, ...]) -> tuple[str, ...]:
+        """去除重复代码, 保留首次出现的顺序"""
+        return tuple(dict.fromkeys(v))
 
 
 class TimeStopConfig(BaseModel):
     """时间止损配置"""
+    model_config = ConfigDict(defer_build=True)
+
     enabled: bool = True
     time: str = "15:55"  # HH:mm format, 收盘前5分钟
 
 
 class StopLossConfig(BaseModel):
     """止盈止损配置"""
+    model_config = ConfigDict(defer_build=True)
+
     # 止损设置
-    stop_loss_type: str = "atr"  # 'atr' | 'fixed' | 'percentage' | 'technical'
+    stop_loss_type: StopTypeLiteral = "atr"
     stop_loss_value: float = 1.5
 
     # 止盈设置
-    take_profit_type: str = "atr"
+    take_profit_type: StopTypeLiteral = "atr"
     take_profit_value: float = 2.5
 
     # 时间止损 (日内专属)
@@ -117,6 +154,8 @@ class StopLossConfig(BaseModel):
 
 class IntradayPosition(BaseModel):
     """日内持仓"""
+    model_config = ConfigDict(defer_build=True)
+
     position_id: str
     user_id: str
     account_id: str
@@ -131,9 +170,9 @@ class IntradayPosition(BaseModel):
     pnl: float
     pnl_pct: float
 
-    stop_loss: Optional[float] = None
-    take_profit: Optional[float] = None
-    time_stop_config: Optional[TimeStopConfig] = None
+    stop_loss: float | None = None
+    take_profit: float | None = None
+    time_stop_config: TimeStopConfig | None = None
 
     entry_time: datetime
     is_intraday: bool = True
@@ -3,12 +3,16 @@
 PRD 4.17 策略回放功能
 """
 
+from dataclasses import dataclass
 from datetime import date, datetime
-from decimal import Decimal
 from enum import Enum
-from typing import Optional
+from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+from typing_extensions import TypedDict
+
+from app.schemas.common import HOT_CONFIG
+from app.schemas.market_data import OHLCV
 
 
 class ReplaySpeed(str, Enum):
@@ -26,6 +30,12 @@ class ReplayStatus(str, Enum):
     PAUSED = "paused"
 
 
+# 回放输出字段取值
+SignalLiteral = Literal["buy", "sell", "hold"]
+EventTypeLiteral = Literal["buy_trigger", "sell_trigger", "condition_check"]
+ThresholdDirectionLiteral = Literal["above", "below"]
+
+
 # ============ 回放配置 ============
 
 
@@ -40,6 +50,8 @@ class ReplayConfig(BaseModel):
 
 class ReplayState(BaseModel):
     """回放状态"""
+    model_config = ConfigDict(defer_build=True)
+
     session_id: str = Field(..., description="会话ID")
     config: ReplayConfig
     status: ReplayStatus = ReplayStatus.IDLE
@@ -49,8 +61,8 @@ class ReplayState(BaseModel):
 
     # 模拟持仓
     position_quantity: int = 0
-    position_avg_cost: Decimal = Decimal("0")
-    cash: Decimal = Decimal("100000")
+    position_avg_cost: float = 0.0
+    cash: float = 100000.0
 
     # 回放统计
     total_signals: int = 0
@@ -62,42 +74,67 @@ class ReplayState(BaseModel):
 # ============ 历史数据 ============
 
 
-class HistoricalBar(BaseModel):
+# 回放期间逐根推送, 以只读 slots 数据类存放
+@dataclass(slots=True, frozen=True, kw_only=True)
+class HistoricalBar(OHLCV):
     """历史K线"""
     timestamp: datetime
-    open: Decimal
-    high: Decimal
-    low: Decimal
-    close: Decimal
     volume: int
 
 
 class ThresholdConfig(BaseModel):
     """阈值配置"""
+    model_config = ConfigDict(defer_build=True)
+
     value: float
-    direction: str  # above/below
+    direction: ThresholdDirectionLiteral
     passed: bool
 
 
+# 回放因子集固定, 以 TypedDict 声明键, 按键逐个校验而非通用 dict 校验
+
+class ReplayFactorValues(TypedDict, total=False):
+    """回放因子值"""
+    RSI: float
+    MACD: float
+    MACD_Signal: float
+    Volatility: float
+    Volume_Ratio: float
+    close: float
+
+
+class ReplayThresholds(TypedDict, total=False):
+    """回放阈值检查"""
+    RSI: ThresholdConfig
+    MACD: ThresholdConfig
+    Volatility: ThresholdConfig
+    Volume_Ratio: ThresholdConfig
+
+
 class FactorSnapshot(BaseModel):
     """因子快照"""
+    model_config = ConfigDict(defer_build=True)
+
     timestamp: datetime
-    factor_values: dict[str, float] = Field(default_factory=dict)
-    thresholds: dict[str, ThresholdConfig] = Field(default_factory=dict)
-    overall_signal: str = "hold"  # buy/sell/hold
+    factor_values: ReplayFactorValues = Field(default_factory=ReplayFactorValues)
+    thresholds: ReplayThresholds = Field(default_factory=ReplayThresholds)
+    overall_signal: SignalLiteral = "hold"
     conditions_met: int = 0
     conditions_total: int = 0
 
 
 class SignalEvent(BaseModel):
     """信号事件"""
+    model_config = HOT_CONFIG
+
     event_id: str
     timestamp: datetime
-    event_type: str  # buy_trigger, sell_trigger, condition_check
+    event_type: EventTypeLiteral
     symbol: str
-    price: Decimal
+    price: float
     description: str
-    factor_details: Optional[dict] = None
+    # 触发时的因子值 (买卖事件同构, 由 event_type 区分)
+    factor_details: ReplayFactorValues | None = None
 
 
 # ============ 回放响应 ============
@@ -105,13 +142,17 @@ class SignalEvent(BaseModel):
 
 class SignalMarker(BaseModel):
     """信号标记"""
+    model_config = HOT_CONFIG
+
     index: int
-    time: str
-    type: str  # buy/sell
+    time: datetime
+    type: Literal["buy", "sell"]
 
 
 class ReplayInitResponse(BaseModel):
     """回放初始化响应"""
+    model_config = ConfigDict(defer_build=True)
+
     state: ReplayState
     total_bars: int
     signal_markers: list[SignalMarker] = Field(default_factory=list)
@@ -119,6 +160,8 @@ class ReplayInitResponse(BaseModel):
 
 class ReplayTickResponse(BaseModel):
     """回放Tick响应"""
+    model_config = ConfigDict(defer_build=True)
+
     state: ReplayState
     bar: HistoricalBar
     factor_snapshot: FactorSnapshot
@@ -127,6 +170,8 @@ class ReplayTickResponse(BaseModel):
 
 class ReplayInsight(BaseModel):
     """回放洞察"""
+    model_config = ConfigDict(defer_build=True)
+
     total_signals: int
     execution_rate: float
     win_rate: float
@@ -142,6 +187,8 @@ class ReplayInsight(BaseModel):
 
 class ReplayExport(BaseModel):
     """回放导出"""
+    model_config = ConfigDict(defer_build=True)
+
     events: list[SignalEvent]
     summary: ReplayInsight
 
@@ -4,11 +4,14 @@ Phase 10: 风险系统升级 - Pydantic Schema
 风险因子模型、风险分解、压力测试、实时监控的数据模型
 """
 
+from collections.abc import Mapping
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Any
+from typing import Annotated, Any, Literal
 
-from pydantic import BaseModel, Field
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field
 
 
 # ============ 枚举类型 ============
@@ -70,19 +73,30 @@ class ExposureStatus(str, Enum):
     BREACH = "breach"
 
 
+# 输出字段取值 (与上述枚举一致)
+ScenarioTypeLiteral = Literal["historical", "hypothetical", "custom"]
+AlertLevelLiteral = Literal["info", "warning", "critical", "emergency"]
+RiskLevelLiteral = Literal["low", "medium", "high", "critical"]
+ExposureStatusLiteral = Literal["normal", "warning", "breach"]
+
+
+# 结果中的叶子值对象按请求批量生成、生成后不再修改, 以只读 slots 数据类存放
+
 # ============ 因子暴露模型 ============
 
-class FactorExposureItem(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class FactorExposureItem:
     """单个因子暴露"""
     factor: str
-    exposure: float = Field(..., description="暴露系数")
-    t_stat: float = Field(0.0, description="t统计量")
-    p_value: float = Field(1.0, description="p值")
-    is_significant: bool = Field(False, description="是否显著")
-    risk_contribution: float = Field(0.0, description="风险贡献(%)")
+    exposure: Annotated[float, Field(description="暴露系数")]
+    t_stat: Annotated[float, Field(description="t统计量")] = 0.0
+    p_value: Annotated[float, Field(description="p值")] = 1.0
+    is_significant: Annotated[bool, Field(description="是否显著")] = False
+    risk_contribution: Annotated[float, Field(description="风险贡献(%)")] = 0.0
 
 
-class StyleFactorExposures(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class StyleFactorExposures:
     """风格因子暴露"""
     size: float = 0.0
     value: float = 0.0
@@ -96,16 +110,19 @@ class StyleFactorExposures(BaseModel):
 
 # ============ 风险分解模型 ============
 
-class RiskContributions(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class RiskContributions:
     """风险贡献分解"""
-    market: float = Field(..., description="市场风险贡献(%)")
-    style: float = Field(..., description="风格风险贡献(%)")
-    industry: float = Field(..., description="行业风险贡献(%)")
-    specific: float = Field(..., description="特质风险贡献(%)")
+    market: Annotated[float, Field(description="市场风险贡献(%)")]
+    style: Annotated[float, Field(description="风格风险贡献(%)")]
+    industry: Annotated[float, Field(description="行业风险贡献(%)")]
+    specific: Annotated[float, Field(description="特质风险贡献(%)")]
 
 
 class FactorExposures(BaseModel):
     """因子暴露汇总"""
+    model_config = ConfigDict(defer_build=True)
+
     market: float = Field(1.0, description="市场Beta")
     style: StyleFactorExposures = Field(default_factory=StyleFactorExposures)
     industry: dict[str, float] = Field(default_factory=dict)
@@ -113,6 +130,8 @@ class FactorExposures(BaseModel):
 
 class RiskDecompositionResult(BaseModel):
     """风险分解结果"""
+    model_config = ConfigDict(defer_build=True)
+
     total_risk: float = Field(..., description="总风险(年化波动率)")
     risk_contributions: RiskContributions
     style_risk_details: dict[str, float] = Field(default_factory=dict)
@@ -131,10 +150,67 @@ class RiskDecompositionRequest(BaseModel):
     lookback_days: int = Field(252, ge=60, le=756, description="回溯天数")
 
 
+# ============ 持仓列存 ============
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class HoldingsTable:
+    """持仓列存表 (各列按 symbols 对齐, 供风险计算做向量运算)"""
+    symbols: list[str]
+    weights: np.ndarray         # 权重 float64
+    betas: np.ndarray           # Beta float64 (未提供取 1.0)
+    sectors: list[str]          # 行业, 按首次出现顺序去重
+    sector_codes: np.ndarray    # 每行所属行业在 sectors 中的下标
+
+    @classmethod
+    def from_holdings(
+        cls,
+        holdings: Mapping[str, float],
+        asset_betas: Mapping[str, float] | None = None,
+        asset_sectors: Mapping[str, str] | None = None,
+        default_sector: str = "information_technology",
+    ) -> "HoldingsTable":
+        """由 {symbol: weight} 及按 symbol 的 Beta/行业映射构建列存表"""
+        asset_betas = asset_betas or {}
+        asset_sectors = asset_sectors or {}
+        n = len(holdings)
+        sector_index: dict[str, int] = {}
+        return cls(
+            symbols=list(holdings),
+            weights=np.fromiter(holdings.values(), dtype=np.float64, count=n),
+            betas=np.fromiter(
+                (asset_betas.get(s, 1.0) for s in holdings), dtype=np.float64, count=n
+            ),
+            sector_codes=np.fromiter(
+                (
+                    sector_index.setdefault(asset_sectors.get(s, default_sector), len(sector_index))
+                    for s in holdings
+                ),
+                dtype=np.intp,
+                count=n,
+            ),
+            sectors=list(sector_index),
+        )
+
+    def sector_values(self, values: Mapping[str, float]) -> np.ndarray:
+        """按行业映射取每行的值 (未列出的行业取 0)"""
+        per_sector = np.fromiter(
+            (values.get(s, 0) for s in self.sectors), dtype=np.float64, count=len(self.sectors)
+        )
+        per_row: np.ndarray = per_sector[self.sector_codes]
+        return per_row
+
+    def sector_totals(self) -> dict[str, float]:
+        """按行业汇总权重"""
+        totals = np.bincount(self.sector_codes, weights=self.weights, minlength=len(self.sectors))
+        return dict(zip(self.sectors, totals.tolist(), strict=True))
+
+
 # ============ 压力测试模型 ============
 
 class ScenarioShocks(BaseModel):
     """情景冲击参数"""
+    model_config = ConfigDict(defer_build=True)
+
     market_return: float | None = Field(None, description="市场收益冲击")
     volatility_multiplier: float | None = Field(None, ge=0.5, le=10.0, description="波动率乘数")
     sector_shocks: dict[str, float] | None = Field(None, description="行业冲击")
@@ -144,6 +220,8 @@ class ScenarioShocks(BaseModel):
 
 class HistoricalPeriod(BaseModel):
     """历史情景时间段"""
+    model_config = ConfigDict(defer_build=True)
+
     start_date: str
     end_date: str
     spy_drawdown: float
@@ -151,34 +229,39 @@ class HistoricalPeriod(BaseModel):
 
 class StressScenario(BaseModel):
     """压力测试情景"""
+    model_config = ConfigDict(defer_build=True)
+
     id: str
     name: str
-    type: ScenarioType
+    type: ScenarioTypeLiteral
     description: str = ""
     shocks: ScenarioShocks
     historical_period: HistoricalPeriod | None = None
 
 
-class PortfolioImpact(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class PortfolioImpact:
     """组合影响"""
-    expected_loss: float = Field(..., description="预期亏损金额")
-    expected_loss_percent: float = Field(..., description="预期亏损百分比")
-    var_impact: float = Field(0.0, description="VaR变化")
-    max_drawdown: float = Field(0.0, description="最大回撤")
-    recovery_days: int = Field(0, description="预计恢复天数")
-    liquidation_risk: bool = Field(False, description="是否触发强平")
+    expected_loss: Annotated[float, Field(description="预期亏损金额")]
+    expected_loss_percent: Annotated[float, Field(description="预期亏损百分比")]
+    var_impact: Annotated[float, Field(description="VaR变化")] = 0.0
+    max_drawdown: Annotated[float, Field(description="最大回撤")] = 0.0
+    recovery_days: Annotated[int, Field(description="预计恢复天数")] = 0
+    liquidation_risk: Annotated[bool, Field(description="是否触发强平")] = False
 
 
-class PositionImpact(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class PositionImpact:
     """持仓影响"""
     symbol: str
     current_weight: float
     expected_loss: float
     loss_percent: float
-    contribution: float = Field(..., description="对组合亏损的贡献")
+    contribution: Annotated[float, Field(description="对组合亏损的贡献")]
 
 
-class RiskMetricsChange(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class RiskMetricsChange:
     """风险指标变化"""
     volatility_before: float = 0.0
     volatility_after: float = 0.0
@@ -190,11 +273,13 @@ class RiskMetricsChange(BaseModel):
 
 class StressTestResult(BaseModel):
     """压力测试结果"""
+    model_config = ConfigDict(defer_build=True)
+
     scenario: StressScenario
     portfolio_impact: PortfolioImpact
     position_impacts: list[PositionImpact] = Field(default_factory=list)
     risk_metrics_change: RiskMetricsChange = Field(default_factory=RiskMetricsChange)
-    recommendations: list[str] = Field(default_factory=list)
+    recommendations: tuple[str, ...] = ()  # 只读, 元组缺省值无需逐实例复制
 
 
 class StressTestRequest(BaseModel):
@@ -220,41 +305,47 @@ class StressTestBatchRequest(BaseModel):
 
 # ============ 实时监控模型 ============
 
-class CurrentMetrics(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class CurrentMetrics:
     """当前风险指标"""
-    drawdown: float = Field(0.0, description="当前回撤")
-    drawdown_limit: float = Field(0.15, description="回撤限制")
-    var_95: float = Field(0.0, description="95% VaR")
-    var_limit: float = Field(0.03, description="VaR限制")
-    volatility: float = Field(0.0, description="当前波动率")
-    volatility_limit: float = Field(0.25, description="波动率限制")
+    drawdown: Annotated[float, Field(description="当前回撤")] = 0.0
+    drawdown_limit: Annotated[float, Field(description="回撤限制")] = 0.15
+    var_95: Annotated[float, Field(description="95% VaR")] = 0.0
+    var_limit: Annotated[float, Field(description="VaR限制")] = 0.03
+    volatility: Annotated[float, Field(description="当前波动率")] = 0.0
+    volatility_limit: Annotated[float, Field(description="波动率限制")] = 0.25
 
 
-class ExposureStatusDetail(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class ExposureStatusDetail:
     """暴露状态详情"""
     current: float
     limit: float
-    status: ExposureStatus
+    status: ExposureStatusLiteral
 
 
-class IndustryExposureStatus(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class IndustryExposureStatus:
     """行业暴露状态"""
     industry: str
     current: float
     limit: float
-    status: ExposureStatus
+    status: ExposureStatusLiteral
 
 
-class StyleExposureStatus(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class StyleExposureStatus:
     """风格暴露状态"""
     factor: str
     current: float
     limit: float
-    status: ExposureStatus
+    status: ExposureStatusLiteral
 
 
 class FactorExposureStatus(BaseModel):
     """因子暴露状态"""
+    model_config = ConfigDict(defer_build=True)
+
     market: ExposureStatusDetail
     max_industry: IndustryExposureStatus
     max_style: StyleExposureStatus
@@ -262,9 +353,11 @@ class FactorExposureStatus(BaseModel):
 
 class RiskAlert(BaseModel):
     """风险警报"""
+    model_config = ConfigDict(defer_build=True)
+
     id: str
     timestamp: datetime
-    level: AlertLevel
+    level: AlertLevelLiteral
     type: str
     message: str
     current_value: float
@@ -274,16 +367,20 @@ class RiskAlert(BaseModel):
 
 class RiskMonitorStatus(BaseModel):
     """风险监控状态"""
+    model_config = ConfigDict(defer_build=True)
+
     current_metrics: CurrentMetrics
     factor_exposure_status: FactorExposureStatus
     active_alerts: list[RiskAlert] = Field(default_factory=list)
     risk_score: float = Field(0.0, ge=0, le=100, description="综合风险评分")
-    risk_level: RiskLevel = Field(RiskLevel.LOW)
+    risk_level: RiskLevelLiteral = Field("low")
     last_updated: datetime
 
 
 class RiskLimits(BaseModel):
     """风险限制配置"""
+    model_config = ConfigDict(defer_build=True)
+
     max_drawdown: float = Field(0.15, ge=0.01, le=0.50, description="最大回撤")
     max_var: float = Field(0.03, ge=0.01, le=0.10, description="最大VaR")
     max_volatility: float = Field(0.25, ge=0.05, le=0.50, description="最大波动率")
@@ -302,18 +399,24 @@ class RiskLimitsUpdateRequest(BaseModel):
 
 class ScenarioListResponse(BaseModel):
     """压力情景列表响应"""
+    model_config = ConfigDict(defer_build=True)
+
     scenarios: list[StressScenario]
     total: int
 
 
 class StressTestBatchResponse(BaseModel):
     """批量压力测试响应"""
+    model_config = ConfigDict(defer_build=True)
+
     results: list[StressTestResult]
     summary: dict[str, Any] = Field(default_factory=dict)
 
 
 class RiskDashboardResponse(BaseModel):
     """风险仪表盘响应"""
+    model_config = ConfigDict(defer_build=True)
+
     monitor_status: RiskMonitorStatus
     risk_decomposition: RiskDecompositionResult | None = None
     recent_stress_tests: list[StressTestResult] = Field(default_factory=list)
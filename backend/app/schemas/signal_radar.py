@@ -7,12 +7,12 @@ PRD 4.16.2: 信号雷达功能
 - 信号强度分级
 """
 
+from dataclasses import dataclass
 from datetime import datetime
-from decimal import Decimal
 from enum import Enum
-from typing import Optional
+from typing import Annotated, Any, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
 class SignalType(str, Enum):
@@ -39,16 +39,26 @@ class SignalStatus(str, Enum):
     EXCLUDED = "excluded"         # 不符合条件
 
 
+# 输出字段取值 (与上述枚举一致, 枚举保留作为常量及请求参数类型)
+SignalTypeLiteral = Literal["buy", "sell", "hold"]
+SignalStrengthLiteral = Literal["strong", "medium", "weak"]
+SignalStatusLiteral = Literal[
+    "holding", "buy_signal", "sell_signal", "near_trigger", "monitoring", "excluded"
+]
+
+
 # ============ 因子触发信息 ============
 
-class FactorTrigger(BaseModel):
+# 每个信号携带多条, 由信号服务生成后不再修改, 以只读 slots 数据类存放
+@dataclass(slots=True, frozen=True, kw_only=True)
+class FactorTrigger:
     """因子触发信息"""
     factor_id: str
     factor_name: str
     current_value: float
     threshold: float
     direction: str  # 'above' 或 'below'
-    near_trigger_pct: float = Field(0, ge=0, le=100, description="接近触发程度%")
+    near_trigger_pct: Annotated[float, Field(ge=0, le=100, description="接近触发程度%")] = 0
     is_satisfied: bool = False
 
 
@@ -56,34 +66,36 @@ class FactorTrigger(BaseModel):
 
 class Signal(BaseModel):
     """信号实体"""
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
+
     signal_id: str
     strategy_id: str
     symbol: str
     company_name: str
-    signal_type: SignalType
-    signal_strength: SignalStrength
+    signal_type: SignalTypeLiteral
+    signal_strength: SignalStrengthLiteral
     signal_score: float = Field(..., ge=0, le=100, description="信号分数 0-100")
-    status: SignalStatus = SignalStatus.MONITORING
+    status: SignalStatusLiteral = "monitoring"
     triggered_factors: list[FactorTrigger] = Field(default_factory=list)
-    current_price: Decimal
-    target_price: Optional[Decimal] = None
-    stop_loss_price: Optional[Decimal] = None
+    # 价格仅用于展示 (不参与结算), 以 float 存放
+    current_price: float
+    target_price: Optional[float] = None
+    stop_loss_price: Optional[float] = None
     expected_return_pct: Optional[float] = None
     signal_time: datetime
     expires_at: Optional[datetime] = None
     is_holding: bool = False
 
-    class Config:
-        from_attributes = True
-
 
 class SignalSummary(BaseModel):
     """信号摘要"""
+    model_config = ConfigDict(defer_build=True)
+
     signal_id: str
     symbol: str
     company_name: str
-    signal_type: SignalType
-    signal_strength: SignalStrength
+    signal_type: SignalTypeLiteral
+    signal_strength: SignalStrengthLiteral
     signal_score: float
     current_price: float
     signal_time: datetime
@@ -104,6 +116,8 @@ class SignalListRequest(BaseModel):
 
 class SignalListResponse(BaseModel):
     """信号列表响应"""
+    model_config = ConfigDict(defer_build=True)
+
     total: int
     signals: list[Signal]
     summary: dict[str, int]  # 各类型信号数量
@@ -120,6 +134,8 @@ class SignalHistoryRequest(BaseModel):
 
 class SignalHistoryResponse(BaseModel):
     """历史信号响应"""
+    model_config = ConfigDict(defer_build=True)
+
     total: int
     signals: list[Signal]
 
@@ -133,21 +149,27 @@ class StockSearchRequest(BaseModel):
 
 class StockSearchResult(BaseModel):
     """股票搜索结果"""
+    model_config = ConfigDict(defer_build=True)
+
     symbol: str
     company_name: str
     sector: Optional[str] = None
     current_price: float
-    signal_status: Optional[SignalStatus] = None
+    signal_status: Optional[SignalStatusLiteral] = None
     signal_score: Optional[float] = None
 
 
 class StockSearchResponse(BaseModel):
     """股票搜索响应"""
+    model_config = ConfigDict(defer_build=True)
+
     results: list[StockSearchResult]
 
 
 class StatusSummary(BaseModel):
     """状态分布统计"""
+    model_config = ConfigDict(defer_build=True)
+
     holding: int = 0
     buy_signal: int = 0
     sell_signal: int = 0
@@ -158,6 +180,8 @@ class StatusSummary(BaseModel):
 
 class StatusSummaryResponse(BaseModel):
     """状态分布响应"""
+    model_config = ConfigDict(defer_build=True)
+
     strategy_id: str
     summary: StatusSummary
     updated_at: datetime
@@ -167,12 +191,22 @@ class StatusSummaryResponse(BaseModel):
 
 class SignalStatusCache(BaseModel):
     """信号状态缓存 (用于快速查询)"""
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
+
     strategy_id: str
     symbol: str
-    status: SignalStatus
+    status: SignalStatusLiteral
     signal_strength: float = 0  # 0-100
     factor_values: dict[str, float] = Field(default_factory=dict)
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+
+# 信号列表校验器
+SIGNAL_LIST_ADAPTER: TypeAdapter[list[Signal]] = TypeAdapter(
+    list[Signal], config=ConfigDict(defer_build=True)
+)
+
+
+def build_signals(rows: list[dict[str, Any]]) -> list[Signal]:
+    """将信号行记录 (字段字典或 ORM 对象) 批量构建为 Signal 列表"""
+    return SIGNAL_LIST_ADAPTER.validate_python(rows)
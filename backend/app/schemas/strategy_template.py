@@ -4,7 +4,9 @@ PRD 4.13 策略模板库
 """
 
 from pydantic import BaseModel, Field
-from typing import Optional
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, Optional
 from datetime import datetime
 from enum import Enum
 
@@ -63,8 +65,8 @@ class StrategyTemplate(BaseModel):
     user_count: int = Field(0, description="使用人数")
     rating: float = Field(4.0, ge=0, le=5, description="评分")
 
-    # 标签
-    tags: list[str] = Field(default=[], description="标签")
+    # 标签 (构建后只读, 以元组存放, 缺省值可在实例间共享)
+    tags: tuple[str, ...] = Field(default=(), description="标签")
 
     # 元数据
     icon: str = Field("📊", description="图标")
@@ -95,8 +97,13 @@ class TemplateListResponse(BaseModel):
     templates: list[StrategyTemplate]
 
 
+def _readonly(config: dict[Any, dict[str, Any]]) -> Mapping[Any, Mapping[str, Any]]:
+    """将两级配置字典包装为只读映射 (模块级常量, 防止被调用方修改)"""
+    return MappingProxyType({key: MappingProxyType(value) for key, value in config.items()})
+
+
 # 分类配置
-CATEGORY_CONFIG = {
+CATEGORY_CONFIG = _readonly({
     TemplateCategory.VALUE: {
         "label": "价值投资",
         "icon": "💎",
@@ -133,11 +140,11 @@ CATEGORY_CONFIG = {
         "color": "#ef4444",
         "description": "日内短线交易，当日完成买卖",
     },
-}
+})
 
 
 # 难度配置
-DIFFICULTY_CONFIG = {
+DIFFICULTY_CONFIG = _readonly({
     DifficultyLevel.BEGINNER: {
         "label": "入门",
         "stars": 1,
@@ -156,11 +163,11 @@ DIFFICULTY_CONFIG = {
         "color": "#ef4444",
         "description": "适合专业投资者",
     },
-}
+})
 
 
 # 持仓周期配置
-HOLDING_PERIOD_CONFIG = {
+HOLDING_PERIOD_CONFIG = _readonly({
     HoldingPeriod.INTRADAY: {
         "label": "日内",
         "description": "当日买入当日卖出",
@@ -177,11 +184,11 @@ HOLDING_PERIOD_CONFIG = {
         "label": "长线",
         "description": "持仓30天以上",
     },
-}
+})
 
 
 # 风险配置
-RISK_LEVEL_CONFIG = {
+RISK_LEVEL_CONFIG = _readonly({
     RiskLevel.LOW: {
         "label": "低",
         "color": "#22c55e",
@@ -197,4 +204,4 @@ RISK_LEVEL_CONFIG = {
         "color": "#ef4444",
         "description": "波动较大，可能有较大回撤",
     },
-}
+})
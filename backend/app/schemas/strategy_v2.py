@@ -11,8 +11,9 @@ Phase 8: 策略构建增强
 6. Execution (执行层) - 交易执行配置
 7. Monitor (监控层) - 监控和告警配置
 """
-from typing import Optional, List, Literal
+from typing import Annotated, Optional, List, Literal
 from pydantic import BaseModel, Field
+from typing_extensions import TypedDict
 from enum import Enum
 
 
@@ -215,12 +216,13 @@ class SignalConfig(BaseModel):
 
 # ==================== Step 4: Risk 风险层配置 (新增) ====================
 
-class CircuitBreakerLevel(BaseModel):
+# 熔断规则字段全部必填且无默认值, 以 TypedDict 声明: 按键校验, 不逐条构建模型实例
+class CircuitBreakerLevel(TypedDict):
     """熔断级别"""
-    level: Literal[1, 2, 3] = Field(..., description="熔断级别")
-    trigger_type: Literal["daily_loss", "drawdown"] = Field(..., description="触发类型")
-    threshold: float = Field(..., description="触发阈值(%)")
-    action: Literal["notify", "pause_new", "full_stop"] = Field(..., description="触发动作")
+    level: Annotated[Literal[1, 2, 3], Field(description="熔断级别")]
+    trigger_type: Annotated[Literal["daily_loss", "drawdown"], Field(description="触发类型")]
+    threshold: Annotated[float, Field(description="触发阈值(%)")]
+    action: Annotated[Literal["notify", "pause_new", "full_stop"], Field(description="触发动作")]
 
 
 class RiskConfig(BaseModel):
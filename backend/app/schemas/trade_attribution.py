@@ -3,8 +3,9 @@
 PRD 4.5 交易归因系统
 """
 
-from pydantic import BaseModel, Field
-from typing import Optional, Literal
+from dataclasses import dataclass
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from typing import Any, Optional, Literal
 from datetime import datetime, date
 from enum import Enum
 
@@ -52,6 +53,8 @@ class MarketSnapshot(BaseModel):
 
 class TradeRecord(BaseModel):
     """交易记录"""
+    model_config = ConfigDict(from_attributes=True)
+
     trade_id: str
     strategy_id: str
     strategy_name: str
@@ -85,6 +88,17 @@ class TradeRecord(BaseModel):
     updated_at: datetime
 
 
+# 交易列表校验器
+TRADE_LIST_ADAPTER: TypeAdapter[list[TradeRecord]] = TypeAdapter(
+    list[TradeRecord], config=ConfigDict(defer_build=True)
+)
+
+
+def build_trades(rows: list[dict[str, Any]]) -> list[TradeRecord]:
+    """将交易行记录 (字段字典或 ORM 对象) 批量构建为 TradeRecord 列表"""
+    return TRADE_LIST_ADAPTER.validate_python(rows)
+
+
 class AttributionFactor(BaseModel):
     """归因因子"""
     factor_name: str
@@ -146,13 +160,15 @@ class AIDiagnosis(BaseModel):
     created_at: datetime
 
 
-class AttributionTriggerConfig(BaseModel):
+# 触发条件为进程内常量查表, 以只读 slots 数据类存放, 导入时不走 Pydantic 校验
+@dataclass(slots=True, frozen=True, kw_only=True)
+class AttributionTriggerConfig:
     """归因触发配置"""
     strategy_type: StrategyType
-    trade_count_trigger: int = Field(description="交易次数触发")
-    time_trigger: str = Field(description="时间触发周期")
-    loss_trigger_pct: float = Field(description="亏损触发阈值")
-    consecutive_loss_trigger: int = Field(description="连续亏损触发")
+    trade_count_trigger: int        # 交易次数触发
+    time_trigger: str               # 时间触发周期
+    loss_trigger_pct: float         # 亏损触发阈值
+    consecutive_loss_trigger: int   # 连续亏损触发
 
 
 # 归因触发条件配置 (PRD 4.5)
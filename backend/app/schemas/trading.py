@@ -8,12 +8,14 @@ Phase 12: \u6267\u884c\u5c42\u5347\u7ea7 - \u4ea4\u6613 Pydantic \u6a21\u578b
 - \u6267\u884c\u7b97\u6cd5\u6a21\u578b
 """
 
+from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, model_validator
+from typing_extensions import TypedDict
 
 
 # ============ \u679a\u4e3e\u7c7b\u578b ============
@@ -147,12 +149,24 @@ class BrokerPosition(BaseModel):
     exchange: str = ""
 
 
-class BrokerStatusSummary(BaseModel):
+# \u8d26\u6237\u6458\u8981\u952e\u56fa\u5b9a, \u4ee5 TypedDict \u58f0\u660e\u952e, \u6309\u952e\u9010\u4e2a\u6821\u9a8c\u800c\u975e\u901a\u7528 dict \u6821\u9a8c
+class BrokerAccountSummary(TypedDict):
+    """\u8d26\u6237\u6458\u8981"""
+    equity: float
+    buyingPower: float
+    cash: float
+    dayPnl: float
+    dayPnlPercent: float
+
+
+# \u72b6\u6001\u6458\u8981\u7531\u670d\u52a1\u7aef\u6309\u5df2\u77e5\u503c\u7ec4\u88c5\u540e\u76f4\u63a5\u8fd4\u56de, \u65e0\u9700\u9010\u5b57\u6bb5\u6821\u9a8c, \u4ee5\u53ea\u8bfb slots \u6570\u636e\u7c7b\u5b58\u653e
+@dataclass(slots=True, frozen=True, kw_only=True)
+class BrokerStatusSummary:
     """\u5238\u5546\u72b6\u6001\u6458\u8981"""
     broker: BrokerType
     status: BrokerConnectionStatus
     paper_trading: bool
-    account: dict[str, Any] | None = None
+    account: BrokerAccountSummary | None = None
     market_status: MarketStatus = MarketStatus.CLOSED
     last_update: datetime
 
@@ -239,20 +253,14 @@ class CreateOrderRequest(BaseModel):
     client_order_id: str | None = None
     execution: ExecutionConfig | None = None
 
-    @field_validator("limit_price")
-    @classmethod
-    def validate_limit_price(cls, v: float | None, info) -> float | None:
-        if info.data.get("order_type") == OrderType.LIMIT and v is None:
+    @model_validator(mode="after")
+    def validate_prices(self) -> "CreateOrderRequest":
+        """\u6309\u8ba2\u5355\u7c7b\u578b\u9a8c\u8bc1\u4ef7\u683c (\u5b57\u6bb5\u672a\u4f20\u65f6\u540c\u6837\u6821\u9a8c)"""
+        if self.order_type == OrderType.LIMIT and self.limit_price is None:
             raise ValueError("\u9650\u4ef7\u5355\u5fc5\u987b\u6307\u5b9a\u9650\u4ef7")
-        return v
-
-    @field_validator("stop_price")
-    @classmethod
-    def validate_stop_price(cls, v: float | None, info) -> float | None:
-        order_type = info.data.get("order_type")
-        if order_type in {OrderType.STOP, OrderType.STOP_LIMIT} and v is None:
+        if self.order_type in {OrderType.STOP, OrderType.STOP_LIMIT} and self.stop_price is None:
             raise ValueError("\u6b62\u635f\u5355\u5fc5\u987b\u6307\u5b9a\u6b62\u635f\u4ef7")
-        return v
+        return self
 
 
 class OrderResponse(BaseModel):
@@ -332,7 +340,7 @@ class PaperTradingConfig(BaseModel):
     """Paper Trading \u914d\u7f6e"""
     initial_capital: float = Field(100000.0, gt=0)
     commission_rate: float = Field(0.0, ge=0.0, le=0.01)
-    slippage_config: SlippageConfig = SlippageConfig()
+    slippage_config: SlippageConfig = Field(default_factory=lambda: SlippageConfig())
     allow_shorting: bool = False
     margin_rate: float = Field(0.5, ge=0.25, le=1.0)
 
@@ -342,8 +350,8 @@ class PaperTradingState(BaseModel):
     enabled: bool = False
     config: PaperTradingConfig
     account: BrokerAccount | None = None
-    positions: list[BrokerPosition] = []
-    orders: list[OrderResponse] = []
+    positions: list[BrokerPosition] = Field(default_factory=list)
+    orders: list[OrderResponse] = Field(default_factory=list)
     trades_today: int = 0
 
 
@@ -365,7 +373,7 @@ class AccountResponse(BaseModel):
 class PositionsResponse(BaseModel):
     """\u6301\u4ed3\u54cd\u5e94"""
     success: bool
-    positions: list[BrokerPosition] = []
+    positions: list[BrokerPosition] = Field(default_factory=list)
     total_value: float = 0.0
     unrealized_pnl: float = 0.0
 
@@ -373,7 +381,7 @@ class PositionsResponse(BaseModel):
 class OrdersResponse(BaseModel):
     """\u8ba2\u5355\u5217\u8868\u54cd\u5e94"""
     success: bool
-    orders: list[OrderResponse] = []
+    orders: list[OrderResponse] = Field(default_factory=list)
     total: int = 0
 
 
@@ -426,7 +434,7 @@ class ReconciliationReport(BaseModel):
     drifted_count: int = 0
     local_only_count: int = 0
     remote_only_count: int = 0
-    diffs: list[PositionDiffSchema] = []
+    diffs: list[PositionDiffSchema] = Field(default_factory=list)
 
     # 汇总信息
     local_total_value: float = 0.0
@@ -434,7 +442,7 @@ class ReconciliationReport(BaseModel):
     value_diff: float = 0.0
 
     # 建议操作
-    suggested_actions: list[str] = []
+    suggested_actions: list[str] = Field(default_factory=list)
 
 
 class ReconciliationResponse(BaseModel):
@@ -11,7 +11,7 @@ from datetime import date
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 # ============================================================
@@ -128,6 +128,8 @@ class WalkForwardRequest(BaseModel):
 
 class BacktestMetricsSchema(BaseModel):
     """回测指标"""
+    model_config = ConfigDict(defer_build=True)
+
     total_return: float = Field(..., description="总收益")
     annual_return: float = Field(..., description="年化收益")
     volatility: float = Field(0.0, description="年化波动率")
@@ -143,6 +145,8 @@ class BacktestMetricsSchema(BaseModel):
 
 class WalkForwardRound(BaseModel):
     """Walk-Forward 单轮结果"""
+    model_config = ConfigDict(defer_build=True)
+
     round_number: int = Field(..., description="轮次")
     train_start: date = Field(..., description="训练开始日期")
     train_end: date = Field(..., description="训练结束日期")
@@ -156,6 +160,8 @@ class WalkForwardRound(BaseModel):
 
 class AggregatedMetrics(BaseModel):
     """汇总指标"""
+    model_config = ConfigDict(defer_build=True)
+
     oos_sharpe: float = Field(..., description="样本外夏普")
     oos_returns: float = Field(..., description="样本外年化收益")
     oos_max_drawdown: float = Field(..., description="样本外最大回撤")
@@ -165,12 +171,16 @@ class AggregatedMetrics(BaseModel):
 
 class EquityPoint(BaseModel):
     """权益曲线点"""
+    model_config = ConfigDict(defer_build=True)
+
     date: str
     value: float
 
 
 class WalkForwardResult(BaseModel):
     """Walk-Forward 验证结果"""
+    model_config = ConfigDict(defer_build=True)
+
     config: WalkForwardConfig
     rounds: list[WalkForwardRound]
     aggregated_metrics: AggregatedMetrics
@@ -189,6 +199,8 @@ class WalkForwardResult(BaseModel):
 
 class SensitivityCurvePoint(BaseModel):
     """敏感性曲线点"""
+    model_config = ConfigDict(defer_build=True)
+
     param_value: float
     sharpe: float
     returns: float
@@ -196,6 +208,8 @@ class SensitivityCurvePoint(BaseModel):
 
 class ParameterSensitivity(BaseModel):
     """参数敏感性分析"""
+    model_config = ConfigDict(defer_build=True)
+
     parameter: str = Field(..., description="参数名")
     parameter_label: str = Field(..., description="参数标签")
     sensitivity_score: float = Field(..., ge=0, le=1, description="敏感度得分")
@@ -207,6 +221,8 @@ class ParameterSensitivity(BaseModel):
 
 class InOutSampleComparison(BaseModel):
     """样本内外对比"""
+    model_config = ConfigDict(defer_build=True)
+
     in_sample_sharpe: float
     out_sample_sharpe: float
     in_sample_returns: float
@@ -217,6 +233,8 @@ class InOutSampleComparison(BaseModel):
 
 class DeflatedSharpeRatio(BaseModel):
     """Deflated Sharpe Ratio"""
+    model_config = ConfigDict(defer_build=True)
+
     original_sharpe: float = Field(..., description="原始夏普")
     deflated_sharpe: float = Field(..., description="调整后夏普")
     trials_count: int = Field(..., description="试验次数")
@@ -227,6 +245,8 @@ class DeflatedSharpeRatio(BaseModel):
 
 class SharpeUpperBound(BaseModel):
     """夏普比率上限检验"""
+    model_config = ConfigDict(defer_build=True)
+
     observed_sharpe: float
     theoretical_upper_bound: float
     exceeds_probability: float
@@ -235,6 +255,8 @@ class SharpeUpperBound(BaseModel):
 
 class OverallOverfitAssessment(BaseModel):
     """综合过拟合评估"""
+    model_config = ConfigDict(defer_build=True)
+
     overfit_probability: float = Field(..., ge=0, le=100, description="过拟合概率")
     confidence: Confidence = Field(..., description="置信度")
     risk_level: RiskLevel = Field(..., description="风险等级")
@@ -244,6 +266,8 @@ class OverallOverfitAssessment(BaseModel):
 
 class OverfitDetectionResult(BaseModel):
     """过拟合检测结果"""
+    model_config = ConfigDict(defer_build=True)
+
     parameter_sensitivity: list[ParameterSensitivity] = Field(
         default_factory=list,
         description="参数敏感性分析"
@@ -282,6 +306,8 @@ class OverfitDetectionRequest(BaseModel):
 
 class LookaheadBiasIssue(BaseModel):
     """前视偏差问题"""
+    model_config = ConfigDict(defer_build=True)
+
     field: str = Field(..., description="字段名")
     description: str = Field(..., description="问题描述")
     severity: Severity = Field(..., description="严重程度")
@@ -291,6 +317,8 @@ class LookaheadBiasIssue(BaseModel):
 
 class LookaheadBiasDetection(BaseModel):
     """前视偏差检测"""
+    model_config = ConfigDict(defer_build=True)
+
     detected: bool = Field(..., description="是否检测到")
     issues: list[LookaheadBiasIssue] = Field(default_factory=list, description="问题列表")
     risk_score: float = Field(0.0, ge=0, le=100, description="风险得分")
@@ -298,6 +326,8 @@ class LookaheadBiasDetection(BaseModel):
 
 class SurvivorshipBiasDetection(BaseModel):
     """幸存者偏差检测"""
+    model_config = ConfigDict(defer_build=True)
+
     detected: bool = Field(..., description="是否检测到")
     delisted_stocks_used: list[str] = Field(
         default_factory=list,
@@ -310,6 +340,8 @@ class SurvivorshipBiasDetection(BaseModel):
 
 class DataSnoopingBias(BaseModel):
     """数据窥探偏差"""
+    model_config = ConfigDict(defer_build=True)
+
     trials_count: int = Field(..., description="试验次数")
     original_p_value: float = Field(..., description="原始 p 值")
     adjusted_p_value: float = Field(..., description="调整后 p 值")
@@ -319,6 +351,8 @@ class DataSnoopingBias(BaseModel):
 
 class OverallBiasAssessment(BaseModel):
     """综合偏差评估"""
+    model_config = ConfigDict(defer_build=True)
+
     total_issues: int = Field(0, description="总问题数")
     critical_issues: int = Field(0, description="严重问题数")
     risk_level: BiasRiskLevel = Field(..., description="风险等级")
@@ -327,6 +361,8 @@ class OverallBiasAssessment(BaseModel):
 
 class BiasDetectionResult(BaseModel):
     """偏差检测结果"""
+    model_config = ConfigDict(defer_build=True)
+
     lookahead_bias: LookaheadBiasDetection | None = None
     survivorship_bias: SurvivorshipBiasDetection | None = None
     data_snooping_bias: DataSnoopingBias | None = None
@@ -339,7 +375,7 @@ class BiasDetectionRequest(BaseModel):
     start_date: date = Field(..., description="开始日期")
     end_date: date = Field(..., description="结束日期")
     detection_types: list[str] = Field(
-        ["lookahead", "survivorship", "snooping"],
+        default_factory=lambda: ["lookahead", "survivorship", "snooping"],
         description="检测类型"
     )
 
@@ -358,6 +394,8 @@ class AdvancedBacktestStatus(str, Enum):
 
 class AdvancedBacktestTask(BaseModel):
     """高级回测任务"""
+    model_config = ConfigDict(defer_build=True)
+
     task_id: str = Field(..., description="任务 ID")
     task_type: str = Field(..., description="任务类型")
     strategy_id: str = Field(..., description="策略 ID")
@@ -77,10 +77,10 @@ class ConflictService:
             impact="同时执行将形成对冲，可能导致交易成本浪费",
             suggested_resolution=ResolutionAction.EXECUTE_STRATEGY_A,
             resolution_reason="动量策略信号强度更高(0.85 vs 0.72)，且预期收益更好",
-            alternative_resolutions=[
+            alternative_resolutions=(
                 ResolutionAction.EXECUTE_STRATEGY_B,
                 ResolutionAction.CANCEL_BOTH,
-            ],
+            ),
             detected_at=datetime.now(),
             expires_at=datetime.now() + timedelta(hours=1),
         )
@@ -113,10 +113,10 @@ class ConflictService:
             impact="无法完整执行买入信号，可能错过投资机会",
             suggested_resolution=ResolutionAction.REDUCE_POSITION,
             resolution_reason="建议减少买入数量至40股，确保在资金范围内执行",
-            alternative_resolutions=[
+            alternative_resolutions=(
                 ResolutionAction.DELAY_EXECUTION,
                 ResolutionAction.IGNORE,
-            ],
+            ),
             detected_at=datetime.now(),
             expires_at=datetime.now() + timedelta(hours=2),
         )
@@ -160,10 +160,10 @@ class ConflictService:
             impact="同时执行将增加单股仓位占比，集中度风险上升",
             suggested_resolution=ResolutionAction.EXECUTE_STRATEGY_B,
             resolution_reason="因子选股策略信号质量更高，建议执行该策略",
-            alternative_resolutions=[
+            alternative_resolutions=(
                 ResolutionAction.EXECUTE_BOTH,
                 ResolutionAction.EXECUTE_STRATEGY_A,
-            ],
+            ),
             detected_at=datetime.now(),
             expires_at=datetime.now() + timedelta(hours=1),
         )
@@ -200,16 +200,8 @@ class ConflictService:
                     conflicts.append(conflict)
                     seen_ids.add(cid)
 
-        # 统计
-        critical_count = sum(1 for c in conflicts if c.severity == ConflictSeverity.CRITICAL)
-        warning_count = sum(1 for c in conflicts if c.severity == ConflictSeverity.WARNING)
-        info_count = sum(1 for c in conflicts if c.severity == ConflictSeverity.INFO)
-
+        # 各级计数由 ConflictCheckResult 单次遍历得出
         return ConflictCheckResult(
-            total_conflicts=len(conflicts),
-            critical_count=critical_count,
-            warning_count=warning_count,
-            info_count=info_count,
             conflicts=sorted(conflicts, key=lambda c: (
                 0 if c.severity == ConflictSeverity.CRITICAL else
                 1 if c.severity == ConflictSeverity.WARNING else 2
@@ -311,8 +303,8 @@ class ConflictService:
     ) -> ConflictDetail:
         """创建新冲突(用于实时检测)"""
         # 确定严重程度
-        from app.schemas.conflict import CONFLICT_TYPE_CONFIG
-        severity = CONFLICT_TYPE_CONFIG[conflict_type]["default_severity"]
+        from app.schemas.conflict import conflict_type_info
+        severity = conflict_type_info(conflict_type).default_severity
 
         # 生成建议解决方案
         suggested_resolution, resolution_reason = self._suggest_resolution(
@@ -396,32 +388,32 @@ class ConflictService:
 
     def _get_alternative_resolutions(
         self, conflict_type: ConflictType
-    ) -> list[ResolutionAction]:
+    ) -> tuple[ResolutionAction, ...]:
         """获取可选解决方案"""
         if conflict_type == ConflictType.LOGIC:
-            return [
+            return (
                 ResolutionAction.EXECUTE_STRATEGY_A,
                 ResolutionAction.EXECUTE_STRATEGY_B,
                 ResolutionAction.CANCEL_BOTH,
-            ]
+            )
         elif conflict_type == ConflictType.EXECUTION:
-            return [
+            return (
                 ResolutionAction.REDUCE_POSITION,
                 ResolutionAction.DELAY_EXECUTION,
                 ResolutionAction.IGNORE,
-            ]
+            )
         elif conflict_type == ConflictType.TIMEOUT:
-            return [
+            return (
                 ResolutionAction.CANCEL_BOTH,
                 ResolutionAction.IGNORE,
-            ]
+            )
         elif conflict_type == ConflictType.DUPLICATE:
-            return [
+            return (
                 ResolutionAction.EXECUTE_STRATEGY_A,
                 ResolutionAction.EXECUTE_STRATEGY_B,
                 ResolutionAction.EXECUTE_BOTH,
-            ]
-        return [ResolutionAction.IGNORE]
+            )
+        return (ResolutionAction.IGNORE,)
 
 
 # 单例服务实例
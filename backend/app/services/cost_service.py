@@ -132,16 +132,21 @@ class CostService:
 
         trade_value = request.quantity * request.price
 
+        # 费率在配置中以 Decimal 存放, 每次估算只转换一次为 float 参与计算
+        commission_rate = float(config.commission_per_share)
+        sec_fee_rate = float(config.sec_fee_rate)
+        taf_fee_rate = float(config.taf_fee_per_share)
+
         # 1. 佣金计算
-        commission = float(config.commission_per_share) * request.quantity
+        commission = commission_rate * request.quantity
 
         # 2. SEC费用 (仅卖出)
         sec_fee = 0.0
         if request.side == "sell":
-            sec_fee = float(config.sec_fee_rate) * trade_value
+            sec_fee = sec_fee_rate * trade_value
 
         # 3. TAF费用
-        taf_fee = float(config.taf_fee_per_share) * request.quantity
+        taf_fee = taf_fee_rate * request.quantity
 
         # 4. 滑点成本
         slippage_cost = self._calculate_slippage(
@@ -170,17 +175,17 @@ class CostService:
         breakdown = {
             "commission": {
                 "amount": round(commission, 4),
-                "rate": f"${float(config.commission_per_share)}/股",
+                "rate": f"${commission_rate}/股",
                 "pct": round(commission / trade_value * 100, 4) if trade_value > 0 else 0,
             },
             "sec_fee": {
                 "amount": round(sec_fee, 4),
-                "rate": f"{float(config.sec_fee_rate) * 100:.6f}%",
+                "rate": f"{sec_fee_rate * 100:.6f}%",
                 "note": "仅卖出收取",
             },
             "taf_fee": {
                 "amount": round(taf_fee, 4),
-                "rate": f"${float(config.taf_fee_per_share)}/股",
+                "rate": f"${taf_fee_rate}/股",
             },
             "slippage": {
                 "amount": round(slippage_cost, 4),
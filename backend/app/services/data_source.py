@@ -9,12 +9,15 @@ Phase 11: \u6570\u636e\u5c42\u5347\u7ea7 - \u6570\u636e\u6e90\u670d\u52a1
 """
 
 import asyncio
+import sys
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from datetime import datetime, timedelta
 from typing import Any
 
 import httpx
 import structlog
+from pydantic_core import from_json
 
 from app.core.config import settings
 from app.schemas.market_data import (
@@ -104,7 +107,8 @@ class BaseDataSource(ABC):
                 raise Exception("Rate limit exceeded")
 
             response.raise_for_status()
-            return response.json()
+            # 大批量K线响应直接由 pydantic-core 从原始字节解析
+            return from_json(response.content)
 
         except httpx.HTTPStatusError as e:
             self.status = DataSourceStatus.ERROR
@@ -539,6 +543,8 @@ class DataSourceManager:
         source: DataSource | None = None,
     ) -> list[OHLCVBar]:
         """获取K线数据 (自动故障转移)"""
+        # 所有K线共享同一 symbol 对象, 跨请求也复用同一份
+        symbol = sys.intern(symbol)
         sources_to_try = []
 
         if source:
@@ -552,13 +558,25 @@ class DataSourceManager:
                 continue
 
             try:
-                return await self._sources[src].get_bars(
+                bars = await self._sources[src].get_bars(
                     symbol, frequency, start_date, end_date, adjusted
                 )
             except Exception as e:
                 logger.warning(f"{src} 获取数据失败，尝试下一个数据源", error=str(e))
                 continue
 
+            # 各数据源的K线均经此返回, 在入口处统一校验 OHLC 不变量;
+            # 单根不一致 (含 NaN) 的K线剔除并记录, 不影响整批数据
+            valid_bars = []
+            for bar in bars:
+                try:
+                    bar.validate()
+                except ValueError as e:
+                    logger.warning(f"{src} 返回 {symbol} 的无效K线, 已丢弃", error=str(e))
+                    continue
+                valid_bars.append(bar)
+            return valid_bars
+
         raise Exception(f"所有数据源都无法获取 {symbol} 的数据")
 
     async def get_snapshot(
@@ -572,7 +590,7 @@ class DataSourceManager:
 
     async def get_multiple_snapshots(
         self,
-        symbols: list[str],
+        symbols: Sequence[str],
     ) -> dict[str, MarketSnapshot]:
         """批量获取市场快照"""
         results = {}
@@ -29,7 +29,7 @@ from app.models.deployment import (
 from app.schemas.deployment import (
     Deployment, DeploymentCreate, DeploymentUpdate,
     DeploymentConfig, DeploymentStatus, DeploymentEnvironment,
-    ParamLimits, ParamRange, RiskParams, CapitalConfig, StrategyType
+    ParamLimits, ParamRange, RiskParams, CapitalConfig, StrategyType, to_cents
 )
 
 logger = structlog.get_logger()
@@ -101,13 +101,18 @@ def model_to_schema_strategy_type(st: StrategyTypeEnum) -> StrategyType:
 
 
 def model_to_schema(model: DeploymentModel) -> Deployment:
-    """Model实例转Schema实例"""
+    """
+    Model实例转Schema实例
+
+    数据库行在写入时已通过 Schema 校验, 属于可信数据, 这里使用 model_construct
+    逐层构建嵌套模型, 跳过 pydantic-core 的重复校验 (列表接口会批量调用).
+    """
     # 从model.config重建DeploymentConfig
     config_dict = model.config or {}
 
     # 构建风控参数
     risk_params_dict = config_dict.get("risk_params", {})
-    risk_params = RiskParams(
+    risk_params = RiskParams.model_construct(
         stop_loss=risk_params_dict.get("stop_loss", -0.05),
         take_profit=risk_params_dict.get("take_profit", 0.10),
         max_position_pct=risk_params_dict.get("max_position_pct", 0.10),
@@ -116,14 +121,14 @@ def model_to_schema(model: DeploymentModel) -> Deployment:
 
     # 构建资金配置
     capital_dict = config_dict.get("capital_config", {})
-    capital_config = CapitalConfig(
+    capital_config = CapitalConfig.model_construct(
         total_capital=Decimal(str(capital_dict.get("total_capital", 10000))),
         initial_position_pct=capital_dict.get("initial_position_pct", 0.80),
         reserve_cash_pct=capital_dict.get("reserve_cash_pct", 0.20),
     )
 
     # 构建部署配置
-    deployment_config = DeploymentConfig(
+    deployment_config = DeploymentConfig.model_construct(
         strategy_id=model.strategy_id,
         deployment_name=model.deployment_name,
         environment=model_to_schema_env(model.environment),
@@ -135,7 +140,7 @@ def model_to_schema(model: DeploymentModel) -> Deployment:
         rebalance_time=config_dict.get("rebalance_time", "09:35"),
     )
 
-    return Deployment(
+    return Deployment.model_construct(
         deployment_id=model.id,
         strategy_id=model.strategy_id,
         strategy_name=model.strategy_name,
@@ -144,7 +149,7 @@ def model_to_schema(model: DeploymentModel) -> Deployment:
         status=model_to_schema_status(model.status),
         strategy_type=model_to_schema_strategy_type(model.strategy_type),
         config=deployment_config,
-        current_pnl=Decimal(str(model.current_pnl)),
+        current_pnl_cents=to_cents(model.current_pnl),
         current_pnl_pct=model.current_pnl_pct,
         total_trades=model.total_trades,
         win_rate=model.win_rate,
@@ -589,7 +594,7 @@ class DeploymentService:
             take_profit_range=self.DEFAULT_PARAM_LIMITS["take_profit"],
             max_position_pct_range=self.DEFAULT_PARAM_LIMITS["max_position_pct"],
             max_drawdown_range=self.DEFAULT_PARAM_LIMITS["max_drawdown"],
-            min_capital=Decimal("1000"),
+            min_capital_cents=100_000,
             available_symbols=["AAPL", "MSFT", "GOOGL", "AMZN", "META", "NVDA", "TSLA"],
         )
 
@@ -646,7 +651,7 @@ class DeploymentService:
                 f"止损比例超出范围 [{limits.stop_loss_range.min_value}, {limits.stop_loss_range.max_value}]"
             )
 
-        # 验证资金
+        # 验证资金: 按原始 Decimal 金额比较, 避免四舍五入到美分后 999.995 被当作 1000
         if config.capital_config.total_capital < limits.min_capital:
             raise ValueError(f"资金不足，最低要求 ${limits.min_capital}")
 
@@ -8,6 +8,8 @@ from typing import Optional
 import random
 import math
 
+import numpy as np
+
 from app.schemas.factor_validation import (
     FactorValidationResult,
     ICStatistics,
@@ -129,8 +131,8 @@ class FactorValidationService:
         # 生成风险提示
         risk_warnings = self._generate_risk_warnings(factor_id, category)
 
-        # 构建结果
-        result = FactorValidationResult(
+        # 构建结果 (各字段均由本服务生成, 直接构造, 不再逐字段校验)
+        result = FactorValidationResult.model_construct(
             factor_id=factor_id,
             factor_name=factor_name,
             factor_category=category,
@@ -175,19 +177,16 @@ class FactorValidationService:
         ic_std = abs(ic_mean) / random.uniform(0.3, 0.7)
         ic_ir = ic_mean / ic_std if ic_std > 0 else 0
 
-        # 生成IC时序
-        ic_series = []
-        ic_dates = []
-        current_date = date(2023, 1, 1)
-        for i in range(24):  # 24个月
-            ic_value = ic_mean + random.uniform(-0.03, 0.03)
-            ic_series.append(round(ic_value, 4))
-            ic_dates.append(current_date.strftime("%Y-%m"))
-            current_date = date(
-                current_date.year + (current_date.month // 12),
-                (current_date.month % 12) + 1,
-                1,
-            )
+        # 生成IC时序 (24个月), 直接写入 ndarray
+        n_months = 24
+        ic_series = np.fromiter(
+            (ic_mean + random.uniform(-0.03, 0.03) for _ in range(n_months)),
+            dtype=np.float64,
+            count=n_months,
+        ).round(4)
+        ic_dates = np.arange(
+            np.datetime64("2023-01", "M"), np.datetime64("2023-01", "M") + n_months
+        )
 
         return ICStatistics(
             ic_mean=round(ic_mean, 4),
@@ -7,10 +7,16 @@ PRD 4.17 策略回放功能
 
 import random
 from datetime import date, datetime, timedelta
-from decimal import Decimal
 from typing import AsyncGenerator, Optional
 
-from app.schemas.replay import FactorSnapshot, HistoricalBar, ThresholdConfig
+from app.schemas.replay import (
+    FactorSnapshot,
+    HistoricalBar,
+    ReplayFactorValues,
+    ReplayThresholds,
+    SignalLiteral,
+    ThresholdConfig,
+)
 
 
 class HistoricalDataService:
@@ -175,10 +181,10 @@ class HistoricalDataService:
 
                     bar = HistoricalBar(
                         timestamp=timestamp,
-                        open=Decimal(str(round(open_price, 2))),
-                        high=Decimal(str(round(high_price, 2))),
-                        low=Decimal(str(round(low_price, 2))),
-                        close=Decimal(str(round(close_price, 2))),
+                        open=round(open_price, 2),
+                        high=round(high_price, 2),
+                        low=round(low_price, 2),
+                        close=round(close_price, 2),
                         volume=max(volume, 1000),
                     )
                     bars.append(bar)
@@ -193,8 +199,8 @@ class HistoricalDataService:
         self, bar: HistoricalBar, historical_bars: list[HistoricalBar]
     ) -> FactorSnapshot:
         """计算因子值"""
-        close_prices = [float(b.close) for b in historical_bars]
-        current_close = float(bar.close)
+        close_prices = [b.close for b in historical_bars]
+        current_close = bar.close
 
         # RSI计算 (简化版)
         rsi = self._calculate_rsi(close_prices, 14)
@@ -214,7 +220,7 @@ class HistoricalDataService:
         )
 
         # 因子值
-        factor_values = {
+        factor_values: ReplayFactorValues = {
             "RSI": rsi,
             "MACD": macd,
             "MACD_Signal": signal,
@@ -224,24 +230,28 @@ class HistoricalDataService:
         }
 
         # 阈值检查
-        thresholds = {
-            "RSI": ThresholdConfig(value=30, direction="below", passed=rsi < 30),
-            "MACD": ThresholdConfig(
-                value=0, direction="above", passed=macd > signal
-            ),
-            "Volatility": ThresholdConfig(
-                value=0.03, direction="above", passed=volatility > 0.03
-            ),
-            "Volume_Ratio": ThresholdConfig(
-                value=1.5, direction="above", passed=volume_ratio > 1.5
-            ),
+        rsi_check = ThresholdConfig(value=30, direction="below", passed=rsi < 30)
+        macd_check = ThresholdConfig(value=0, direction="above", passed=macd > signal)
+        volatility_check = ThresholdConfig(
+            value=0.03, direction="above", passed=volatility > 0.03
+        )
+        volume_check = ThresholdConfig(
+            value=1.5, direction="above", passed=volume_ratio > 1.5
+        )
+        thresholds: ReplayThresholds = {
+            "RSI": rsi_check,
+            "MACD": macd_check,
+            "Volatility": volatility_check,
+            "Volume_Ratio": volume_check,
         }
 
         # 计算满足条件数
-        conditions_met = sum(1 for t in thresholds.values() if t.passed)
-        conditions_total = len(thresholds)
+        checks = (rsi_check, macd_check, volatility_check, volume_check)
+        conditions_met = sum(1 for t in checks if t.passed)
+        conditions_total = len(checks)
 
         # 综合信号
+        overall_signal: SignalLiteral
         if conditions_met >= 3:
             overall_signal = "buy"
         elif conditions_met <= 1:
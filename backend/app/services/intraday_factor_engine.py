@@ -13,6 +13,7 @@ Phase 11: \u6570\u636e\u5c42\u5347\u7ea7 - \u65e5\u5185\u56e0\u5b50\u8ba1\u7b97\
 """
 
 import asyncio
+from collections.abc import Sequence
 from datetime import datetime, timedelta
 from typing import Any
 
@@ -28,6 +29,7 @@ from app.schemas.market_data import (
     IntradayFactorType,
     IntradayFactorValue,
     IntradayFactorSnapshot,
+    IntradayFactorMatrix,
     DataFrequency,
 )
 
@@ -114,7 +116,7 @@ class IntradayFactorEngine:
 
     async def calculate_batch(
         self,
-        symbols: list[str],
+        symbols: Sequence[str],
         timestamp: datetime | None = None,
     ) -> list[IntradayFactorSnapshot]:
         """\u6279\u91cf\u8ba1\u7b97\u591a\u53ea\u80a1\u7968\u7684\u56e0\u5b50"""
@@ -128,6 +130,18 @@ class IntradayFactorEngine:
 
         return results
 
+    async def calculate_matrix(
+        self,
+        symbols: Sequence[str],
+        timestamp: datetime | None = None,
+    ) -> IntradayFactorMatrix:
+        """\u6279\u91cf\u8ba1\u7b97\u5e76\u6c47\u603b\u4e3a\u6a2a\u622a\u9762\u56e0\u5b50\u77e9\u9635"""
+        if timestamp is None:
+            timestamp = datetime.now()
+
+        snapshots = await self.calculate_batch(symbols, timestamp)
+        return IntradayFactorMatrix.from_snapshots(snapshots, timestamp)
+
     async def _get_intraday_bars(
         self,
         session: AsyncSession,
@@ -265,22 +279,26 @@ class IntradayFactorEngine:
 
     async def save_factors(
         self,
-        snapshots: list[IntradayFactorSnapshot],
+        matrix: IntradayFactorMatrix,
     ) -> int:
-        """\u4fdd\u5b58\u56e0\u5b50\u5230\u6570\u636e\u5e93"""
+        """\u4fdd\u5b58\u56e0\u5b50\u5230\u6570\u636e\u5e93 (\u9644\u5e26\u6a2a\u622a\u9762 z-score \u4e0e\u767e\u5206\u4f4d)"""
         saved_count = 0
+        zscores = matrix.zscores()
+        percentiles = matrix.percentiles()
 
         async with get_async_session() as session:
-            for snapshot in snapshots:
-                for factor_id, value in snapshot.factors.items():
-                    factor = IntradayFactor(
-                        symbol=snapshot.symbol,
-                        timestamp=snapshot.timestamp,
-                        factor_id=factor_id,
-                        value=value,
-                    )
-                    session.add(factor)
-                    saved_count += 1
+            for row, col in zip(*np.nonzero(~np.isnan(matrix.values)), strict=True):
+                zscore = zscores[row, col]
+                factor = IntradayFactor(
+                    symbol=matrix.symbols[row],
+                    timestamp=matrix.timestamp,
+                    factor_id=matrix.factor_names[col],
+                    value=float(matrix.values[row, col]),
+                    zscore=None if np.isnan(zscore) else float(zscore),
+                    percentile=float(percentiles[row, col]),
+                )
+                session.add(factor)
+                saved_count += 1
 
             await session.commit()
 
@@ -319,7 +337,7 @@ class IntradayFactorEngine:
 
     async def get_latest_factors(
         self,
-        symbols: list[str],
+        symbols: Sequence[str],
     ) -> dict[str, IntradayFactorSnapshot]:
         """\u83b7\u53d6\u591a\u53ea\u80a1\u7968\u7684\u6700\u65b0\u56e0\u5b50"""
         async with get_async_session() as session:
@@ -353,7 +371,6 @@ class IntradayFactorEngine:
 
             return results
 
-
 class IntradayFactorScheduler:
     """\u65e5\u5185\u56e0\u5b50\u8ba1\u7b97\u8c03\u5ea6\u5668"""
 
@@ -364,7 +381,7 @@ class IntradayFactorScheduler:
 
     async def start(
         self,
-        symbols: list[str],
+        symbols: Sequence[str],
         interval_seconds: int = 60,
     ):
         """\u542f\u52a8\u5b9a\u65f6\u8ba1\u7b97"""
@@ -375,12 +392,12 @@ class IntradayFactorScheduler:
                 # \u68c0\u67e5\u662f\u5426\u5728\u4ea4\u6613\u65f6\u95f4
                 now = datetime.now()
                 if self._is_market_hours(now):
-                    snapshots = await self.engine.calculate_batch(symbols, now)
-                    await self.engine.save_factors(snapshots)
+                    matrix = await self.engine.calculate_matrix(symbols, now)
+                    saved = await self.engine.save_factors(matrix)
                     logger.info(
                         f"\u56e0\u5b50\u8ba1\u7b97\u5b8c\u6210",
                         symbols=len(symbols),
-                        factors=sum(len(s.factors) for s in snapshots),
+                        factors=saved,
                     )
 
                 await asyncio.sleep(interval_seconds)
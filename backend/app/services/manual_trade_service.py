@@ -80,14 +80,14 @@ class ManualTradeService:
             account_id=account_id,
             strategy_id=request.strategy_id,
             symbol=request.symbol,
-            side=OrderSide(request.side),
-            order_type=OrderType(request.order_type),
+            side=request.side,
+            order_type=request.order_type,
             quantity=request.quantity,
             limit_price=request.limit_price,
             stop_price=request.stop_price,
             take_profit=request.take_profit,
             stop_loss=request.stop_loss,
-            status=OrderStatus.PENDING,
+            status=OrderStatus.PENDING.value,
             created_at=datetime.now(),
         )
 
@@ -95,7 +95,7 @@ class ManualTradeService:
         try:
             # 市价单立即成交
             if request.order_type == OrderType.MARKET.value:
-                order.status = OrderStatus.FILLED
+                order.status = OrderStatus.FILLED.value
                 order.filled_quantity = request.quantity
                 order.filled_price = exec_price
                 order.filled_at = datetime.now()
@@ -103,13 +103,13 @@ class ManualTradeService:
                 order.total_cost = exec_price * request.quantity + order.commission
             else:
                 # 限价单/止损单等待触发
-                order.status = OrderStatus.PENDING
+                order.status = OrderStatus.PENDING.value
 
             # 保存订单
             self._orders[order.order_id] = order
 
             # 7. 如果有止盈止损，创建条件单
-            if order.status == OrderStatus.FILLED and request.side == OrderSide.BUY.value:
+            if order.status == OrderStatus.FILLED.value and request.side == OrderSide.BUY.value:
                 if request.take_profit:
                     await self._create_take_profit_order(order, request.take_profit)
                 if request.stop_loss:
@@ -145,14 +145,14 @@ class ManualTradeService:
         if order.user_id != user_id:
             return CancelOrderResponse(success=False, message="无权操作此订单")
 
-        if order.status != OrderStatus.PENDING:
+        if order.status != OrderStatus.PENDING.value:
             return CancelOrderResponse(
                 success=False,
-                message=f"订单状态为 {order.status.value}，无法取消",
+                message=f"订单状态为 {order.status}，无法取消",
             )
 
         # 执行取消
-        order.status = OrderStatus.CANCELLED
+        order.status = OrderStatus.CANCELLED.value
         order.cancelled_at = datetime.now()
 
         logger.info("订单已取消", order_id=order_id)
@@ -173,7 +173,7 @@ class ManualTradeService:
         orders = [o for o in self._orders.values() if o.user_id == user_id]
 
         if status:
-            orders = [o for o in orders if o.status.value == status]
+            orders = [o for o in orders if o.status == status]
 
         if symbol:
             orders = [o for o in orders if o.symbol == symbol]
@@ -261,15 +261,15 @@ class ManualTradeService:
             if (
                 order.account_id == account_id
                 and order.symbol == symbol
-                and order.status == OrderStatus.FILLED
+                and order.status == OrderStatus.FILLED.value
                 and order.filled_at
                 and order.filled_at.date() == today
             ):
                 # 如果今天已经有买入，现在卖出，则是日内交易
-                if order.side == OrderSide.BUY and side == OrderSide.SELL.value:
+                if order.side == OrderSide.BUY.value and side == OrderSide.SELL.value:
                     return True
                 # 如果今天已经有卖出（做空），现在买入，则是日内交易
-                if order.side == OrderSide.SELL and side == OrderSide.BUY.value:
+                if order.side == OrderSide.SELL.value and side == OrderSide.BUY.value:
                     return True
 
         return False
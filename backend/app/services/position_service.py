@@ -3,10 +3,11 @@
 PRD 4.18 分策略持仓管理
 """
 import uuid
-from collections import defaultdict
+from collections.abc import Sequence
 from datetime import datetime
 from typing import Optional
 
+import numpy as np
 import structlog
 
 from app.schemas.position import (
@@ -14,6 +15,7 @@ from app.schemas.position import (
     ConsolidatedPosition,
     PositionGroup,
     PositionSource,
+    PositionsTable,
     SellPositionRequest,
     SellPositionResponse,
     StrategyPosition,
@@ -23,6 +25,15 @@ from app.schemas.position import (
 logger = structlog.get_logger()
 
 
+def _group_codes(keys: Sequence[str]) -> tuple[list[str], np.ndarray]:
+    """按首次出现顺序为分组键编号, 返回 (分组键列表, 每行的组号)"""
+    index: dict[str, int] = {}
+    codes = np.fromiter(
+        (index.setdefault(k, len(index)) for k in keys), dtype=np.intp, count=len(keys)
+    )
+    return list(index), codes
+
+
 class PositionService:
     """分策略持仓服务"""
 
@@ -105,7 +116,7 @@ class PositionService:
             unrealized_pnl = market_value - cost_basis
             unrealized_pnl_pct = (unrealized_pnl / cost_basis) * 100 if cost_basis > 0 else 0
 
-            self._positions[position_id] = StrategyPosition(
+            position = StrategyPosition(
                 position_id=position_id,
                 user_id="user_001",
                 account_id="account_001",
@@ -121,6 +132,8 @@ class PositionService:
                 created_at=now,
                 updated_at=now,
             )
+            position.validate()
+            self._positions[position_id] = position
 
     async def get_account_positions(
         self,
@@ -136,29 +149,30 @@ class PositionService:
 
         # 2. 更新实时价格 (模拟)
         await self._update_prices(all_positions)
+        table = PositionsTable.from_positions(all_positions)
 
-        # 3. 按策略分组
-        groups = self._group_by_strategy(all_positions)
-
-        # 4. 生成同股票汇总
-        consolidated = self._consolidate_positions(all_positions)
-
-        # 5. 计算账户总值
+        # 3. 计算账户总值
         account = self._accounts.get(account_id, {"cash": 0})
-        total_market_value = sum(p.market_value for p in all_positions)
+        total_market_value = float(table.market_value.sum())
         total_cash = account.get("cash", 0)
         total_equity = total_cash + total_market_value
-        total_cost = sum(p.quantity * p.avg_cost for p in all_positions)
-        total_unrealized_pnl = sum(p.unrealized_pnl for p in all_positions)
+        total_cost = float(table.cost_basis.sum())
+        total_unrealized_pnl = float(table.unrealized_pnl.sum())
         total_unrealized_pnl_pct = (total_unrealized_pnl / total_cost * 100) if total_cost > 0 else 0
 
+        # 4. 按策略分组
+        groups = self._group_by_strategy(all_positions, table)
+
+        # 5. 生成同股票汇总 (含集中度)
+        consolidated = self._consolidate_positions(all_positions, table, total_equity)
+
         # 6. 检查集中度风险
-        warnings = self._check_concentration(consolidated, total_equity)
+        warnings = self._check_concentration(consolidated)
 
         # 7. 计算组合 Beta
-        portfolio_beta = self._calculate_portfolio_beta(all_positions, total_market_value)
+        portfolio_beta = self._calculate_portfolio_beta(table, total_market_value)
 
-        return AccountPositionSummary(
+        return AccountPositionSummary.model_construct(
             account_id=account_id,
             total_market_value=total_market_value,
             total_cash=total_cash,
@@ -293,29 +307,37 @@ class PositionService:
     def _group_by_strategy(
         self,
         positions: list[StrategyPosition],
+        table: PositionsTable,
     ) -> list[PositionGroup]:
         """按策略分组"""
-        grouped: dict[str, list[StrategyPosition]] = defaultdict(list)
+        keys, codes = _group_codes([sid or "__manual__" for sid in table.strategy_ids])
+        n = len(keys)
 
-        for pos in positions:
-            key = pos.strategy_id or "__manual__"
-            grouped[key].append(pos)
+        members: list[list[StrategyPosition]] = [[] for _ in range(n)]
+        for pos, code in zip(positions, codes.tolist(), strict=True):
+            members[code].append(pos)
 
-        groups = []
-        for strategy_id, pos_list in grouped.items():
-            total_value = sum(p.market_value for p in pos_list)
-            total_cost = sum(p.quantity * p.avg_cost for p in pos_list)
-            total_pnl = sum(p.unrealized_pnl for p in pos_list)
+        total_values = np.bincount(codes, weights=table.market_value, minlength=n)
+        total_costs = np.bincount(codes, weights=table.cost_basis, minlength=n)
+        total_pnls = np.bincount(codes, weights=table.unrealized_pnl, minlength=n)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            pnl_pcts = np.where(total_costs > 0, total_pnls / total_costs * 100, 0.0)
 
-            groups.append(PositionGroup(
+        groups = [
+            PositionGroup(
                 strategy_id=None if strategy_id == "__manual__" else strategy_id,
                 strategy_name=pos_list[0].strategy_name or "手动交易",
                 positions=pos_list,
                 total_market_value=total_value,
                 total_unrealized_pnl=total_pnl,
-                total_unrealized_pnl_pct=(total_pnl / total_cost * 100) if total_cost > 0 else 0,
+                total_unrealized_pnl_pct=pnl_pct,
                 position_count=len(pos_list),
-            ))
+            )
+            for strategy_id, pos_list, total_value, total_pnl, pnl_pct in zip(
+                keys, members, total_values.tolist(), total_pnls.tolist(), pnl_pcts.tolist(),
+                strict=True,
+            )
+        ]
 
         # 按市值排序
         groups.sort(key=lambda x: x.total_market_value, reverse=True)
@@ -325,44 +347,65 @@ class PositionService:
     def _consolidate_positions(
         self,
         positions: list[StrategyPosition],
+        table: PositionsTable,
+        total_equity: float,
     ) -> list[ConsolidatedPosition]:
         """同股票汇总"""
-        by_symbol: dict[str, list[StrategyPosition]] = defaultdict(list)
+        symbols, codes = _group_codes(table.symbols)
+        n = len(symbols)
+
+        members: list[list[StrategyPosition]] = [[] for _ in range(n)]
+        for pos, code in zip(positions, codes.tolist(), strict=True):
+            members[code].append(pos)
+
+        total_qtys = np.bincount(codes, weights=table.quantity, minlength=n).astype(np.int64)
+        total_costs = np.bincount(codes, weights=table.cost_basis, minlength=n)
+        total_values = np.bincount(codes, weights=table.market_value, minlength=n)
+        total_pnls = np.bincount(codes, weights=table.unrealized_pnl, minlength=n)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            weighted_avgs = np.where(total_qtys > 0, total_costs / total_qtys, 0.0)
+            pnl_pcts = np.where(total_costs > 0, total_pnls / total_costs * 100, 0.0)
+        concentrations = (
+            total_values / total_equity * 100 if total_equity > 0 else np.zeros(n)
+        )
 
-        for pos in positions:
-            by_symbol[pos.symbol].append(pos)
-
-        consolidated = []
-        for symbol, pos_list in by_symbol.items():
-            total_qty = sum(p.quantity for p in pos_list)
-            total_cost = sum(p.quantity * p.avg_cost for p in pos_list)
-            weighted_avg = total_cost / total_qty if total_qty > 0 else 0
-            total_market_value = sum(p.market_value for p in pos_list)
-            total_pnl = sum(p.unrealized_pnl for p in pos_list)
-
-            sources = [
-                PositionSource(
-                    strategy_id=p.strategy_id,
-                    strategy_name=p.strategy_name or "手动交易",
-                    quantity=p.quantity,
-                    avg_cost=p.avg_cost,
-                    pnl=p.unrealized_pnl,
-                    pnl_pct=p.unrealized_pnl_pct,
-                )
-                for p in pos_list
-            ]
-
-            consolidated.append(ConsolidatedPosition(
+        consolidated = [
+            ConsolidatedPosition(
                 symbol=symbol,
                 total_quantity=total_qty,
                 weighted_avg_cost=weighted_avg,
                 current_price=pos_list[0].current_price,
-                total_market_value=total_market_value,
+                total_market_value=total_value,
                 total_unrealized_pnl=total_pnl,
-                total_unrealized_pnl_pct=(total_pnl / total_cost * 100) if total_cost > 0 else 0,
-                sources=sources,
-                concentration_pct=0,  # 后续计算
-            ))
+                total_unrealized_pnl_pct=pnl_pct,
+                sources=[
+                    PositionSource(
+                        strategy_id=p.strategy_id,
+                        strategy_name=p.strategy_name or "手动交易",
+                        quantity=p.quantity,
+                        avg_cost=p.avg_cost,
+                        pnl=p.unrealized_pnl,
+                        pnl_pct=p.unrealized_pnl_pct,
+                    )
+                    for p in pos_list
+                ],
+                concentration_pct=concentration,
+            )
+            for (
+                symbol, pos_list, total_qty, weighted_avg, total_value,
+                total_pnl, pnl_pct, concentration,
+            ) in zip(
+                symbols,
+                members,
+                total_qtys.tolist(),
+                weighted_avgs.tolist(),
+                total_values.tolist(),
+                total_pnls.tolist(),
+                pnl_pcts.tolist(),
+                concentrations.tolist(),
+                strict=True,
+            )
+        ]
 
         # 按市值排序
         consolidated.sort(key=lambda x: x.total_market_value, reverse=True)
@@ -372,25 +415,20 @@ class PositionService:
     def _check_concentration(
         self,
         consolidated: list[ConsolidatedPosition],
-        total_equity: float,
     ) -> list[str]:
         """检查集中度风险"""
-        warnings = []
+        threshold_pct = self.CONCENTRATION_WARNING_THRESHOLD * 100
 
-        for pos in consolidated:
-            pos.concentration_pct = (pos.total_market_value / total_equity * 100) if total_equity > 0 else 0
-
-            if pos.concentration_pct > self.CONCENTRATION_WARNING_THRESHOLD * 100:
-                warnings.append(
-                    f"⚠️ {pos.symbol} 持仓占比 {pos.concentration_pct:.1f}%，"
-                    f"超过安全阈值 {self.CONCENTRATION_WARNING_THRESHOLD * 100:.0f}%"
-                )
-
-        return warnings
+        return [
+            f"⚠️ {pos.symbol} 持仓占比 {pos.concentration_pct:.1f}%，"
+            f"超过安全阈值 {threshold_pct:.0f}%"
+            for pos in consolidated
+            if pos.concentration_pct > threshold_pct
+        ]
 
     def _calculate_portfolio_beta(
         self,
-        positions: list[StrategyPosition],
+        table: PositionsTable,
         total_market_value: float,
     ) -> float:
         """计算组合 Beta"""
@@ -406,11 +444,12 @@ class PositionService:
         if total_market_value == 0:
             return 1.0
 
-        weighted_beta = 0.0
-        for pos in positions:
-            beta = SYMBOL_BETAS.get(pos.symbol, 1.0)
-            weight = pos.market_value / total_market_value
-            weighted_beta += beta * weight
+        betas = np.fromiter(
+            (SYMBOL_BETAS.get(s, 1.0) for s in table.symbols),
+            dtype=np.float64,
+            count=len(table.symbols),
+        )
+        weighted_beta = float(betas @ table.market_value) / total_market_value
 
         return round(weighted_beta, 2)
 
@@ -14,6 +14,7 @@ import structlog
 
 from app.core.config import settings
 from app.schemas.pre_market import (
+    DEFAULT_SCORE_WEIGHTS,
     CreateWatchlistRequest,
     IntradayWatchlist,
     PreMarketScanFilter,
@@ -172,7 +173,7 @@ class PreMarketService:
         # 生成AI建议
         ai_suggestion = self._generate_ai_suggestion(matched_stocks[:10])
 
-        return PreMarketScanResult(
+        return PreMarketScanResult.model_construct(
             scan_time=datetime.now(),
             strategy_id=strategy_id,
             strategy_name=f"策略-{strategy_id[:8]}",
@@ -399,11 +400,12 @@ class PreMarketService:
         news_score = 10 if has_news else 0
 
         # 加权计算
+        weights = DEFAULT_SCORE_WEIGHTS
         total = (
-            gap_score * 0.3 +
-            volume_score * 0.3 +
-            volatility_score * 0.2 +
-            news_score
+            gap_score * weights["gap"] +
+            volume_score * weights["volume"] +
+            volatility_score * weights["volatility"] +
+            news_score * weights["news"]
         )
 
         breakdown = ScoreBreakdown(
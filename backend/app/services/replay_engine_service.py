@@ -7,7 +7,6 @@ PRD 4.17 策略回放功能
 
 import uuid
 from datetime import datetime
-from decimal import Decimal
 from typing import Optional
 
 from app.schemas.replay import (
@@ -67,8 +66,8 @@ class ReplayEngineService:
             current_bar_index=0,
             total_bars=len(bars),
             position_quantity=0,
-            position_avg_cost=Decimal("0"),
-            cash=Decimal("100000"),
+            position_avg_cost=0.0,
+            cash=100000.0,
             total_signals=len(signal_markers),
             executed_signals=0,
             total_return_pct=0,
@@ -82,7 +81,7 @@ class ReplayEngineService:
             "factor_snapshots": factor_snapshots,
             "signal_markers": signal_markers,
             "events": [],
-            "start_price": float(bars[0].close) if bars else 0,
+            "start_price": bars[0].close if bars else 0,
         }
 
         return {
@@ -254,9 +253,9 @@ class ReplayEngineService:
                 # 信号变化时添加标记
                 if current_signal != prev_signal and current_signal != "hold":
                     markers.append(
-                        SignalMarker(
+                        SignalMarker.model_construct(
                             index=i,
-                            time=bar.timestamp.isoformat(),
+                            time=bar.timestamp,
                             type="buy" if current_signal == "buy" else "sell",
                         )
                     )
@@ -311,7 +310,7 @@ class ReplayEngineService:
         """模拟执行交易"""
         if event.event_type == "buy_trigger":
             # 计算可买数量 (使用50%资金)
-            available_cash = state.cash * Decimal("0.5")
+            available_cash = state.cash * 0.5
             quantity = int(available_cash / bar.close)
 
             if quantity > 0:
@@ -327,7 +326,7 @@ class ReplayEngineService:
                 proceeds = bar.close * state.position_quantity
                 state.cash += proceeds
                 state.position_quantity = 0
-                state.position_avg_cost = Decimal("0")
+                state.position_avg_cost = 0.0
                 state.executed_signals += 1
 
     def _update_returns(self, session: dict) -> None:
@@ -340,10 +339,10 @@ class ReplayEngineService:
             return
 
         current_bar = bars[state.current_bar_index]
-        current_price = float(current_bar.close)
+        current_price = current_bar.close
 
         # 计算策略收益
-        portfolio_value = float(state.cash) + (
+        portfolio_value = state.cash + (
             state.position_quantity * current_price
         )
         initial_value = 100000
@@ -376,7 +375,7 @@ class ReplayEngineService:
             e for e in session["events"] if e.timestamp == bar.timestamp
         ]
 
-        return ReplayTickResponse(
+        return ReplayTickResponse.model_construct(
             state=state,
             bar=bar,
             factor_snapshot=snapshot,
@@ -16,6 +16,8 @@ import pandas as pd
 import structlog
 from scipy import stats
 
+from app.schemas.risk_factor import HoldingsTable
+
 logger = structlog.get_logger()
 
 
@@ -194,21 +196,14 @@ class RiskFactorModel:
         asset_style_exposures: dict[str, dict[str, float]] | None = None,
     ) -> RiskDecomposition:
         """使用暴露数据进行风险分解 (模拟)"""
-        asset_betas = asset_betas or {}
-        asset_industries = asset_industries or {}
         asset_style_exposures = asset_style_exposures or {}
+        table = HoldingsTable.from_holdings(holdings, asset_betas, asset_industries)
 
         # 计算组合 Beta
-        portfolio_beta = sum(
-            weight * asset_betas.get(symbol, 1.0)
-            for symbol, weight in holdings.items()
-        )
+        portfolio_beta = float(table.weights @ table.betas)
 
         # 计算行业暴露
-        industry_exposures = {}
-        for symbol, weight in holdings.items():
-            industry = asset_industries.get(symbol, "information_technology")
-            industry_exposures[industry] = industry_exposures.get(industry, 0) + weight
+        industry_exposures = table.sector_totals()
 
         # 计算风格暴露 (简化: 使用模拟数据)
         style_exposures = {f: 0.0 for f in STYLE_FACTORS}
@@ -228,7 +223,7 @@ class RiskFactorModel:
         market_var = (portfolio_beta ** 2) * (0.16 ** 2)  # 市场波动约 16%
         style_var = sum(exp ** 2 * 0.02 for exp in style_exposures.values())
         industry_var = sum(exp ** 2 * 0.08 for exp in industry_exposures.values())
-        specific_var = 0.12 ** 2 * (1 - max(holdings.values()) ** 2)  # 特质风险
+        specific_var = 0.12 ** 2 * (1 - float(table.weights.max()) ** 2)  # 特质风险
 
         total_var = market_var + style_var + industry_var + specific_var
         total_risk = np.sqrt(total_var) * np.sqrt(252)
@@ -10,14 +10,15 @@ PRD 4.16.2: 信号雷达功能
 当API不可用时降级到演示数据
 """
 
+from collections import Counter
 from datetime import datetime
-from decimal import Decimal
 from typing import Optional
 from enum import Enum
 import uuid
 
 import httpx
 import structlog
+from pydantic_core import from_json
 
 from app.core.config import settings
 from app.schemas.signal_radar import (
@@ -33,6 +34,7 @@ from app.schemas.signal_radar import (
     StatusSummary,
     StatusSummaryResponse,
     SignalStatusCache,
+    build_signals,
 )
 
 logger = structlog.get_logger()
@@ -94,7 +96,8 @@ class PolygonClient:
 
                 response = await client.get(url, params=params)
                 if response.status_code == 200:
-                    return response.json()
+                    # 批量快照响应直接由 pydantic-core 从原始字节解析
+                    return from_json(response.content)
                 else:
                     logger.warning("polygon_api_error", status=response.status_code, endpoint=endpoint)
                     return None
@@ -343,11 +346,12 @@ class SignalService:
                 if search_lower in s.symbol.lower() or search_lower in s.company_name.lower()
             ]
 
-        # 统计
+        # 统计 (单次遍历计数)
+        type_counts = Counter(s.signal_type for s in signals)
         summary = {
-            "buy": sum(1 for s in signals if s.signal_type == SignalType.BUY),
-            "sell": sum(1 for s in signals if s.signal_type == SignalType.SELL),
-            "hold": sum(1 for s in signals if s.signal_type == SignalType.HOLD),
+            "buy": type_counts[SignalType.BUY.value],
+            "sell": type_counts[SignalType.SELL.value],
+            "hold": type_counts[SignalType.HOLD.value],
         }
 
         # 分页
@@ -425,7 +429,7 @@ class SignalService:
                     company_name=ticker.get("name", ""),
                     sector=ticker.get("sic_description", "Unknown"),
                     current_price=price,
-                    signal_status=SignalStatus.MONITORING,
+                    signal_status=SignalStatus.MONITORING.value,
                     signal_score=50.0,
                 ))
 
@@ -446,7 +450,7 @@ class SignalService:
                     company_name=info["name"],
                     sector=info["sector"],
                     current_price=info["price"],
-                    signal_status=SignalStatus.MONITORING,
+                    signal_status=SignalStatus.MONITORING.value,
                     signal_score=50.0,
                 ))
 
@@ -459,13 +463,15 @@ class SignalService:
         """获取信号状态分布统计"""
         signals = self._generate_mock_signals(strategy_id)
 
+        # 单次遍历计数
+        counts = Counter(s.status for s in signals)
         summary = StatusSummary(
-            holding=sum(1 for s in signals if s.status == SignalStatus.HOLDING),
-            buy_signal=sum(1 for s in signals if s.status == SignalStatus.BUY_SIGNAL),
-            sell_signal=sum(1 for s in signals if s.status == SignalStatus.SELL_SIGNAL),
-            near_trigger=sum(1 for s in signals if s.status == SignalStatus.NEAR_TRIGGER),
-            monitoring=sum(1 for s in signals if s.status == SignalStatus.MONITORING),
-            excluded=sum(1 for s in signals if s.status == SignalStatus.EXCLUDED),
+            holding=counts["holding"],
+            buy_signal=counts["buy_signal"],
+            sell_signal=counts["sell_signal"],
+            near_trigger=counts["near_trigger"],
+            monitoring=counts["monitoring"],
+            excluded=counts["excluded"],
         )
 
         return StatusSummaryResponse(
@@ -508,7 +514,7 @@ class SignalService:
         import random
         random.seed(hash(strategy_id) % 1000)
 
-        signals = []
+        rows = []
         now = datetime.now()
 
         for symbol, info in self.DEMO_STOCKS.items():
@@ -559,26 +565,29 @@ class SignalService:
                 ),
             ]
 
-            price = Decimal(str(price_value))
-
-            signals.append(Signal(
-                signal_id=str(uuid.uuid4()),
-                strategy_id=strategy_id,
-                symbol=symbol,
-                company_name=info["name"],
-                signal_type=signal_type,
-                signal_strength=strength,
-                signal_score=round(score, 1),
-                status=status,
-                triggered_factors=factors,
-                current_price=price,
-                target_price=price * Decimal("1.1") if signal_type == SignalType.BUY else None,
-                stop_loss_price=price * Decimal("0.95") if signal_type == SignalType.BUY else None,
-                expected_return_pct=10.0 if signal_type == SignalType.BUY else None,
-                signal_time=now,
-                expires_at=None,
-                is_holding=status == SignalStatus.HOLDING,
-            ))
+            price = float(price_value)
+
+            rows.append({
+                "signal_id": str(uuid.uuid4()),
+                "strategy_id": strategy_id,
+                "symbol": symbol,
+                "company_name": info["name"],
+                "signal_type": signal_type,
+                "signal_strength": strength,
+                "signal_score": round(score, 1),
+                "status": status,
+                "triggered_factors": factors,
+                "current_price": price,
+                "target_price": round(price * 1.1, 6) if signal_type == SignalType.BUY else None,
+                "stop_loss_price": round(price * 0.95, 6) if signal_type == SignalType.BUY else None,
+                "expected_return_pct": 10.0 if signal_type == SignalType.BUY else None,
+                "signal_time": now,
+                "expires_at": None,
+                "is_holding": status == SignalStatus.HOLDING,
+            })
+
+        # 整批校验构建
+        signals = build_signals(rows)
 
         # 按信号分数排序
         signals.sort(key=lambda s: s.signal_score, reverse=True)
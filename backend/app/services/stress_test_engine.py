@@ -15,6 +15,8 @@ from typing import Any
 import numpy as np
 import structlog
 
+from app.schemas.risk_factor import HoldingsTable
+
 logger = structlog.get_logger()
 
 
@@ -306,9 +308,8 @@ class StressTestEngine:
             raise ValueError(f"未知情景: {scenario_id}")
 
         scenario = self.scenarios[scenario_id]
-        return self._execute_scenario(
-            holdings, portfolio_value, scenario, asset_betas, asset_sectors
-        )
+        table = HoldingsTable.from_holdings(holdings, asset_betas, asset_sectors)
+        return self._execute_scenario(table, portfolio_value, scenario)
 
     def run_custom_scenario(
         self,
@@ -327,9 +328,8 @@ class StressTestEngine:
             "description": "用户自定义压力情景",
             "shocks": shocks,
         }
-        return self._execute_scenario(
-            holdings, portfolio_value, scenario, asset_betas, asset_sectors
-        )
+        table = HoldingsTable.from_holdings(holdings, asset_betas, asset_sectors)
+        return self._execute_scenario(table, portfolio_value, scenario)
 
     def run_all_scenarios(
         self,
@@ -343,56 +343,56 @@ class StressTestEngine:
         if scenario_ids is None:
             scenario_ids = list(self.scenarios.keys())
 
-        results = []
-        for scenario_id in scenario_ids:
-            if scenario_id in self.scenarios:
-                result = self.run_scenario(
-                    holdings, portfolio_value, scenario_id,
-                    asset_betas, asset_sectors
-                )
-                results.append(result)
-
-        return results
+        # 持仓列存表只构建一次, 各情景复用
+        table = HoldingsTable.from_holdings(holdings, asset_betas, asset_sectors)
+        return [
+            self._execute_scenario(table, portfolio_value, self.scenarios[scenario_id])
+            for scenario_id in scenario_ids
+            if scenario_id in self.scenarios
+        ]
 
     def _execute_scenario(
         self,
-        holdings: dict[str, float],
+        table: HoldingsTable,
         portfolio_value: float,
         scenario: dict,
-        asset_betas: dict[str, float] | None = None,
-        asset_sectors: dict[str, str] | None = None,
     ) -> StressTestResult:
         """执行压力测试"""
-        asset_betas = asset_betas or {}
-        asset_sectors = asset_sectors or {}
         shocks = scenario.get("shocks", {})
 
         # 计算各部分损失
-        market_loss = self._calc_market_impact(holdings, asset_betas, shocks)
-        sector_loss = self._calc_sector_impact(holdings, asset_sectors, shocks)
+        market_loss = self._calc_market_impact(table, shocks)
+        sector_loss = self._calc_sector_impact(table, shocks)
         factor_loss = self._calc_factor_impact(shocks)
 
         # 总损失
         total_loss = market_loss + sector_loss + factor_loss
         total_loss = max(-0.99, min(0.0, total_loss))
 
-        # 计算各持仓影响
-        position_impacts = []
-        for symbol, weight in holdings.items():
-            beta = asset_betas.get(symbol, 1.0)
-            sector = asset_sectors.get(symbol, "information_technology")
-
-            pos_market_loss = shocks.get("market_return", 0) * beta
-            pos_sector_loss = shocks.get("sector_shocks", {}).get(sector, 0)
-            pos_total = pos_market_loss + pos_sector_loss
-
-            position_impacts.append({
+        # 计算各持仓影响 (按列向量计算, 最后物化为行记录)
+        pos_total = (
+            shocks.get("market_return", 0) * table.betas
+            + table.sector_values(shocks.get("sector_shocks", {}))
+        )
+        pos_loss = pos_total * table.weights
+        contributions = pos_loss / total_loss if total_loss != 0 else np.zeros_like(pos_loss)
+        position_impacts = [
+            {
                 "symbol": symbol,
                 "current_weight": weight,
-                "expected_loss": pos_total * weight * portfolio_value,
-                "loss_percent": pos_total,
-                "contribution": pos_total * weight / total_loss if total_loss != 0 else 0,
-            })
+                "expected_loss": expected_loss,
+                "loss_percent": loss_percent,
+                "contribution": contribution,
+            }
+            for symbol, weight, expected_loss, loss_percent, contribution in zip(
+                table.symbols,
+                table.weights.tolist(),
+                (pos_loss * portfolio_value).tolist(),
+                pos_total.tolist(),
+                contributions.tolist(),
+                strict=True,
+            )
+        ]
 
         # 波动率冲击
         vol_mult = shocks.get("volatility_multiplier", 1.0)
@@ -432,41 +432,22 @@ class StressTestEngine:
             recommendations=recommendations,
         )
 
-    def _calc_market_impact(
-        self,
-        holdings: dict[str, float],
-        asset_betas: dict[str, float],
-        shocks: dict,
-    ) -> float:
+    def _calc_market_impact(self, table: HoldingsTable, shocks: dict) -> float:
         """计算市场冲击影响"""
         market_shock = shocks.get("market_return", 0)
         if market_shock == 0:
             return 0.0
 
-        portfolio_beta = sum(
-            weight * asset_betas.get(symbol, 1.0)
-            for symbol, weight in holdings.items()
-        )
+        portfolio_beta = float(table.weights @ table.betas)
         return market_shock * portfolio_beta
 
-    def _calc_sector_impact(
-        self,
-        holdings: dict[str, float],
-        asset_sectors: dict[str, str],
-        shocks: dict,
-    ) -> float:
+    def _calc_sector_impact(self, table: HoldingsTable, shocks: dict) -> float:
         """计算行业冲击影响"""
         sector_shocks = shocks.get("sector_shocks", {})
         if not sector_shocks:
             return 0.0
 
-        total = 0.0
-        for symbol, weight in holdings.items():
-            sector = asset_sectors.get(symbol, "information_technology")
-            shock = sector_shocks.get(sector, 0)
-            total += weight * shock
-
-        return total
+        return float(table.weights @ table.sector_values(sector_shocks))
 
     def _calc_factor_impact(self, shocks: dict) -> float:
         """计算因子冲击影响"""
@@ -521,12 +502,8 @@ class StressTestEngine:
 
         找出导致指定损失的市场条件
         """
-        asset_betas = asset_betas or {}
-
-        portfolio_beta = sum(
-            weight * asset_betas.get(symbol, 1.0)
-            for symbol, weight in holdings.items()
-        )
+        table = HoldingsTable.from_holdings(holdings, asset_betas)
+        portfolio_beta = float(table.weights @ table.betas)
 
         required_market_shock = target_loss / portfolio_beta if portfolio_beta != 0 else target_loss
         vol_shock = 1 + abs(required_market_shock) * 8
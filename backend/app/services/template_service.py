@@ -57,7 +57,7 @@ class TemplateService:
                 },
                 user_count=1523,
                 rating=4.5,
-                tags=["经典策略", "低风险", "长线投资"],
+                tags=("经典策略", "低风险", "长线投资"),
                 icon="💎",
                 created_at=datetime.now(),
                 updated_at=datetime.now(),
@@ -89,7 +89,7 @@ class TemplateService:
                 },
                 user_count=892,
                 rating=4.2,
-                tags=["趋势跟踪", "高收益", "需要盯盘"],
+                tags=("趋势跟踪", "高收益", "需要盯盘"),
                 icon="🚀",
                 created_at=datetime.now(),
                 updated_at=datetime.now(),
@@ -121,7 +121,7 @@ class TemplateService:
                 },
                 user_count=1105,
                 rating=4.6,
-                tags=["稳健收益", "现金分红", "防守型"],
+                tags=("稳健收益", "现金分红", "防守型"),
                 icon="💰",
                 created_at=datetime.now(),
                 updated_at=datetime.now(),
@@ -155,7 +155,7 @@ class TemplateService:
                 },
                 user_count=567,
                 rating=4.3,
-                tags=["量化策略", "因子投资", "专业级"],
+                tags=("量化策略", "因子投资", "专业级"),
                 icon="🔬",
                 created_at=datetime.now(),
                 updated_at=datetime.now(),
@@ -188,7 +188,7 @@ class TemplateService:
                 },
                 user_count=432,
                 rating=4.1,
-                tags=["行业ETF", "宏观择时", "高换手"],
+                tags=("行业ETF", "宏观择时", "高换手"),
                 icon="🔄",
                 created_at=datetime.now(),
                 updated_at=datetime.now(),
@@ -223,7 +223,7 @@ class TemplateService:
                 },
                 user_count=289,
                 rating=3.9,
-                tags=["高频交易", "日内平仓", "高风险高收益"],
+                tags=("高频交易", "日内平仓", "高风险高收益"),
                 icon="⚡",
                 created_at=datetime.now(),
                 updated_at=datetime.now(),
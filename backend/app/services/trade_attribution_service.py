@@ -15,10 +15,9 @@ from app.schemas.trade_attribution import (
     AttributionReport,
     AIDiagnosis,
     AttributionFactor,
-    FactorSnapshot,
-    MarketSnapshot,
     TradeSide,
     TradeOutcome,
+    build_trades,
 )
 
 
@@ -42,6 +41,7 @@ class TradeAttributionService:
         strategy_id = "demo-strategy-001"
         symbols = ["AAPL", "MSFT", "GOOGL", "NVDA", "TSLA", "AMZN", "META"]
 
+        rows = []
         for i in range(20):
             trade_id = str(uuid.uuid4())
             symbol = random.choice(symbols)
@@ -54,54 +54,56 @@ class TradeAttributionService:
             entry_time = datetime.now() - timedelta(days=random.randint(1, 30))
             exit_time = entry_time + timedelta(days=random.randint(1, 5))
 
-            trade = TradeRecord(
-                trade_id=trade_id,
-                strategy_id=strategy_id,
-                strategy_name="动量突破策略",
-                deployment_id="deploy-001",
-                symbol=symbol,
-                side=side,
-                quantity=random.randint(10, 100),
-                entry_price=round(entry_price, 2),
-                entry_time=entry_time,
-                exit_price=round(exit_price, 2),
-                exit_time=exit_time,
-                pnl=round(pnl, 2),
-                pnl_pct=round(pnl_pct, 4),
-                outcome=TradeOutcome.WIN if pnl > 0 else TradeOutcome.LOSS,
-                factor_snapshot=[
-                    FactorSnapshot(
-                        factor_id="MOMENTUM_3M",
-                        factor_name="3个月动量",
-                        factor_value=random.uniform(-0.2, 0.3),
-                        factor_rank=random.uniform(0.1, 0.9),
-                        signal_contribution=random.uniform(0.2, 0.5),
-                    ),
-                    FactorSnapshot(
-                        factor_id="ROE",
-                        factor_name="净资产收益率",
-                        factor_value=random.uniform(0.05, 0.25),
-                        factor_rank=random.uniform(0.3, 0.8),
-                        signal_contribution=random.uniform(0.1, 0.3),
-                    ),
+            rows.append({
+                "trade_id": trade_id,
+                "strategy_id": strategy_id,
+                "strategy_name": "动量突破策略",
+                "deployment_id": "deploy-001",
+                "symbol": symbol,
+                "side": side,
+                "quantity": random.randint(10, 100),
+                "entry_price": round(entry_price, 2),
+                "entry_time": entry_time,
+                "exit_price": round(exit_price, 2),
+                "exit_time": exit_time,
+                "pnl": round(pnl, 2),
+                "pnl_pct": round(pnl_pct, 4),
+                "outcome": TradeOutcome.WIN if pnl > 0 else TradeOutcome.LOSS,
+                "factor_snapshot": [
+                    {
+                        "factor_id": "MOMENTUM_3M",
+                        "factor_name": "3个月动量",
+                        "factor_value": random.uniform(-0.2, 0.3),
+                        "factor_rank": random.uniform(0.1, 0.9),
+                        "signal_contribution": random.uniform(0.2, 0.5),
+                    },
+                    {
+                        "factor_id": "ROE",
+                        "factor_name": "净资产收益率",
+                        "factor_value": random.uniform(0.05, 0.25),
+                        "factor_rank": random.uniform(0.3, 0.8),
+                        "signal_contribution": random.uniform(0.1, 0.3),
+                    },
                 ],
-                market_snapshot=MarketSnapshot(
-                    market_index=random.uniform(4800, 5200),
-                    market_change_1d=random.uniform(-0.02, 0.02),
-                    market_change_5d=random.uniform(-0.05, 0.05),
-                    vix=random.uniform(15, 30),
-                    sector_rank=random.randint(1, 10),
-                    market_sentiment=random.choice(["bullish", "neutral", "bearish"]),
-                ),
-                hold_days=random.randint(1, 10),
-                created_at=entry_time,
-                updated_at=exit_time,
-            )
-
-            self._trades[trade_id] = trade
+                "market_snapshot": {
+                    "market_index": random.uniform(4800, 5200),
+                    "market_change_1d": random.uniform(-0.02, 0.02),
+                    "market_change_5d": random.uniform(-0.05, 0.05),
+                    "vix": random.uniform(15, 30),
+                    "sector_rank": random.randint(1, 10),
+                    "market_sentiment": random.choice(["bullish", "neutral", "bearish"]),
+                },
+                "hold_days": random.randint(1, 10),
+                "created_at": entry_time,
+                "updated_at": exit_time,
+            })
+
+        # 整批校验构建, 避免逐条实例化嵌套快照模型
+        for trade in build_trades(rows):
+            self._trades[trade.trade_id] = trade
             if strategy_id not in self._strategy_trades:
                 self._strategy_trades[strategy_id] = []
-            self._strategy_trades[strategy_id].append(trade_id)
+            self._strategy_trades[strategy_id].append(trade.trade_id)
 
     async def get_trades(
         self,
@@ -5,7 +5,9 @@ Pytest 配置和 Fixtures
 """
 
 import asyncio
+from collections.abc import Callable
 from datetime import datetime, timedelta
+from decimal import Decimal
 from typing import AsyncGenerator, Generator
 
 import numpy as np
@@ -16,6 +18,10 @@ from fastapi.testclient import TestClient
 from httpx import AsyncClient
 
 from app.main import app
+from app.schemas.conflict import ConflictingSignal
+from app.schemas.deployment import CapitalConfig, DeploymentConfig
+from app.schemas.market_data import OHLCVBar
+from app.services.manual_trade_service import ManualTradeService
 
 
 # ============================================================
@@ -117,6 +123,21 @@ def sample_returns_df() -> pd.DataFrame:
     return pd.DataFrame(data, index=dates)
 
 
+@pytest.fixture
+def make_bar() -> Callable[..., OHLCVBar]:
+    """K线工厂: make_bar(symbol, day, **prices), 默认价格满足 OHLC 不变量"""
+    def _make(symbol: str, day: int, **prices: float) -> OHLCVBar:
+        values = {"open": 100.0, "high": 102.0, "low": 99.0, "close": 101.0, **prices}
+        return OHLCVBar(
+            symbol=symbol,
+            timestamp=datetime(2024, 1, day),
+            volume=1_000.0,
+            **values,
+        )
+
+    return _make
+
+
 # ============================================================
 # 策略配置 Fixtures
 # ============================================================
@@ -171,6 +192,58 @@ def sample_backtest_config() -> dict:
     }
 
 
+@pytest.fixture
+def deployment_config(request: pytest.FixtureRequest) -> DeploymentConfig:
+    """部署配置, 总资金由间接参数化传入"""
+    return DeploymentConfig(
+        strategy_id="strategy_001",
+        deployment_name="测试部署",
+        capital_config=CapitalConfig(total_capital=Decimal(request.param)),
+    )
+
+
+# ============================================================
+# 策略冲突 Fixtures
+# ============================================================
+
+@pytest.fixture
+def conflicting_signals() -> list[ConflictingSignal]:
+    """同一股票上方向相反的两条信号 (test_a 买入, test_b 卖出)"""
+    return [
+        ConflictingSignal(
+            strategy_id=strategy_id,
+            strategy_name=f"策略 {strategy_id}",
+            signal_id=f"sig_{strategy_id}_{direction}",
+            symbol="AAPL",
+            direction=direction,
+            quantity=100,
+            price=150.0,
+            signal_time=datetime(2024, 1, 2, 10, 0),
+            signal_strength=0.8,
+            confidence=0.7,
+        )
+        for strategy_id, direction in (("test_a", "buy"), ("test_b", "sell"))
+    ]
+
+
+# ============================================================
+# 交易 Fixtures
+# ============================================================
+
+@pytest.fixture
+def order_payload() -> dict:
+    """下单请求体公共字段 (不含订单类型与价格)"""
+    return {"symbol": "AAPL", "side": "buy", "quantity": 10}
+
+
+@pytest.fixture
+def manual_trade_service() -> ManualTradeService:
+    """订单簿为空的手动交易服务 (不与其他测试共享订单)"""
+    service = ManualTradeService()
+    service._orders = {}
+    return service
+
+
 # ============================================================
 # 辅助函数
 # ============================================================
@@ -176,6 +176,61 @@ class TestRiskAPI:
         assert response.status_code in [200, 503]
 
 
+class TestManualTradeAPI:
+    """手动交易 API 测试"""
+
+    def test_place_order(self, client: TestClient):
+        """测试合法下单请求"""
+        response = client.post(
+            "/api/v1/manual-trade/order",
+            json={"symbol": "AAPL", "side": "buy", "quantity": 10},
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] is True
+        assert data["order"]["symbol"] == "AAPL"
+
+    def test_place_order_invalid_fields(self, client: TestClient):
+        """测试非法字段逐项返回 422, loc 以 body 开头"""
+        response = client.post(
+            "/api/v1/manual-trade/order",
+            json={"symbol": "AAPL", "side": "hold", "quantity": 0},
+        )
+        assert response.status_code == 422
+        locs = [error["loc"] for error in response.json()["detail"]]
+        assert locs == [["body", "side"], ["body", "quantity"]]
+
+    def test_place_order_malformed_json(self, client: TestClient):
+        """测试格式错误的 JSON 返回 422 而非 500"""
+        response = client.post(
+            "/api/v1/manual-trade/order",
+            content=b'{"symbol":',
+            headers={"Content-Type": "application/json"},
+        )
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["type"] == "json_invalid"
+
+    def test_list_orders_by_status(self, client: TestClient):
+        """测试按状态过滤订单列表"""
+        client.post(
+            "/api/v1/manual-trade/order",
+            json={"symbol": "AAPL", "side": "buy", "quantity": 10},
+        )
+        response = client.get("/api/v1/manual-trade/orders", params={"status": "filled"})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] >= 1
+        assert {order["status"] for order in data["orders"]} == {"filled"}
+
+    def test_place_order_schema_published(self):
+        """测试下单请求体 schema 出现在 OpenAPI 中"""
+        schema = app.openapi()
+        body = schema["paths"]["/api/v1/manual-trade/order"]["post"]["requestBody"]
+        ref = body["content"]["application/json"]["schema"]["$ref"]
+        assert ref == "#/components/schemas/PlaceOrderRequest"
+        assert "PlaceOrderRequest" in schema["components"]["schemas"]
+
+
 class TestWebSocketStats:
     """WebSocket 统计 API 测试"""
 
@@ -0,0 +1,44 @@
+"""
+策略冲突检测测试
+
+测试冲突检测结果的分级计数
+"""
+
+from datetime import datetime
+
+from app.schemas.conflict import ConflictCheckResult, ConflictSeverity, ConflictType
+from app.services.conflict_service import ConflictService
+
+
+class TestConflictCheckResult:
+    """冲突检测结果计数测试"""
+
+    async def test_counts_match_conflicts(self, conflicting_signals):
+        """总数及各级计数与冲突列表一致, 并出现在响应中"""
+        service = ConflictService()
+        buy, sell = conflicting_signals
+        for conflict_type in (
+            ConflictType.LOGIC,
+            ConflictType.EXECUTION,
+            ConflictType.TIMEOUT,
+            ConflictType.DUPLICATE,
+            ConflictType.DUPLICATE,
+        ):
+            await service.create_conflict(conflict_type, buy, sell)
+
+        result = await service.check_conflicts(["test_a", "test_b"])
+
+        assert result.total_conflicts == len(result.conflicts) == 5
+        assert (result.critical_count, result.warning_count, result.info_count) == (1, 2, 2)
+        assert result.conflicts[0].severity == ConflictSeverity.CRITICAL
+
+        data = result.model_dump(mode="json")
+        assert data["total_conflicts"] == 5
+        assert (data["critical_count"], data["warning_count"], data["info_count"]) == (1, 2, 2)
+
+    def test_empty_result(self):
+        """无冲突时各项计数为 0"""
+        result = ConflictCheckResult(conflicts=[], checked_at=datetime(2024, 1, 2))
+
+        assert result.total_conflicts == 0
+        assert (result.critical_count, result.warning_count, result.info_count) == (0, 0, 0)
@@ -0,0 +1,28 @@
+"""
+策略部署测试
+
+测试部署配置的资金校验
+"""
+
+import pytest
+
+from app.services.deployment_service import DeploymentService
+
+
+class TestCapitalValidation:
+    """最低资金校验测试"""
+
+    @pytest.mark.parametrize(
+        "deployment_config", ["999.99", "999.995", "999.999"], indirect=True
+    )
+    async def test_below_minimum_rejected(self, deployment_config):
+        """低于最低资金 (含四舍五入后等于下限的金额) 被拒绝"""
+        with pytest.raises(ValueError, match="资金不足"):
+            await DeploymentService()._validate_config(deployment_config)
+
+    @pytest.mark.parametrize(
+        "deployment_config", ["1000", "1000.001", "50000"], indirect=True
+    )
+    async def test_minimum_and_above_accepted(self, deployment_config):
+        """达到最低资金的配置通过校验"""
+        await DeploymentService()._validate_config(deployment_config)
@@ -0,0 +1,55 @@
+"""
+手动交易服务测试
+
+测试订单状态过滤与撤单
+"""
+
+import pytest
+
+from app.schemas.manual_trade import PlaceOrderRequest
+from app.services.manual_trade_service import ManualTradeService
+
+USER_ID = "user_001"
+ACCOUNT_ID = "account_001"
+
+
+class TestOrderStatus:
+    """订单状态测试"""
+
+    @pytest.fixture
+    async def orders(self, manual_trade_service: ManualTradeService) -> dict[str, str]:
+        """一笔已成交的市价单和一笔待成交的限价单, 返回 状态 -> 订单ID"""
+        placed = {}
+        for request in (
+            PlaceOrderRequest(symbol="AAPL", side="buy", quantity=10),
+            PlaceOrderRequest(
+                symbol="MSFT", side="buy", order_type="limit", quantity=5, limit_price=1.0
+            ),
+        ):
+            result = await manual_trade_service.place_order(USER_ID, ACCOUNT_ID, request)
+            assert result.success, result.error
+            placed[result.order.status] = result.order.order_id
+        return placed
+
+    @pytest.mark.parametrize("status", ["filled", "pending"])
+    async def test_filter_by_status(self, manual_trade_service, orders, status):
+        """按状态过滤订单"""
+        result, total = await manual_trade_service.get_orders(USER_ID, status=status)
+
+        assert total == 1
+        assert [o.order_id for o in result] == [orders[status]]
+
+    async def test_cancel_pending_order(self, manual_trade_service, orders):
+        """待成交订单可以取消"""
+        result = await manual_trade_service.cancel_order(orders["pending"], USER_ID)
+
+        assert result.success
+        order = await manual_trade_service.get_order(orders["pending"])
+        assert order.status == "cancelled"
+
+    async def test_cancel_filled_order_rejected(self, manual_trade_service, orders):
+        """已成交订单不能取消, 返回当前状态"""
+        result = await manual_trade_service.cancel_order(orders["filled"], USER_ID)
+
+        assert not result.success
+        assert result.message == "订单状态为 filled，无法取消"
@@ -0,0 +1,110 @@
+"""
+市场数据测试
+
+测试K线校验与日内因子响应
+"""
+
+from datetime import datetime
+
+from fastapi.testclient import TestClient
+
+from app.schemas.market_data import (
+    FACTOR_ORDER,
+    DataFrequency,
+    DataSource,
+    IntradayFactorSnapshot,
+    IntradayFactorsResponse,
+    OHLCVBar,
+)
+from app.services.data_source import DataSourceManager, data_source_manager
+
+
+class _StubSource:
+    """按 symbol 返回固定K线的数据源"""
+
+    def __init__(self, bars: dict[str, list[OHLCVBar]]):
+        self.bars = bars
+
+    async def get_bars(self, symbol, frequency, start_date, end_date, adjusted=True):
+        return self.bars[symbol]
+
+
+class TestDataSourceManagerBars:
+    """K线获取校验测试"""
+
+    async def test_invalid_bars_are_dropped(self, make_bar):
+        """OHLC 不一致或含 NaN 的K线被丢弃, 其余K线正常返回"""
+        good = make_bar("AAPL", 2)
+        manager = DataSourceManager()
+        manager._sources = {DataSource.ALPACA: _StubSource({"AAPL": [
+            good,
+            make_bar("AAPL", 3, high=98.0),
+            make_bar("AAPL", 4, close=float("nan")),
+        ]})}
+
+        bars = await manager.get_bars(
+            "AAPL", DataFrequency.DAY_1, "2024-01-01", "2024-01-31",
+            source=DataSource.ALPACA,
+        )
+
+        assert bars == [good]
+
+
+class TestHistoricalDataAPI:
+    """历史数据 API 测试"""
+
+    def test_bad_bar_does_not_fail_request(self, client: TestClient, monkeypatch, make_bar):
+        """单个 symbol 的坏K线不会让多 symbol 请求返回 500"""
+        monkeypatch.setattr(data_source_manager, "_sources", {DataSource.ALPACA: _StubSource({
+            "AAPL": [make_bar("AAPL", 2), make_bar("AAPL", 3, low=103.0)],
+            "MSFT": [make_bar("MSFT", 2)],
+        })})
+
+        response = client.post("/api/v1/market-data/historical", json={
+            "symbols": ["AAPL", "MSFT"],
+            "start_date": "2024-01-01",
+            "end_date": "2024-01-31",
+            "data_source": "alpaca",
+        })
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["symbol"] for item in data] == ["AAPL", "MSFT"]
+        assert [item["total_count"] for item in data] == [1, 1]
+
+    def test_reversed_date_range_rejected(self, client: TestClient, monkeypatch):
+        """起始日期晚于结束日期时在校验阶段返回 422, 不请求数据源"""
+        monkeypatch.setattr(data_source_manager, "_sources", {})
+
+        response = client.post("/api/v1/market-data/historical", json={
+            "symbols": ["AAPL"],
+            "start_date": "2024-02-01",
+            "end_date": "2024-01-01",
+        })
+
+        assert response.status_code == 422
+        error = response.json()["detail"][0]
+        assert error["loc"] == ["body"]
+        assert "开始日期不能大于结束日期" in error["msg"]
+
+
+class TestIntradayFactorsResponse:
+    """日内因子响应测试"""
+
+    def test_response_keeps_snapshots(self):
+        """批量/最新因子响应按股票返回因子快照列表"""
+        timestamp = datetime(2024, 1, 2, 10, 30)
+        snapshots = [
+            IntradayFactorSnapshot(symbol=symbol, timestamp=timestamp, factors={"rsi": 55.0})
+            for symbol in ("AAPL", "MSFT")
+        ]
+
+        data = IntradayFactorsResponse(
+            snapshots=snapshots,
+            timestamp=timestamp,
+            factors_calculated=list(FACTOR_ORDER),
+        ).model_dump(mode="json")
+
+        assert [s["symbol"] for s in data["snapshots"]] == ["AAPL", "MSFT"]
+        assert data["snapshots"][0]["factors"] == {"rsi": 55.0}
+        assert "matrix" not in data
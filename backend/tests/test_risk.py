@@ -0,0 +1,89 @@
+"""
+风险模块测试
+
+测试 VaR 计算器及组合 VaR 分解
+"""
+
+import numpy as np
+import pytest
+
+from app.risk.var_calculator import PortfolioVaR, VaRCalculator, VaRMethod
+
+
+class TestHistoricalVaR:
+    """历史模拟法 VaR 测试"""
+
+    @pytest.mark.parametrize("confidence_level", [0.9, 0.95, 0.99])
+    def test_matches_percentile(self, sample_returns, confidence_level):
+        """VaR 与 np.percentile 线性插值一致, CVaR 为阈值以下的尾部均值"""
+        result = VaRCalculator(confidence_level=confidence_level).calculate(sample_returns)
+
+        threshold = np.percentile(sample_returns.values, (1 - confidence_level) * 100)
+        tail = sample_returns.values[sample_returns.values <= threshold]
+        assert result.var == pytest.approx(-threshold)
+        assert result.cvar == pytest.approx(-tail.mean())
+
+    def test_calculate_many_matches_calculate(self, sample_returns):
+        """多置信水平结果与逐个计算一致, 顺序与输入一致"""
+        levels = [0.99, 0.9, 0.95]
+        results = VaRCalculator(horizon_days=5).calculate_many(
+            sample_returns, levels, portfolio_value=1e6
+        )
+
+        assert [r.confidence_level for r in results] == levels
+        for level, result in zip(levels, results, strict=True):
+            expected = VaRCalculator(confidence_level=level, horizon_days=5).calculate(
+                sample_returns, method=VaRMethod.HISTORICAL, portfolio_value=1e6
+            )
+            assert result.var == pytest.approx(expected.var)
+            assert result.cvar == pytest.approx(expected.cvar)
+            assert result.var_pct == pytest.approx(expected.var_pct)
+
+    def test_calculate_many_rejects_invalid_level(self, sample_returns):
+        """非法置信水平被拒绝"""
+        with pytest.raises(ValueError, match="置信水平"):
+            VaRCalculator().calculate_many(sample_returns, [0.95, 1.0])
+
+    def test_sorted_returns_reused_and_bounded(self, sample_returns):
+        """相同输入复用已排序数组, 缓存容量有上限"""
+        calculator = VaRCalculator()
+        first = calculator._sorted_returns(sample_returns)
+        assert calculator._sorted_returns(sample_returns.copy()) is first
+
+        for i in range(VaRCalculator._SORTED_CACHE_SIZE + 3):
+            calculator.calculate(sample_returns + i * 1e-4)
+        assert len(calculator._sorted_cache) == VaRCalculator._SORTED_CACHE_SIZE
+
+
+class TestIncrementalVaR:
+    """增量 VaR 测试"""
+
+    @pytest.fixture
+    def portfolio(self, sample_returns_df) -> PortfolioVaR:
+        """非等权的五资产组合"""
+        return PortfolioVaR(sample_returns_df, np.array([0.3, 0.25, 0.2, 0.15, 0.1]))
+
+    @staticmethod
+    def _recomputed(portfolio: PortfolioVaR, asset_idx: int, delta: float) -> float:
+        """逐资产扰动权重并重算二次型 (解析解的对照)"""
+        new_weights = portfolio.weights.copy()
+        new_weights[asset_idx] += delta
+        new_weights /= new_weights.sum()
+        new_std = np.sqrt(new_weights @ portfolio.cov_matrix.values @ new_weights)
+        base_var = portfolio.calculate_portfolio_var()["portfolio_var"]
+        return float(-portfolio._z * new_std - base_var)
+
+    @pytest.mark.parametrize("delta", [0.01, 0.05, -0.02])
+    def test_closed_form_matches_recomputation(self, portfolio, delta):
+        """解析解与逐资产重算结果一致"""
+        result = portfolio.calculate_incremental_var_all(delta)
+        expected = [self._recomputed(portfolio, i, delta) for i in range(len(portfolio.weights))]
+
+        assert result.shape == portfolio.weights.shape
+        np.testing.assert_allclose(result, expected, rtol=1e-10, atol=1e-14)
+
+    def test_single_asset_matches_all(self, portfolio):
+        """单资产接口与批量结果一致"""
+        all_assets = portfolio.calculate_incremental_var_all(0.02)
+        for i in range(len(portfolio.weights)):
+            assert portfolio.calculate_incremental_var(i, 0.02) == pytest.approx(all_assets[i])
@@ -0,0 +1,31 @@
+"""
+通用 Schema 测试
+
+测试请求模型的跨字段校验
+"""
+
+from datetime import date
+
+import pytest
+from pydantic import ValidationError
+
+from app.schemas.common import DateRangeRequest
+
+
+class TestDateRangeRequest:
+    """日期范围请求测试"""
+
+    @pytest.mark.parametrize(
+        ("start_date", "end_date"),
+        [("2024-01-01", "2024-01-31"), ("2024-01-01", "2024-01-01")],
+    )
+    def test_valid_range_accepted(self, start_date: str, end_date: str):
+        """起始日期不晚于结束日期时通过校验"""
+        request = DateRangeRequest(start_date=start_date, end_date=end_date)
+        assert request.start_date == date.fromisoformat(start_date)
+        assert request.validate_range() is request
+
+    def test_reversed_range_rejected(self):
+        """起始日期晚于结束日期时构建即被拒绝, 无需显式调用 validate_range"""
+        with pytest.raises(ValidationError, match="开始日期不能大于结束日期"):
+            DateRangeRequest(start_date="2024-02-01", end_date="2024-01-01")
@@ -0,0 +1,55 @@
+"""
+交易 Schema 测试
+
+测试下单请求按订单类型校验价格
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from app.schemas.trading import CreateOrderRequest
+
+
+class TestCreateOrderPrices:
+    """下单价格校验测试"""
+
+    @pytest.mark.parametrize(
+        ("order_type", "prices"),
+        [
+            ("market", {}),
+            ("market", {"limit_price": 150.0, "stop_price": 140.0}),
+            ("limit", {"limit_price": 150.0}),
+            ("stop", {"stop_price": 140.0}),
+            ("stop_limit", {"limit_price": 150.0, "stop_price": 140.0}),
+        ],
+    )
+    def test_required_prices_supplied(
+        self, order_payload: dict, order_type: str, prices: dict[str, float]
+    ):
+        """所需价格齐全时通过校验"""
+        order = CreateOrderRequest.model_validate(
+            {**order_payload, "order_type": order_type, **prices}
+        )
+        assert order.order_type.value == order_type
+        assert order.limit_price == prices.get("limit_price")
+        assert order.stop_price == prices.get("stop_price")
+
+    @pytest.mark.parametrize(
+        ("order_type", "prices", "message"),
+        [
+            ("limit", {}, "限价单必须指定限价"),
+            ("limit", {"limit_price": None}, "限价单必须指定限价"),
+            ("limit", {"stop_price": 140.0}, "限价单必须指定限价"),
+            ("stop", {}, "止损单必须指定止损价"),
+            ("stop", {"stop_price": None}, "止损单必须指定止损价"),
+            ("stop_limit", {"limit_price": 150.0}, "止损单必须指定止损价"),
+        ],
+    )
+    def test_required_price_missing(
+        self, order_payload: dict, order_type: str, prices: dict, message: str
+    ):
+        """所需价格未传或为 null 时均被拒绝"""
+        with pytest.raises(ValidationError, match=message):
+            CreateOrderRequest.model_validate(
+                {**order_payload, "order_type": order_type, **prices}
+            )